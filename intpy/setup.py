@@ -18,8 +18,12 @@
 # MA 02110-1301, USA.
 
 
-from distutils.core import Extension
-from distutils.core import setup
+try:
+    from setuptools import Extension
+    from setuptools import setup
+except ImportError:
+    from distutils.core import Extension
+    from distutils.core import setup
 
 
 _package_description = """Interval Arithmetic package
@@ -46,9 +50,9 @@ For more information about it, see:
 [3] Kulisch, U. W., Miranker, W. L., Computer Arithmetic in Theory and
     Practice. Academic Press, 1981.
 
-Currently only Real Intervals are available. No Complex Intervals, no Interval
-Vectors and Matrixes, and no extensions of basic functions. These will be our
-next work.
+Currently Real Intervals and rectangular Complex Intervals are available, as
+well as arrays of them. No Interval Matrixes and no extensions of basic
+functions. These will be our next work.
 
 It was developed in CIn/UFPE (Brazil) by Rafael Menezes Barreto
 <rmb3@cin.ufpe.br, rafaelbarreto87@gmail.com> and it's free software.
@@ -72,6 +76,7 @@ if __name__ == "__main__":
         packages=[
             "intpy",
             "intpy.ireal",
+            "intpy.icomplex",
             "intpy.support"
         ],
         package_dir={
@@ -81,15 +86,14 @@ if __name__ == "__main__":
         ext_modules=[
             Extension("rounding", ["src/support/roundingmodule.c"])
         ],
-        requires=[
-            "fpconst"
-        ],
         classifiers=[
             "Development Status :: 4 - Beta",
             "Intended Audience :: Science/Research",
             "License :: OSI Approved :: GNU General Public License (GPL)",
             "Operating System :: Microsoft :: Windows",
             "Operating System :: POSIX :: Linux",
+            "Programming Language :: Python :: 2",
+            "Programming Language :: Python :: 3",
             "Topic :: Scientific/Engineering :: Mathematics"
         ]
     )
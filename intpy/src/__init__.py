@@ -42,9 +42,9 @@ For more information about it, see:
 [3] Kulisch, U. W., Miranker, W. L., Computer Arithmetic in Theory and
     Practice. Academic Press, 1981.
 
-Currently only Real Intervals are available. No Complex Intervals, no Interval
-Vectors and Matrixes, and no extensions of basic functions. These will be our
-next work.
+Currently Real Intervals and rectangular Complex Intervals are available, as
+well as arrays of them. No Interval Matrixes and no extensions of basic
+functions. These will be our next work.
 
 It was developed in CIn/UFPE (Brazil) by Rafael Menezes Barreto
 <rmb3@cin.ufpe.br, rafaelbarreto87@gmail.com> and it's free software.
@@ -53,6 +53,13 @@ It was developed in CIn/UFPE (Brazil) by Rafael Menezes Barreto
 
 from intpy.errors import *
 from intpy.ireal import *
+from intpy.icomplex import *
+from intpy.enclosure import *
+from intpy.quadrature import *
+from intpy.poly import *
+from intpy.eigen import *
+from intpy.persist import *
+from intpy.lazy import *
 
 
 def _test():
@@ -0,0 +1,286 @@
+# aio.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Asynchronous batch evaluation module
+
+Provides a service evaluating a function on intervals for asyncio programs.
+The requests are queued and grouped in batches, each batch is evaluated at
+once on IRealArrays by a pool of executors, and every request gets an asyncio
+future with its own result. The event loop is never blocked by the interval
+computations.
+
+The rounding mode of the FPU belongs to each thread, so the workers of the
+pool start from rounding to nearest and every batch restores the mode it
+found when it ends.
+
+This module needs asyncio and concurrent.futures, besides coroutines defined
+by async def, i.e. Python 3.5 or newer, so it isn't imported by the package.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from intpy.errors import EmptyIntervalError
+from intpy.ireal import IReal
+from intpy.ireal import IRealArray
+from intpy.support import rounding
+
+
+__all__ = [
+    "BatchEvaluator",
+    "InlineExecutor"
+]
+
+
+def _running_loop():
+    """Returns the running event loop, before asyncio.get_running_loop too"""
+    get_running_loop = getattr(asyncio, "get_running_loop", None)
+    if get_running_loop is None:
+        return asyncio.get_event_loop()
+    return get_running_loop()
+
+
+def _initialize_worker():
+    """Puts the rounding mode of a new worker to the nearest"""
+    rounding.set_mode(0)
+
+
+def _run_batch(f, columns, vectorized):
+    """Evaluates a batch in a worker, returning the list of the results
+
+    Some examples:
+
+    >>> columns = [IRealArray([1, 2]), IRealArray([3, 4])]
+    >>> _run_batch(lambda x, y: x + y, columns, True)
+    [[4.0, 4.0], [6.0, 6.0]]
+    >>> _run_batch(lambda x, y: x * y, columns, False)
+    [[3.0, 3.0], [8.0, 8.0]]
+    """
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(0)
+    try:
+        if vectorized:
+            return list(f(*columns))
+        return [f(*args) for args in zip(*columns)]
+    finally:
+        rounding.set_mode(rounding_mode_backup)
+
+
+class InlineExecutor(object):
+    """An executor running the jobs at once in the calling thread
+
+    It stands for a pool of executors in tests, making the evaluations
+    deterministic.
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+class BatchEvaluator(object):
+    """Evaluates a function on intervals in batches, off the event loop
+
+    The function 'f' gets IRealArrays, one per argument, and returns an
+    IRealArray with the results of all the requests of a batch; if
+    'vectorized' is false, it's called with IReals for each request instead,
+    still in the executor. A batch is dispatched when it gets 'batch_size'
+    requests or when its first request waited 'latency' seconds. At most
+    'max_pending' requests are admitted at a time, and the producers of the
+    others wait in evaluate() until they enter. The default executor is a
+    pool of 'workers' threads, and any concurrent.futures executor can be
+    given instead, e.g. a ProcessPoolExecutor for a picklable 'f'. The
+    service works in the event loop running its first request. Some
+    examples:
+
+    >>> loop = asyncio.new_event_loop()
+    >>> service = BatchEvaluator(lambda x, y: x * y + 1, batch_size=4,
+    ...     executor=InlineExecutor())
+    >>> async def produce():
+    ...     return await asyncio.gather(*[service.evaluate(IReal(i),
+    ...         IReal(-1, 1)) for i in range(6)])
+    >>> loop.run_until_complete(produce())[-2:]
+    [[-3.0, 5.0], [-4.0, 6.0]]
+    >>> service.batches, service.requests, service.pending
+    (2, 6, 0)
+    >>> service.close(); loop.close()
+    """
+
+    def __init__(self, f, batch_size=256, latency=0.005, max_pending=4096,
+        workers=2, executor=None, vectorized=True):
+        if batch_size < 1 or max_pending < batch_size:
+            raise ValueError("the batch size must be positive and at most "
+                "the number of pending requests")
+        self._f = f
+        self._batch_size = batch_size
+        self._latency = latency
+        self._max_pending = max_pending
+        self._vectorized = vectorized
+        self._loop = None
+        self._slots = None
+        self._own_executor = executor is None
+        if executor is None:
+            try:
+                executor = ThreadPoolExecutor(workers,
+                    initializer=_initialize_worker)
+            except TypeError:
+                executor = ThreadPoolExecutor(workers)
+        self._executor = executor
+        self._batch = []
+        self._timer = None
+        self.pending = 0
+        self.requests = 0
+        self.batches = 0
+
+    async def evaluate(self, *args):
+        """Evaluates the function on the arguments in a batch
+
+        The arguments are anything accepted by the IReal constructor, and
+        they're checked at once, so a bad request fails alone. It waits for
+        the request to be admitted, then for its result. Some examples:
+
+        >>> loop = asyncio.new_event_loop()
+        >>> service = BatchEvaluator(lambda x: x + 1, batch_size=2,
+        ...     max_pending=2, executor=InlineExecutor())
+        >>> async def produce():
+        ...     requests = [asyncio.ensure_future(service.evaluate(IReal(i)))
+        ...         for i in range(5)]
+        ...     await asyncio.sleep(0)
+        ...     return service.pending, await asyncio.gather(*requests)
+        >>> loop.run_until_complete(produce())
+        (2, [[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [4.0, 4.0], [5.0, 5.0]])
+        >>> service.close(); loop.close()
+
+        >>> loop = asyncio.new_event_loop()
+        >>> service = BatchEvaluator(lambda x: x + 1, batch_size=4,
+        ...     executor=InlineExecutor())
+        >>> async def produce():
+        ...     return await asyncio.gather(*[service.evaluate(x) for x in
+        ...         (IReal(1), 2, IReal())], return_exceptions=True)
+        >>> results = loop.run_until_complete(produce())
+        >>> results[:2], type(results[2]).__name__, service.pending
+        ([[2.0, 2.0], [3.0, 3.0]], 'EmptyIntervalError', 0)
+        >>> service._f = lambda x: x[:1]
+        >>> results = loop.run_until_complete(produce())
+        >>> [type(x).__name__ for x in results], service.pending
+        (['ValueError', 'ValueError', 'EmptyIntervalError'], 0)
+        >>> service.close(); loop.close()
+        """
+        args = tuple([x if type(x) == IReal else IReal(x) for x in args])
+        for x in args:
+            if x.empty:
+                raise EmptyIntervalError("arrays can't hold empty intervals")
+        if self._loop is None:
+            self._loop = _running_loop()
+            self._slots = asyncio.Semaphore(self._max_pending)
+        await self._slots.acquire()
+        future = self._loop.create_future()
+        self.pending += 1
+        self.requests += 1
+        self._batch.append((args, future))
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self._latency, self._flush)
+        return await future
+
+    def _flush(self):
+        """Sends the current batch to the executor"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        self.batches += 1
+        try:
+            columns = [IRealArray(column) for column in zip(*[args for args,
+                future in batch])]
+            job = self._loop.run_in_executor(self._executor, _run_batch,
+                self._f, columns, self._vectorized)
+        except Exception as error:
+            self._release(batch, None, error)
+            return
+        job.add_done_callback(lambda job: self._deliver(batch, job))
+
+    def _deliver(self, batch, job):
+        """Gives the results of a finished batch to its requests"""
+        error = job.exception()
+        results = None
+        if error is None:
+            results = job.result()
+            if len(results) != len(batch):
+                results, error = None, ValueError("the function gave %d "
+                    "results for a batch of %d requests" % (len(results),
+                    len(batch)))
+        self._release(batch, results, error)
+
+    def _release(self, batch, results, error):
+        """Sets the results or the error of a batch and frees its slots"""
+        self.pending -= len(batch)
+        for i, (args, future) in enumerate(batch):
+            self._slots.release()
+            if future.cancelled():
+                continue
+            if error is None:
+                future.set_result(results[i])
+            else:
+                future.set_exception(error)
+
+    def close(self):
+        """Dispatches the queued requests and releases the executor"""
+        self._flush()
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
+
+
+async def _produce(service, values):
+    """Requests the evaluations of all the values and waits for them"""
+    return await asyncio.gather(*[service.evaluate(*args) for args in
+        values])
+
+
+def _benchmark(n=20000, batch_sizes=(1, 16, 256)):
+    """Reports the throughput of the service for some batch sizes"""
+    from time import time
+    from intpy.ireal import IReal
+    f = lambda x, y: x * y + x
+    values = [(IReal(i, i + 1), IReal(-1, 2)) for i in range(n)]
+    for batch_size in batch_sizes:
+        loop = asyncio.new_event_loop()
+        service = BatchEvaluator(f, batch_size=batch_size)
+        start = time()
+        loop.run_until_complete(_produce(service, values))
+        elapsed = time() - start
+        service.close()
+        loop.close()
+        print("batch size %4d %8.3f s %10.0f requests/s" % (batch_size,
+            elapsed, n / elapsed))
@@ -0,0 +1,400 @@
+# differential.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Differential testing module
+
+It checks the interval evaluations against an exact reference. Expressions
+are evaluated over intervals whose limits are given as decimal strings, once
+by each path of evaluation: IReal with every verified rounding backend,
+IRealArray and LazyIReal. The same expressions are evaluated exactly, with
+fractions made by rational2fraction, at points sampled from the intervals.
+Every exact value must be contained by the interval results, and how much
+wider the results are than the exact values is measured together with the
+time of each path, so a faster path can be accepted only if it keeps the
+enclosures and their tightness.
+
+The cases are random expressions, as well as adversarial ones: cancellations,
+overflows, underflows, inexact decimals and divisions by intervals holding
+zero. This module is a tool for testing the package, so it isn't imported by
+it.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from fractions import Fraction
+from random import Random
+from time import time
+
+from intpy.expr import Variable
+from intpy.ireal import IReal
+from intpy.ireal import IRealArray
+from intpy.lazy import LazyIReal
+from intpy.support import PosInf
+from intpy.support import backend
+from intpy.support import nextafter
+from intpy.support import rational2fraction
+
+
+__all__ = [
+    "adversarial_cases",
+    "compare",
+    "print_table",
+    "random_cases"
+]
+
+
+# The operations of the random expressions, binary ones more often
+_OPERATIONS = ("add", "sub", "mul", "div", "add", "sub", "mul", "neg", "sqr")
+
+
+def _fraction(rational):
+    """Returns the exact fraction of a string representing a rational"""
+    return Fraction(*rational2fraction(rational))
+
+
+def _random_rational(random):
+    """Returns a string representing a random rational, maybe inexact"""
+    if random.random() < 0.25:
+        return "%d/%d" % (random.randint(-99, 99), random.randint(1, 99))
+    return "%de%d" % (random.randint(-9999, 9999), random.randint(-6, 2))
+
+
+def _random_input(random):
+    """Returns the limits of a random input, a point a third of the times"""
+    inf = _random_rational(random)
+    if random.random() < 1.0 / 3.0:
+        return (inf, inf)
+    sup = _random_rational(random)
+    if _fraction(sup) < _fraction(inf):
+        inf, sup = sup, inf
+    return (inf, sup)
+
+
+def _random_expression(random, variables, depth):
+    """Returns a random expression tree over 'variables' variables"""
+    if depth == 0 or random.random() < 0.2:
+        return Variable(random.randrange(variables))
+    op = random.choice(_OPERATIONS)
+    left = _random_expression(random, variables, depth - 1)
+    if op == "neg":
+        return -left
+    if op == "sqr":
+        return left ** 2
+    right = _random_expression(random, variables, depth - 1)
+    if op == "add":
+        return left + right
+    if op == "sub":
+        return left - right
+    if op == "mul":
+        return left * right
+    return left / right
+
+
+def random_cases(n, seed=0, variables=3, depth=4):
+    """Returns 'n' random cases
+
+    A case is an expression, whose leaves are all variables so it can be
+    evaluated exactly, and the limits of its inputs as strings. Some examples:
+
+    >>> cases = random_cases(50)
+    >>> len(cases)
+    50
+    >>> [str(case) for case in cases] == [str(case) for case in \\
+    ...     random_cases(50)]
+    True
+    >>> expression, inputs = cases[0]
+    >>> len(inputs) == 3 and expression.op != "var"
+    True
+    """
+    random = Random(seed)
+    ret = []
+    for i in range(n):
+        expression = _random_expression(random, variables, depth)
+        while expression.op == "var":
+            expression = _random_expression(random, variables, depth)
+        inputs = [_random_input(random) for k in range(variables)]
+        ret.append((expression, inputs))
+    return ret
+
+
+def adversarial_cases():
+    """Returns the cases known to be hard on directed rounding
+
+    Some examples:
+
+    >>> for expression, inputs in adversarial_cases()[:3]:
+    ...     points = [inf for inf, sup in inputs]
+    ...     print("%r at %s" % (expression, ", ".join(points)))
+    sub(add(x0, x1), x1) at 1e-20, 1e20
+    sub(mul(x0, x0), mul(x1, x1)) at 1.0000000000000001, 1
+    mul(x0, x1) at 1e200, 1e200
+    """
+    x, y, z = Variable(0), Variable(1), Variable(2)
+    tenth = x
+    for i in range(9):
+        tenth = tenth + x
+    point = lambda rational: (rational, rational)
+    return [
+        # Absorption and cancellation
+        ((x + y) - y, [point("1e-20"), point("1e20")]),
+        (x * x - y * y, [point("1.0000000000000001"), point("1")]),
+        # Overflows and underflows, also of subnormals
+        (x * y, [point("1e200"), point("1e200")]),
+        (x * y, [point("1e-200"), point("-1e-200")]),
+        (x / y, [point("1e300"), point("3e-10")]),
+        (x / y, [point("1e-300"), point("3e10")]),
+        # Inexact decimals and fractions
+        (x * y + z, [point("0.1"), point("0.2"), point("0.3")]),
+        (tenth - y, [point("0.1"), point("0.9")]),
+        (x * y / y, [point("1/3"), point("7/3")]),
+        # Intervals holding zero and dependency
+        (x ** 2, [("-0.1", "0.3")]),
+        (x - x, [("0.1", "0.2")]),
+        (y / x, [("-1", "1"), point("1")]),
+        ((x + y) * (x - y) / z, [("1/3", "2/3"), point("1e-8"), point("3")]),
+        (-(x * x) / (y * y + z), [("-1e-8", "1e-8"), ("-2", "3"),
+            point("1e-300")])
+    ]
+
+
+def _points(random, limits, samples):
+    """Returns the exact points sampled from the inputs of a case
+
+    The lower and the upper corners are always sampled, and a single point
+    is returned for degenerate inputs.
+    """
+    ret = [[inf for inf, sup in limits], [sup for inf, sup in limits]]
+    if ret[0] == ret[1]:
+        return ret[:1]
+    for i in range(samples):
+        ret.append([inf + (sup - inf) * Fraction(random.randint(0, 1024),
+            1024) for inf, sup in limits])
+    return ret
+
+
+def _exact(expression, point):
+    """Returns the exact value of an expression at a point, or None"""
+    try:
+        return expression.evaluate(point)
+    except ZeroDivisionError:
+        return None
+
+
+def _ulp(value):
+    """Returns the gap between a fraction and the next float away from 0"""
+    try:
+        magnitude = abs(float(value))
+    except OverflowError:
+        return PosInf
+    return nextafter(magnitude, PosInf) - magnitude
+
+
+def _quotient(width, scale):
+    """Returns the width of a result over a positive scale of it"""
+    if width == PosInf or scale == 0.0:
+        return PosInf
+    return width / scale
+
+
+def _median(values):
+    """Returns the median of the values, or None if there aren't any"""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def _ireal(expression, intervals):
+    return expression.evaluate(intervals)
+
+
+def _irarray(expression, intervals):
+    return expression.evaluate([IRealArray([x]) for x in intervals])[0]
+
+
+def _lazy(expression, intervals):
+    return expression.evaluate([LazyIReal(x) for x in intervals]).force()
+
+
+def _paths():
+    """Returns the default paths: IReal with the verified backends and more"""
+    results = backend.self_test()
+    ret = [("IReal/%s" % name, _ireal, name) for name in \
+        backend._CANDIDATES if not results[name]]
+    ret.append(("IRealArray", _irarray, None))
+    ret.append(("LazyIReal", _lazy, None))
+    return ret
+
+
+def compare(cases, samples=16, paths=None, seed=0, strict=False):
+    """Evaluates the cases by each path and against the exact reference
+
+    The paths are (name, evaluate, backend) triples, where evaluate(
+    expression, intervals) returns an IReal, and the rounding backend named
+    'backend' is made active while it runs, unless it's None. By default,
+    they're IReal with each verified backend, IRealArray and LazyIReal.
+
+    It returns a row for each path: a dictionary giving the number of cases,
+    of undefined results and of failures, i.e. results not containing some
+    exact value, the first failures as (expression, inputs, exact value,
+    result) tuples, and the time spent. The widths of the results are given
+    in units in the last place of the exact value for point inputs, and over
+    the width of the sampled exact values otherwise, both as their medians
+    and maxima. The sampled values are inside the exact range, so the latter
+    ratios are upper bounds of the overestimation. If 'strict' is true, the
+    first failure raises an AssertionError. Some examples:
+
+    >>> from intpy.support import rounding
+    >>> rounding_mode_backup = rounding.get_mode()
+    >>> backend_backup = backend.active_backend()
+    >>> cases = random_cases(40) + adversarial_cases()
+    >>> rows = compare(cases)
+    >>> [row["path"] for row in rows][-2:]
+    ['IRealArray', 'LazyIReal']
+    >>> [row["failures"] for row in rows] == [0] * len(rows)
+    True
+    >>> [row["cases"] for row in rows] == [len(cases)] * len(rows)
+    True
+    >>> 1.0 <= rows[0]["median_ratio"] <= rows[0]["max_ratio"]
+    True
+    >>> rounding_mode_backup == rounding.get_mode()
+    True
+    >>> backend_backup == backend.active_backend()
+    True
+
+    A path losing the enclosures is caught:
+
+    >>> lower = lambda expression, intervals: IReal(
+    ...     expression.evaluate(intervals).inf)
+    >>> row = compare(adversarial_cases(), paths=[("lower", lower, None)])[0]
+    >>> row["failures"] > 0
+    True
+    >>> expression, inputs, value, result = row["examples"][0]
+    >>> result.inf <= value <= result.sup
+    False
+    >>> compare(adversarial_cases(), paths=[("lower", lower, None)],
+    ...     strict=True) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    AssertionError:...
+    """
+    random = Random(seed)
+    prepared = []
+    for expression, inputs in cases:
+        limits = [(_fraction(inf), _fraction(sup)) for inf, sup in inputs]
+        values = [_exact(expression, point) for point in _points(random,
+            limits, samples)]
+        prepared.append((expression, inputs, [IReal(inf, sup) for inf, sup \
+            in inputs], [value for value in values if value is not None]))
+    if paths is None:
+        paths = _paths()
+    rows = []
+    for name, evaluate, rounding_backend in paths:
+        backend_backup = backend.active_backend()
+        try:
+            if rounding_backend is not None:
+                backend.use_backend(rounding_backend)
+            start = time()
+            results = [evaluate(expression, intervals) for expression, \
+                inputs, intervals, values in prepared]
+            elapsed = time() - start
+        finally:
+            backend.use_backend(backend_backup)
+        undefined, failures, examples, ulps, ratios = 0, 0, [], [], []
+        for (expression, inputs, intervals, values), result in zip(prepared,
+                results):
+            if result.undefined:
+                undefined += 1
+                continue
+            wrong = [value for value in values if not \
+                result.inf <= value <= result.sup]
+            if wrong:
+                if strict:
+                    raise AssertionError("%s doesn't contain %s in %r for "
+                        "%r at %r" % (name, wrong[0], result, expression,
+                        inputs))
+                failures += 1
+                if len(examples) < 3:
+                    examples.append((expression, inputs, wrong[0], result))
+                continue
+            if not values:
+                continue
+            low, high = min(values), max(values)
+            if low == high:
+                ulps.append(_quotient(result.diameter(), _ulp(low)))
+            else:
+                try:
+                    scale = float(high - low)
+                except OverflowError:
+                    scale = PosInf
+                ratios.append(_quotient(result.diameter(), scale))
+        rows.append({
+            "path": name,
+            "cases": len(prepared),
+            "undefined": undefined,
+            "failures": failures,
+            "examples": examples,
+            "median_ulps": _median(ulps),
+            "max_ulps": max(ulps or [None]),
+            "median_ratio": _median(ratios),
+            "max_ratio": max(ratios or [None]),
+            "seconds": elapsed
+        })
+    return rows
+
+
+def _format(value):
+    """Formats a statistic of a row, which may be missing"""
+    return "-" if value is None else "%.3g" % value
+
+
+def print_table(rows):
+    """Prints the rows given by compare() as a table
+
+    The time of each path is given per case and relative to the first one.
+    Some examples:
+
+    >>> rows = compare(adversarial_cases())
+    >>> print_table(rows) # doctest: +ELLIPSIS
+    path              cases undef fails  med ulps  max ulps med ratio ...
+    IReal/...
+    LazyIReal            14     2     0 ...
+    """
+    print("%-16s %6s %5s %5s %9s %9s %9s %9s %8s %5s" % ("path", "cases",
+        "undef", "fails", "med ulps", "max ulps", "med ratio", "max ratio",
+        "us/case", "rel"))
+    base = rows[0]["seconds"] if rows else 0.0
+    for row in rows:
+        print("%-16s %6d %5d %5d %9s %9s %9s %9s %8.2f %5.2f" % (row["path"],
+            row["cases"], row["undefined"], row["failures"],
+            _format(row["median_ulps"]), _format(row["max_ulps"]),
+            _format(row["median_ratio"]), _format(row["max_ratio"]),
+            row["seconds"] / max(row["cases"], 1) * 1e6,
+            row["seconds"] / base if base else 1.0))
+
+
+def _benchmark(n=2000, samples=16):
+    """Reports the tables of the random and of the adversarial cases"""
+    print("%d random cases" % n)
+    print_table(compare(random_cases(n), samples))
+    print("")
+    print("adversarial cases")
+    print_table(compare(adversarial_cases(), samples))
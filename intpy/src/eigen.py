@@ -0,0 +1,461 @@
+# eigen.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Verified symmetric eigenvalues module
+
+Encloses the eigenvalues of symmetric matrices, and the singular values of
+any matrix. The eigenvectors X and eigenvalues D of the midpoint matrix are
+approximated in floating point, by a Householder reduction to a tridiagonal
+matrix and the implicit QL method, and then the whole spectrum is verified at
+once [1]. With the residual R = AX - XD and the defect G = X'X - I, where
+||G|| <= alpha < 1,
+
+    X'AX = D + E,  E = X'R + GD,  ||E|| <= sqrt(1 + alpha)*||R|| + alpha*||D||
+
+so by Weyl's theorem the sorted eigenvalues of X'AX are within ||E|| of the
+sorted diagonal of D, and by Ostrowski's theorem they're the sorted
+eigenvalues of A multiplied by factors in [1 - alpha, 1 + alpha]. The
+products AX and X'X are computed in floating point rounded to the nearest,
+and their errors are bounded a priori [2], by Cauchy-Schwarz, as
+
+    |fl(x'y) - x'y| <= gamma(n)*||x||*||y|| + n*eta
+
+where eta is the smallest subnormal, so only norms are computed with directed
+rounding. The radius of an interval matrix is added to the residual, so the
+enclosures hold for all the symmetric matrices in it. The 2-norms of
+matrices are bounded by sqrt(||.||_1 * ||.||_inf).
+
+Everything is pure Python, with no vectorized or compiled kernel, so the cost
+grows as n**3 interpreted floating-point operations. It's meant for matrices
+up to a few hundred rows: on CPython 3.11, a whole call takes about 0.5 s for
+n = 100, 10 s for n = 300 and a minute for n = 500, and a 1000 by 1000
+matrix takes several minutes. The _benchmark function measures it.
+
+[1] Rump, S. M., Verification Methods: Rigorous Results Using Floating-Point
+    Arithmetic. Acta Numerica 19, 2010.
+[2] Higham, N. J., Accuracy and Stability of Numerical Algorithms. SIAM,
+    2nd edition, 2002.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+import math
+from functools import reduce
+from operator import add
+from operator import mul
+
+from intpy.ireal import IReal
+from intpy.ireal import IRealArray
+from intpy.support import NaN
+from intpy.support import PosInf
+from intpy.support import backend
+from intpy.support import rounding
+
+
+__all__ = [
+    "eigenvalues",
+    "singular_values"
+]
+
+
+_EPSILON = 2.0 ** -52
+
+# The smallest subnormal, bounding the error of a product by underflow
+_ETA = 2.0 ** -1074
+
+
+def _parse(matrix):
+    """Returns the infimums and supremums of a matrix, as lists of rows
+
+    Some examples:
+
+    >>> _parse([[1, IReal(2, 3)], ["0.5", 4]])
+    ([[1.0, 2.0], [0.5, 4.0]], [[1.0, 3.0], [0.5, 4.0]])
+    >>> _parse([[1, 2], [3]]) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError:...
+    """
+    rows = [row if type(row) == IRealArray else IRealArray(row) for row in
+        matrix]
+    if not rows or len(set([len(row) for row in rows])) != 1 or \
+        not len(rows[0]):
+        raise ValueError("a matrix must be a nonempty list of rows of the "
+            "same length")
+    return [list(row.inf) for row in rows], [list(row.sup) for row in rows]
+
+
+def _midrad(infs, sups):
+    """Returns the midpoint and radius matrices of an interval matrix
+
+    The radius is rounded upwards, so the midpoint plus or minus it contains
+    the matrix. Some examples:
+
+    >>> _midrad([[1.0, -1.0]], [[2.0, 1.0]])
+    ([[1.5, 0.0]], [[0.5, 1.0]])
+    """
+    mids = [[x * 0.5 + y * 0.5 for x, y in zip(inf, sup)] for inf, sup in
+        zip(infs, sups)]
+    rads = [[max(backend.sub(y, m, y, m)[1], backend.sub(m, x, m, x)[1]) for
+        x, y, m in zip(inf, sup, mid)] for inf, sup, mid in zip(infs, sups,
+        mids)]
+    return mids, rads
+
+
+def _tridiagonalize(a):
+    """Reduces a symmetric matrix to a tridiagonal one by reflections
+
+    It returns the diagonal and the subdiagonal of the tridiagonal matrix
+    T, and the orthogonal matrix Q, as a list of rows, such that Q'AQ = T, in
+    floating point. Some examples:
+
+    >>> d, e, q = _tridiagonalize([[4.0, 1.0, 2.0], [1.0, 3.0, 0.0],
+    ...     [2.0, 0.0, 1.0]])
+    >>> ["%.12g" % x for x in d + e]
+    ['4', '1.4', '2.6', '-2.2360679775', '0.8']
+    """
+    n = len(a)
+    b = [list(row) for row in a]
+    diagonal, subdiagonal, reflections = [], [], []
+    # b is the trailing block still to be reduced, and shrinks by one
+    while len(b) > 2:
+        x = b[0][1:]
+        diagonal.append(b[0][0])
+        norm = math.sqrt(sum(map(mul, x, x)))
+        rest = [row[1:] for row in b[1:]]
+        if norm == 0.0:
+            subdiagonal.append(0.0)
+            reflections.append(None)
+            b = rest
+            continue
+        alpha = -norm if x[0] >= 0.0 else norm
+        v = list(x)
+        v[0] -= alpha
+        beta = 2.0 / sum(map(mul, v, v))
+        # (I - beta*vv')B(I - beta*vv') = B - vw' - wv'
+        p = [beta * sum(map(mul, row, v)) for row in rest]
+        k = 0.5 * beta * sum(map(mul, v, p))
+        w = [y - k * z for y, z in zip(p, v)]
+        b = [[y - vi * wj - wi * vj for y, wj, vj in zip(row, w, v)] for
+            row, vi, wi in zip(rest, v, w)]
+        subdiagonal.append(alpha)
+        reflections.append((v, beta))
+    diagonal.extend([row[i] for i, row in enumerate(b)])
+    if len(b) == 2:
+        subdiagonal.append(b[0][1])
+    q = [[0.0] * n for i in range(n)]
+    for i in range(n):
+        q[i][i] = 1.0
+    # Q = H1(H2(...)), each reflection changing only the trailing block
+    for k in range(len(reflections) - 1, -1, -1):
+        if reflections[k] is None:
+            continue
+        v, beta = reflections[k]
+        low = k + 1
+        rows = [row[low:] for row in q[low:]]
+        u = [beta * sum(map(mul, column, v)) for column in zip(*rows)]
+        for i, (vi, row) in enumerate(zip(v, rows)):
+            q[low + i][low:] = [y - vi * z for y, z in zip(row, u)]
+    return diagonal, subdiagonal, q
+
+
+def _ql(diagonal, subdiagonal, vectors, max_iterations=60):
+    """Diagonalizes a symmetric tridiagonal matrix by the implicit QL method
+
+    The diagonal is overwritten by the eigenvalues, and the rotations are
+    applied to the rows of 'vectors', so they turn the rows of Q' into the
+    eigenvectors of QTQ'. Some examples:
+
+    >>> d = [2.0, 2.0]; z = [[1.0, 0.0], [0.0, 1.0]]
+    >>> _ql(d, [1.0], z); sorted(["%.12g" % x for x in d])
+    ['1', '3']
+    """
+    d, e, n = diagonal, subdiagonal + [0.0], len(diagonal)
+    for l in range(n):
+        for iteration in range(max_iterations):
+            m = l
+            while m < n - 1 and abs(e[m]) > _EPSILON * (abs(d[m]) + \
+                abs(d[m + 1])):
+                m += 1
+            if m == l:
+                break
+            g = (d[l + 1] - d[l]) / (2.0 * e[l])
+            r = math.hypot(g, 1.0)
+            g = d[m] - d[l] + e[l] / (g + (r if g >= 0.0 else -r))
+            s, c, p = 1.0, 1.0, 0.0
+            for i in range(m - 1, l - 1, -1):
+                f, b = s * e[i], c * e[i]
+                r = math.hypot(f, g)
+                e[i + 1] = r
+                if r == 0.0:
+                    d[i + 1] -= p
+                    e[m] = 0.0
+                    break
+                s, c = f / r, g / r
+                g = d[i + 1] - p
+                r = (d[i] - g) * s + 2.0 * c * b
+                p = s * r
+                d[i + 1] = g + p
+                g = c * r - b
+                x, y = vectors[i], vectors[i + 1]
+                vectors[i + 1] = [s * u + c * w for u, w in zip(x, y)]
+                vectors[i] = [c * u - s * w for u, w in zip(x, y)]
+            else:
+                d[l] -= p
+                e[l] = g
+                e[m] = 0.0
+
+
+def _eigh(a):
+    """Approximates the eigenvalues and eigenvectors of a symmetric matrix
+
+    It returns the eigenvalues in increasing order and the eigenvectors as
+    the rows of a list. The rounding mode must be to the nearest. Some
+    examples:
+
+    >>> values, vectors = _eigh([[2.0, 1.0], [1.0, 2.0]])
+    >>> ["%.12g" % x for x in values]
+    ['1', '3']
+    >>> ["%.12g" % abs(x) for x in vectors[0]]
+    ['0.707106781187', '0.707106781187']
+    """
+    diagonal, subdiagonal, q = _tridiagonalize(a)
+    vectors = [list(column) for column in zip(*q)]
+    _ql(diagonal, subdiagonal, vectors)
+    order = sorted(range(len(a)), key=lambda i: diagonal[i])
+    return [diagonal[i] for i in order], [vectors[i] for i in order]
+
+
+def _sum_up(values):
+    """Sums the values one by one, so upwards if the rounding mode is"""
+    return reduce(add, values, 0.0)
+
+
+def _norm_up(vector):
+    """Bounds the 2-norm of a vector upwards
+
+    The rounding mode must be upwards.
+    """
+    return backend.sqrt(0.0, _sum_up(map(mul, vector, vector)))[1]
+
+
+def _norm(bounds):
+    """Bounds the 2-norm of a matrix of bounds of absolute values upwards
+
+    Some examples:
+
+    >>> _norm([[3.0, -4.0], [4.0, 3.0]])
+    7.0
+    >>> _norm([[3.0, 0.0], [4.0, 0.0]]) == 28 ** 0.5
+    True
+    """
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(1)
+    try:
+        rows = max([_sum_up(row) for row in bounds])
+        columns = max([_sum_up(column) for column in zip(*bounds)])
+        product = rows * columns
+    finally:
+        rounding.set_mode(rounding_mode_backup)
+    return backend.sqrt(0.0, product)[1]
+
+
+def _gamma(n):
+    """Bounds the relative error of dot products of length n upwards
+
+    It's above gamma(n + 1) = (n + 1)u/(1 - (n + 1)u) with u = 2**-53, for
+    any n below 10**13, which also covers the compensated sum of Python
+    3.12. The rounding mode must be upwards.
+    """
+    return 1.01 * (n + 1) * (0.5 * _EPSILON)
+
+
+def _enclose(mids, rads):
+    """Encloses the eigenvalues of the symmetric matrices in mids +- rads
+
+    It returns the enclosures in increasing order, undefined when the
+    approximate eigenvectors aren't accurate enough.
+    """
+    n = len(mids)
+    undefined = IRealArray.from_limits([NaN] * n, [NaN] * n)
+    for row in mids + rads:
+        if not -PosInf < min(row) <= max(row) < PosInf:
+            return undefined
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(0)
+    try:
+        values, vectors = _eigh(mids)
+        products = [[sum(map(mul, row, vector)) for row in mids] for
+            vector in vectors]
+        grams = [[sum(map(mul, vectors[i], vectors[j])) for j in
+            range(i + 1)] for i in range(n)]
+        rounding.set_mode(1)
+        gamma, tiny = _gamma(n), (n + 1) * _ETA
+        row_norms = [gamma * _norm_up(row) for row in mids]
+        thick = max([max(row) for row in rads]) > 0.0
+        norms = [_norm_up(vector) for vector in vectors]
+        # |R| <= |fl(MX) - XD| + the error of fl(MX) + rads*|X|, column by
+        # column of X
+        residuals = []
+        for vector, value, product, norm in zip(vectors, values, products,
+                norms):
+            column = []
+            for p, x, row_norm in zip(product, vector, row_norms):
+                high = max(p + -value * x, -p + value * x)
+                column.append(high + (row_norm * norm + tiny))
+            if thick:
+                magnitudes = [abs(x) for x in vector]
+                column = [high + _sum_up(map(mul, row, magnitudes)) for
+                    high, row in zip(column, rads)]
+            residuals.append(column)
+        defects = [[0.0] * n for i in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                g, delta = grams[i][j], float(i == j)
+                high = max(g - delta, delta - g) + (gamma * norms[i] * \
+                    norms[j] + tiny)
+                defects[i][j] = defects[j][i] = high
+    finally:
+        rounding.set_mode(rounding_mode_backup)
+    alpha = _norm(defects)
+    if not alpha < 1.0:
+        return undefined
+    # The residuals are held by columns, so the norm is the same transposed
+    residual = _norm(residuals)
+    scale = max([abs(x) for x in values])
+    error = backend.mul(0.0, 0.0, alpha, scale)[1]
+    spread = backend.sqrt(0.0, backend.add(0.0, 0.0, 1.0, alpha)[1])[1]
+    error = backend.add(0.0, 0.0, error, backend.mul(0.0, 0.0, spread,
+        residual)[1])[1]
+    shifted = IRealArray.from_limits(values, values) + IReal(-error, error)
+    return shifted / IReal(backend.sub(1.0, alpha, 1.0, alpha)[0],
+        backend.add(1.0, alpha, 1.0, alpha)[1])
+
+
+def eigenvalues(matrix):
+    """Encloses the eigenvalues of a symmetric matrix
+
+    The matrix is a list of rows of anything accepted by the IReal
+    constructor, and it must be symmetric. For interval matrices the
+    enclosures hold for all the symmetric matrices in them. It returns an
+    IRealArray with the enclosures of the eigenvalues in increasing order,
+    repeated by their multiplicities. Some examples:
+
+    >>> rounding_mode_backup = rounding.get_mode()
+    >>> x = eigenvalues([[2, 1], [1, 2]])
+    >>> 1 in x[0] and 3 in x[1] and max(x.diameter()) < 1e-13
+    True
+    >>> x = eigenvalues([["0.1", 0, 0], [0, "0.1", 0], [0, 0, 7]])
+    >>> IReal("0.1") in x[0] and IReal("0.1") in x[1] and 7 in x[2]
+    True
+    >>> x = eigenvalues([[IReal(1, 1.5), 0], [0, 3]])
+    >>> x[0].inf <= 1 and x[0].sup >= 1.5 and x[0].diameter() < 0.6
+    True
+    >>> eigenvalues([[NaN, 0], [0, 1]])
+    IRealArray([undefined interval, undefined interval])
+    >>> eigenvalues([[1, 2], [3, 4]]) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError:...
+    >>> rounding_mode_backup == rounding.get_mode()
+    True
+    """
+    infs, sups = _parse(matrix)
+    n = len(infs)
+    if len(infs[0]) != n:
+        raise ValueError("the matrix must be square")
+    for i in range(n):
+        for j in range(i):
+            if infs[i][j] != infs[j][i] or sups[i][j] != sups[j][i]:
+                raise ValueError("the matrix must be symmetric")
+    return _enclose(*_midrad(infs, sups))
+
+
+def singular_values(matrix):
+    """Encloses the singular values of a matrix
+
+    They're the square roots of the eigenvalues of A'A, whose products are
+    enclosed rigorously first. It returns an IRealArray with the enclosures
+    in increasing order, one per column of the matrix. Some examples:
+
+    >>> x = singular_values([[3, 0], [4, 0], [0, 2]])
+    >>> 2 in x[0] and 5 in x[1] and max(x.diameter()) < 1e-13
+    True
+    >>> x = singular_values([[1, 1], [1, 1]])
+    >>> x[0].inf == 0 and x[0].sup < 1e-7 and 2 in x[1]
+    True
+    """
+    infs, sups = _parse(matrix)
+    mids, rads = _midrad(infs, sups)
+    columns = [list(column) for column in zip(*mids)]
+    radii = [list(column) for column in zip(*rads)]
+    n = len(columns)
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(0)
+    try:
+        grams = [[sum(map(mul, columns[i], columns[j])) for j in
+            range(i + 1)] for i in range(n)]
+        rounding.set_mode(1)
+        gamma, tiny = _gamma(len(mids)), (len(mids) + 1) * _ETA
+        norms = [_norm_up(column) for column in columns]
+        thick = max([max(column) for column in radii]) > 0.0
+        if thick:
+            magnitudes = [[abs(x) for x in column] for column in columns]
+            hulls = [list(map(add, column, radius)) for column, radius in
+                zip(magnitudes, radii)]
+        lows = [[0.0] * n for i in range(n)]
+        highs = [[0.0] * n for i in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                rad = gamma * norms[i] * norms[j] + tiny
+                if thick:
+                    # |A'A - M'M| <= |M|'rads + rads'|M| + rads'rads, that
+                    # is (|M| + rads)'rads + rads'|M|
+                    rad = rad + _sum_up(map(mul, hulls[i], radii[j])) + \
+                        _sum_up(map(mul, radii[i], magnitudes[j]))
+                lows[i][j] = lows[j][i] = -(rad - grams[i][j])
+                highs[i][j] = highs[j][i] = grams[i][j] + rad
+    finally:
+        rounding.set_mode(rounding_mode_backup)
+    squares = _enclose(*_midrad(lows, highs))
+    return IRealArray.from_limits([backend.sqrt(max(x, 0.0), 0.0)[0] for x in
+        squares.inf], [backend.sqrt(0.0, max(y, 0.0))[1] for y in
+        squares.sup])
+
+
+def _benchmark(sizes=(10, 30, 100, 300), seed=0):
+    """Reports times and widths of eigenvalue enclosures of random matrices"""
+    from random import Random
+    from time import time
+    random = Random(seed)
+    for n in sizes:
+        a = [[0.0] * n for i in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                a[i][j] = a[j][i] = random.uniform(-1, 1)
+        start = time()
+        _eigh(a)
+        approximate = time() - start
+        start = time()
+        x = eigenvalues(a)
+        elapsed = time() - start
+        print("n = %4d  approximate %8.3f s  verified %8.3f s  max width "
+            "%.3g" % (n, approximate, elapsed, max(x.diameter())))
@@ -0,0 +1,251 @@
+# expr.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Expression tree module
+
+Provides expression trees built by applying the usual arithmetic operators to
+variables and constants. The algorithms needing to see the structure of a
+function, rather than only evaluating it, work on them.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.ireal import IReal
+
+
+__all__ = [
+    "Expression",
+    "Variable",
+    "Constant"
+]
+
+
+def _wrap(value):
+    """Returns an expression for an operand of the operators"""
+    if isinstance(value, Expression):
+        return value
+    return Constant(value)
+
+
+class Expression(object):
+    """A node of an expression tree
+
+    A node is an operation, named by 'op', applied to the expressions in
+    'args'. The operations are "add", "sub", "mul", "div", "neg" and "sqr",
+    besides the leaves "var" and "const" of the subclasses. Expressions are
+    compared by identity, so a subexpression used many times is the same node
+    everywhere and it's evaluated once.
+    """
+
+    def __init__(self, op, args):
+        self._op = op
+        self._args = tuple(args)
+
+    op = property(fget=lambda self: self._op)
+    args = property(fget=lambda self: self._args)
+
+    def __repr__(self):
+        """Gives a representation of the expression
+
+        Some examples:
+
+        >>> x, y = Variable(0), Variable(1)
+        >>> (x + 1) * -y
+        mul(add(x0, 1.0), neg(x1))
+        >>> x ** 2
+        sqr(x0)
+        """
+        return "%s(%s)" % (self._op, ", ".join([repr(x) for x in self._args]))
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return Expression("neg", (self,))
+
+    def __add__(self, other):
+        return Expression("add", (self, _wrap(other)))
+
+    def __radd__(self, other):
+        return Expression("add", (_wrap(other), self))
+
+    def __sub__(self, other):
+        return Expression("sub", (self, _wrap(other)))
+
+    def __rsub__(self, other):
+        return Expression("sub", (_wrap(other), self))
+
+    def __mul__(self, other):
+        return Expression("mul", (self, _wrap(other)))
+
+    def __rmul__(self, other):
+        return Expression("mul", (_wrap(other), self))
+
+    def __div__(self, other):
+        return Expression("div", (self, _wrap(other)))
+
+    def __rdiv__(self, other):
+        return Expression("div", (_wrap(other), self))
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def __pow__(self, exponent):
+        """Power operator, for positive integer exponents
+
+        Squares are kept as such, other powers become products. Some examples:
+
+        >>> x = Variable(0)
+        >>> x ** 3
+        mul(sqr(x0), x0)
+        >>> x ** 0.5 # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        if type(exponent) != int or exponent < 1:
+            raise ValueError("only positive integer exponents are supported")
+        if exponent == 1:
+            return self
+        ret = Expression("sqr", (self,))
+        for i in range(exponent - 2):
+            ret = ret * self
+        return ret
+
+    def nodes(self):
+        """Returns all the nodes of the expression, children before parents
+
+        Shared subexpressions are listed once. Some examples:
+
+        >>> x = Variable(0); y = x + 1
+        >>> y * y
+        mul(add(x0, 1.0), add(x0, 1.0))
+        >>> (y * y).nodes()
+        [x0, 1.0, add(x0, 1.0), mul(add(x0, 1.0), add(x0, 1.0))]
+        """
+        ret, seen, stack = [], set(), [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                ret.append(node)
+            elif id(node) not in seen:
+                seen.add(id(node))
+                stack.append((node, True))
+                stack.extend([(x, False) for x in reversed(node._args)])
+        return ret
+
+    def variables(self):
+        """Returns the sorted indexes of the variables in the expression
+
+        Some examples:
+
+        >>> (Variable(3) * Variable(1) + Variable(3)).variables()
+        [1, 3]
+        """
+        return sorted(set([x.index for x in self.nodes() if x._op == "var"]))
+
+    def evaluate(self, values):
+        """Evaluates the expression for the values of the variables
+
+        The values are indexed by the variables and can be IReals or anything
+        else having the arithmetic operators. Some examples:
+
+        >>> x, y = Variable(0), Variable(1)
+        >>> (x * y - x ** 2).evaluate([IReal(1, 2), IReal(3)])
+        [-1.0, 5.0]
+        >>> (x / 4 + 1).evaluate([2.0])
+        [1.5, 1.5]
+        >>> (x ** 2).evaluate([IReal(-1, 2)])
+        [0.0, 4.0]
+        """
+        results = {}
+        for node in self.nodes():
+            results[id(node)] = node._compute(values,
+                [results[id(x)] for x in node._args])
+        return results[id(self)]
+
+    def _compute(self, values, args):
+        """Computes the node from the values of its arguments"""
+        return _OPERATIONS[self._op](*args)
+
+
+class Variable(Expression):
+    """The variable of index 'index' in an expression"""
+
+    def __init__(self, index):
+        Expression.__init__(self, "var", ())
+        self._index = index
+
+    index = property(fget=lambda self: self._index)
+
+    def __repr__(self):
+        return "x%d" % self._index
+
+    def _compute(self, values, args):
+        return values[self._index]
+
+
+class Constant(Expression):
+    """A constant in an expression
+
+    Its value is kept as an IReal, so decimal strings are enclosed as usual.
+    """
+
+    def __init__(self, value):
+        Expression.__init__(self, "const", ())
+        self._value = value if type(value) == IReal else IReal(value)
+
+    value = property(fget=lambda self: self._value)
+
+    def __repr__(self):
+        """Gives a representation of the constant
+
+        Some examples:
+
+        >>> Constant(2)
+        2.0
+        >>> Constant(IReal(1, 2))
+        [1.0, 2.0]
+        """
+        if self._value.inf == self._value.sup:
+            return repr(self._value.inf)
+        return repr(self._value)
+
+    def _compute(self, values, args):
+        return self._value
+
+
+def _sqr(x):
+    """Squares a value, keeping the square of an interval nonnegative"""
+    if type(x) == IReal and x.inf < 0.0 < x.sup:
+        magnitude = abs(x)
+        return IReal(0, magnitude) * magnitude
+    return x * x
+
+
+_OPERATIONS = {
+    "add": lambda x, y: x + y,
+    "sub": lambda x, y: x - y,
+    "mul": lambda x, y: x * y,
+    "div": lambda x, y: x / y,
+    "neg": lambda x: -x,
+    "sqr": _sqr
+}
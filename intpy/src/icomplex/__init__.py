@@ -0,0 +1,35 @@
+# icomplex/__init__.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IComplex type sub-package
+
+All the stuff related to the IComplex type is organized here.
+
+It was developed by the IntPy contributors and it's free software.
+"""
+
+
+from intpy.icomplex.icomplex import *
+from intpy.icomplex.icarray import *
+
+
+__all__ = [
+    "IComplex",
+    "IComplexArray"
+]
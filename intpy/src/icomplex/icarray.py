@@ -0,0 +1,245 @@
+# icomplex/icarray.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IComplexArray class module
+
+This module contains an implementation of arrays of rectangular Complex
+Intervals, kept as a pair of IRealArrays. Products and quotients of whole
+arrays are done with a single switch of the rounding mode.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from itertools import repeat
+
+from intpy.errors import EmptyIntervalError
+from intpy.icomplex.icomplex import IComplex
+from intpy.icomplex.icomplex import _div_limits
+from intpy.icomplex.icomplex import _mul_limits
+from intpy.icomplex.icomplex import _parts
+from intpy.ireal import IRealArray
+from intpy.support import NaN
+from intpy.support import rounding
+
+
+__all__ = [
+    "IComplexArray"
+]
+
+
+def _broadcast(other, length):
+    """Returns the parts of an operand as IRealArrays or broadcast IReals"""
+    if type(other) == IComplexArray:
+        if len(other) != length:
+            raise ValueError("arrays of different lengths can't be operated")
+        return other._real, other._imag
+    real, imag = _parts(other)
+    if real.empty or imag.empty:
+        raise EmptyIntervalError()
+    return real, imag
+
+
+def _limits(part, length):
+    if type(part) == IRealArray:
+        return part.inf, part.sup
+    return repeat(part.inf, length), repeat(part.sup, length)
+
+
+class IComplexArray(object):
+    """An array of rectangular Complex Intervals
+
+    The real and imaginary parts of the elements are kept as two IRealArrays
+    and the arithmetic operators work element by element. An IComplex, or
+    anything accepted as operand by IComplex, is broadcast to all the
+    elements.
+    """
+
+    def __init__(self, values=()):
+        """Constructor of the IComplexArray class
+
+        Some examples:
+
+        >>> IComplexArray([IComplex(1, 2), 3j, 1])
+        IComplexArray([([1.0, 1.0] + [2.0, 2.0]j), ([0.0, 0.0] + [3.0, 3.0]j), \
+([1.0, 1.0] + [0.0, 0.0]j)])
+        """
+        parts = [_parts(value) for value in values]
+        self._real = IRealArray([real for real, imag in parts])
+        self._imag = IRealArray([imag for real, imag in parts])
+
+    def from_parts(real, imag):
+        """Builds an array from the IRealArrays of the real and imaginary parts
+
+        Some examples:
+
+        >>> IComplexArray.from_parts(IRealArray([1, 2]), IRealArray([0, -1]))
+        IComplexArray([([1.0, 1.0] + [0.0, 0.0]j), ([2.0, 2.0] + [-1.0, -1.0]j)])
+        """
+        if len(real) != len(imag):
+            raise ValueError("the parts must have the same length")
+        ret = IComplexArray()
+        ret._real, ret._imag = real, imag
+        return ret
+
+    from_parts = staticmethod(from_parts)
+
+    real = property(fget=lambda self: self._real)
+    imag = property(fget=lambda self: self._imag)
+
+    def __len__(self):
+        return len(self._real)
+
+    def __getitem__(self, index):
+        if type(index) == slice:
+            return IComplexArray.from_parts(self._real[index],
+                self._imag[index])
+        return IComplex(self._real[index], self._imag[index])
+
+    def __iter__(self):
+        for real, imag in zip(self._real, self._imag):
+            yield IComplex(real, imag)
+
+    def __repr__(self):
+        return "IComplexArray([%s])" % ", ".join([repr(x) for x in self])
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return IComplexArray.from_parts(-self._real, -self._imag)
+
+    def conjugate(self):
+        return IComplexArray.from_parts(self._real, -self._imag)
+
+    def __add__(self, other):
+        """Binary plus operator
+
+        Some examples:
+
+        >>> IComplexArray([1, 1j]) + IComplexArray([2j, 2])
+        IComplexArray([([1.0, 1.0] + [2.0, 2.0]j), ([2.0, 2.0] + [1.0, 1.0]j)])
+        >>> 1 + IComplexArray([1j])
+        IComplexArray([([1.0, 1.0] + [1.0, 1.0]j)])
+        """
+        real, imag = _broadcast(other, len(self))
+        return IComplexArray.from_parts(self._real + real, self._imag + imag)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        real, imag = _broadcast(other, len(self))
+        return IComplexArray.from_parts(self._real - real, self._imag - imag)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def _apply(self, other, limits_function):
+        """Applies a function of the limits to all the elements at once"""
+        n = len(self)
+        real, imag = _broadcast(other, n)
+        operands = list(zip(self._real.inf, self._real.sup, self._imag.inf,
+            self._imag.sup, *(_limits(real, n) + _limits(imag, n))))
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(-1)
+        limits = [limits_function(*x) for x in operands]
+        rounding.set_mode(rounding_mode_backup)
+        return IComplexArray.from_parts(
+            IRealArray.from_limits([x[0] for x in limits],
+                [x[1] for x in limits]),
+            IRealArray.from_limits([x[2] for x in limits],
+                [x[3] for x in limits]))
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IComplexArray([1+2j, 1j]) * IComplexArray([3+4j, 1j])
+        IComplexArray([([-5.0, -5.0] + [10.0, 10.0]j), ([-1.0, -1.0] + \
+[0.0, 0.0]j)])
+        >>> x = IComplexArray([IComplex("0.1", 1)]) * IComplex(1, "0.1")
+        >>> x[0] == IComplex("0.1", 1) * IComplex(1, "0.1")
+        True
+        >>> 2j * IComplexArray([1+1j])
+        IComplexArray([([-2.0, -2.0] + [2.0, 2.0]j)])
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        return self._apply(other, _mul_limits)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Division operator
+
+        The elements whose divisor contains zero become undefined. Some
+        examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IComplexArray([-5+10j, 1]) / IComplexArray([2j, 0])
+        IComplexArray([([5.0, 5.0] + [2.5, 2.5]j), undefined complex interval])
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        return self._apply(other, _safe_div_limits)
+
+    def __rdiv__(self, other):
+        real, imag = _broadcast(other, len(self))
+        return IComplexArray.from_parts(
+            IRealArray.from_limits(*_limits(real, len(self))),
+            IRealArray.from_limits(*_limits(imag, len(self)))) / self
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+
+def _safe_div_limits(a1, a2, b1, b2, c1, c2, d1, d2):
+    if c1 <= 0.0 <= c2 and d1 <= 0.0 <= d2:
+        return (NaN, NaN, NaN, NaN)
+    return _div_limits(a1, a2, b1, b2, c1, c2, d1, d2)
+
+
+def _benchmark(n=20000):
+    """Reports complex interval multiplications per second"""
+    from random import random
+    from time import time
+    from intpy.ireal import IReal
+    x = [IComplex(IReal(random(), 1 + random()), IReal(-random(), random())) \
+        for i in range(n)]
+    y = [IComplex(IReal(-random(), random()), IReal(random(), 2)) for i in \
+        range(n)]
+    start = time()
+    for a, b in zip(x, y):
+        IComplex(a.real * b.real - a.imag * b.imag,
+            a.real * b.imag + a.imag * b.real)
+    naive = time() - start
+    start = time()
+    for a, b in zip(x, y):
+        a * b
+    scalar = time() - start
+    xa, ya = IComplexArray(x), IComplexArray(y)
+    start = time()
+    xa * ya
+    vectorized = time() - start
+    for name, elapsed in [("IReal operators", naive), ("IComplex", scalar),
+        ("IComplexArray", vectorized)]:
+        print("%-16s %12.0f mul/s" % (name, n / elapsed))
@@ -0,0 +1,382 @@
+# icomplex/icomplex.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IComplex class module
+
+This module contains an implementation of the rectangular Complex Interval
+type, whose real and imaginary parts are Real Intervals.
+
+All the limits of a product or a quotient are computed with the rounding mode
+set downwards only once: an upper bound is obtained as the negation of the
+lower bound of the negated expression, which is exact in floating point.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from fractions import Fraction
+
+from intpy.errors import EmptyIntervalError
+from intpy.ireal import IReal
+from intpy.ireal.irarray import _ireal
+from intpy.support import PosInf
+from intpy.support import fraction2floats
+from intpy.support import rounding
+
+
+__all__ = [
+    "IComplex"
+]
+
+
+def _mul_limits(a1, a2, b1, b2, c1, c2, d1, d2):
+    """Limits of the product of the rectangles [a] + [b]j and [c] + [d]j
+
+    The rounding mode must be set downwards. Each part of the product uses
+    every operand only once, so the rectangle returned is the tightest one up
+    to the rounding.
+    """
+    ac = min(a1*c1, a1*c2, a2*c1, a2*c2)
+    bd = min(b1*d1, b1*d2, b2*d1, b2*d2)
+    ad = min(a1*d1, a1*d2, a2*d1, a2*d2)
+    bc = min(b1*c1, b1*c2, b2*c1, b2*c2)
+    nac = min(-a1*c1, -a1*c2, -a2*c1, -a2*c2)
+    nbd = min(-b1*d1, -b1*d2, -b2*d1, -b2*d2)
+    nad = min(-a1*d1, -a1*d2, -a2*d1, -a2*d2)
+    nbc = min(-b1*c1, -b1*c2, -b2*c1, -b2*c2)
+    return (ac + nbd, -(nac + bd), ad + bc, -(nad + nbc))
+
+
+# Below it the squares of the divisor lose precision, or are lost
+_MIN_NORMAL = 2.0 ** -1022
+
+
+def _recip_point(c, d):
+    """Limits of the real and imaginary parts of 1/(c + dj) for floats
+
+    The rounding mode must be set downwards. When c*c + d*d underflows or
+    overflows the limits are those of the exact quotients, computed with
+    fractions, and the reciprocal of an infinite point is zero.
+    """
+    if c == PosInf or c == -PosInf or d == PosInf or d == -PosInf:
+        return (0.0, 0.0, 0.0, 0.0)
+    low = c*c + d*d
+    high = -(-c*c + -d*d)
+    if low < _MIN_NORMAL or high == PosInf:
+        c, d = Fraction(c), Fraction(d)
+        norm = c*c + d*d
+        return fraction2floats(c / norm) + fraction2floats(-d / norm)
+    if c >= 0.0:
+        re = (c / high, -(-c / low))
+    else:
+        re = (c / low, -(-c / high))
+    if d <= 0.0:
+        im = (-d / high, -(d / low))
+    else:
+        im = (-d / low, -(d / high))
+    return re + im
+
+
+def _recip_limits(c1, c2, d1, d2):
+    """Limits of the smallest rectangle containing 1/z for z in [c] + [d]j
+
+    The rounding mode must be set downwards and the rectangle can't contain
+    zero. The real and imaginary parts of 1/z are harmonic, so their extremes
+    over the rectangle are on its border, at the corners or at the points of
+    the sides where c = 0, d = 0 or |c| = |d|.
+    """
+    points = [(c1, d1), (c1, d2), (c2, d1), (c2, d2)]
+    for c in (c1, c2):
+        for d in (c, -c, 0.0):
+            if d1 <= d <= d2:
+                points.append((c, d))
+    for d in (d1, d2):
+        for c in (d, -d, 0.0):
+            if c1 <= c <= c2:
+                points.append((c, d))
+    limits = [_recip_point(c, d) for c, d in points]
+    return (min([x[0] for x in limits]), max([x[1] for x in limits]),
+        min([x[2] for x in limits]), max([x[3] for x in limits]))
+
+
+def _div_limits(a1, a2, b1, b2, c1, c2, d1, d2):
+    """Limits of the quotient of the rectangles [a] + [b]j and [c] + [d]j
+
+    The rounding mode must be set downwards and the divisor can't contain
+    zero.
+    """
+    return _mul_limits(a1, a2, b1, b2, *_recip_limits(c1, c2, d1, d2))
+
+
+def _parts(other):
+    """Returns the real and imaginary parts of an operand as IReals"""
+    if type(other) == IComplex:
+        return other._real, other._imag
+    if type(other) == complex:
+        return IReal(other.real), IReal(other.imag)
+    if type(other) != IReal:
+        other = IReal(other)
+    return other, IReal(0)
+
+
+class IComplex(object):
+    """An implementation of the rectangular Complex Interval type
+
+    A Complex Interval is the rectangle of the Complex Plane given by a Real
+    Interval for the real part and another for the imaginary part. The complex
+    numbers, IReals and anything accepted by the IReal constructor can be used
+    as operands.
+    """
+
+    def __init__(self, real=None, imag=None):
+        """Constructor of the IComplex class
+
+        For more information about the IComplex class, see the class
+        docstring. Some examples of how to use this constructor follow below:
+
+        >>> IComplex()
+        empty complex interval
+        >>> IComplex("undefined")
+        undefined complex interval
+        >>> IComplex(IReal(1, 2), "0.5")
+        ([1.0, 2.0] + [0.5, 0.5]j)
+        >>> IComplex(1+2j)
+        ([1.0, 1.0] + [2.0, 2.0]j)
+        >>> IComplex(3)
+        ([3.0, 3.0] + [0.0, 0.0]j)
+        """
+        if real is None:
+            self._real, self._imag = IReal(), IReal()
+        elif type(real) == complex and imag is None:
+            self._real, self._imag = _parts(real)
+        elif type(real) == type(str()) and real == "undefined":
+            self._real = self._imag = IReal("undefined")
+        else:
+            self._real = real if type(real) == IReal else IReal(real)
+            if imag is None:
+                self._imag = IReal(0)
+            else:
+                self._imag = imag if type(imag) == IReal else IReal(imag)
+
+    real = property(fget=lambda self: self._real)
+    imag = property(fget=lambda self: self._imag)
+    empty = property(fget=lambda self: self._real.empty or self._imag.empty)
+    undefined = property(fget=lambda self: not self.empty and \
+        (self._real.undefined or self._imag.undefined))
+
+    def _operands(self, other):
+        """Returns the 8 limits of the operands of a binary operation
+
+        It returns None if some operand is undefined.
+        """
+        real, imag = _parts(other)
+        if self.empty or real.empty or imag.empty:
+            raise EmptyIntervalError()
+        if self.undefined or real.undefined or imag.undefined:
+            return None
+        return (self._real.inf, self._real.sup, self._imag.inf,
+            self._imag.sup, real.inf, real.sup, imag.inf, imag.sup)
+
+    def __pos__(self):
+        if self.empty:
+            raise EmptyIntervalError()
+        return self
+
+    def __neg__(self):
+        """Unary minus operator
+
+        Some examples:
+
+        >>> -IComplex(IReal(1, 2), IReal(-3, 4))
+        ([-2.0, -1.0] + [-4.0, 3.0]j)
+        """
+        if self.empty:
+            raise EmptyIntervalError()
+        return IComplex(-self._real, -self._imag)
+
+    def conjugate(self):
+        """Complex conjugate
+
+        Some examples:
+
+        >>> IComplex(IReal(1, 2), IReal(-3, 4)).conjugate()
+        ([1.0, 2.0] + [-4.0, 3.0]j)
+        """
+        if self.empty:
+            raise EmptyIntervalError()
+        return IComplex(self._real, -self._imag)
+
+    def __add__(self, other):
+        """Binary plus operator
+
+        Some examples:
+
+        >>> IComplex(IReal(1, 2), 1) + IComplex(0.5, IReal(0, 1))
+        ([1.5, 2.5] + [1.0, 2.0]j)
+        >>> IComplex(1, 1) + 2j
+        ([1.0, 1.0] + [3.0, 3.0]j)
+        >>> 2 + IComplex(1, 1)
+        ([3.0, 3.0] + [1.0, 1.0]j)
+        """
+        real, imag = _parts(other)
+        return IComplex(self._real + real, self._imag + imag)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Binary minus operator
+
+        Some examples:
+
+        >>> IComplex(IReal(1, 2), 3) - IComplex(0.5, IReal(-1, 1))
+        ([0.5, 1.5] + [2.0, 4.0]j)
+        >>> 2 - IComplex(1, 1)
+        ([1.0, 1.0] + [-1.0, -1.0]j)
+        """
+        real, imag = _parts(other)
+        return IComplex(self._real - real, self._imag - imag)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IComplex(1, 2) * IComplex(3, 4)
+        ([-5.0, -5.0] + [10.0, 10.0]j)
+        >>> IComplex(IReal(1, 2), IReal(1, 3)) * IComplex(IReal(0, 1), 1)
+        ([-3.0, 1.0] + [1.0, 5.0]j)
+        >>> x = IComplex("0.1", "0.1") * 1j
+        >>> x.real.inf < x.real.sup and str(x.real.inf) == "-0.1"
+        True
+        >>> 2j * IComplex(1, 1)
+        ([-2.0, -2.0] + [2.0, 2.0]j)
+        >>> IComplex("undefined") * 2
+        undefined complex interval
+        >>> IComplex() * 2 # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        operands = self._operands(other)
+        if operands is None:
+            return IComplex("undefined")
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(-1)
+        limits = _mul_limits(*operands)
+        rounding.set_mode(rounding_mode_backup)
+        return IComplex(_ireal(limits[0], limits[1]),
+            _ireal(limits[2], limits[3]))
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Division operator
+
+        The divisor is replaced by the smallest rectangle containing its
+        reciprocal, so the quotient is tighter than the one given by the usual
+        formula with the squared modulus. Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IComplex(-5, 10) / 2j
+        ([5.0, 5.0] + [2.5, 2.5]j)
+        >>> 1+2j in IComplex(-5, 10) / IComplex(3, 4)
+        True
+        >>> x = IComplex(1) / IComplex(IReal(1, 2), IReal(1, 2))
+        >>> x.real.inf <= 0.25 and x.real.sup >= 0.5
+        True
+        >>> x.imag.inf <= -0.5 and x.imag.sup >= -0.25
+        True
+        >>> IComplex(1) / IComplex(IReal(-1, 1), IReal(-1, 1))
+        undefined complex interval
+        >>> x = IComplex(1) / IComplex(1e-200, 1e-200)
+        >>> x.real.inf <= 5e199 <= x.real.sup, x.real.diameter() < 1e185
+        (True, True)
+        >>> x = IComplex(1) / IComplex(IReal(1e-170, 1), IReal(1e-170, 1))
+        >>> 0.5-0.5j in x and 5e169-5e169j in x and x.real.sup < 5.1e169
+        True
+        >>> IComplex(1) / IComplex(IReal(1, PosInf), 0)
+        ([0.0, 1.0] + [-0.0, 0.0]j)
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        operands = self._operands(other)
+        if operands is None or (operands[4] <= 0.0 <= operands[5] and \
+            operands[6] <= 0.0 <= operands[7]):
+            return IComplex("undefined")
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(-1)
+        limits = _div_limits(*operands)
+        rounding.set_mode(rounding_mode_backup)
+        return IComplex(_ireal(limits[0], limits[1]),
+            _ireal(limits[2], limits[3]))
+
+    def __rdiv__(self, other):
+        return IComplex(*_parts(other)) / self
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def __eq__(self, other):
+        """Equality operator
+
+        Some examples:
+
+        >>> IComplex(1, 2) == 1+2j
+        True
+        >>> IComplex(1, IReal(1, 2)) != IComplex(1, 1)
+        True
+        """
+        real, imag = _parts(other)
+        return self._real == real and self._imag == imag
+
+    __ne__ = lambda self, other: not self == other
+
+    def __contains__(self, other):
+        """Tests if "other" is an element or a subset of the rectangle
+
+        Some examples:
+
+        >>> 1+1j in IComplex(IReal(0, 2), IReal(0, 2))
+        True
+        >>> 3j in IComplex(IReal(0, 2), IReal(0, 2))
+        False
+        """
+        real, imag = _parts(other)
+        return real in self._real and imag in self._imag
+
+    def __repr__(self):
+        """Gives a representation of the complex interval
+
+        Some examples:
+
+        >>> IComplex(IReal(-1, 1), 2)
+        ([-1.0, 1.0] + [2.0, 2.0]j)
+        """
+        if self.empty:
+            return "empty complex interval"
+        if self.undefined:
+            return "undefined complex interval"
+        return "(%r + %rj)" % (self._real, self._imag)
@@ -28,4 +28,31 @@ It was developed in CIn/UFPE (Brazil) by Rafael Menezes Barreto
 
 
 from intpy.ireal import irmath
+from intpy.ireal.accumulator import *
+from intpy.ireal.accurate import *
 from intpy.ireal.ireal import *
+from intpy.ireal.irealmp import *
+from intpy.ireal.irarray import *
+from intpy.ireal.irunion import *
+from intpy.ireal.midrad import *
+from intpy.ireal.stats import *
+
+
+__all__ = [
+    "IAccumulator",
+    "IReal",
+    "IRealArray",
+    "IRealMP",
+    "IRealUnion",
+    "IStatistics",
+    "MidRad",
+    "MidRadArray",
+    "accurate_dot",
+    "accurate_sum",
+    "extended_div",
+    "get_mp_precision",
+    "irmath",
+    "mp_precision",
+    "refine_precision",
+    "set_mp_precision"
+]
@@ -0,0 +1,268 @@
+# ireal/accumulator.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IAccumulator class module
+
+This module contains a mutable Real Interval meant to accumulate sums and
+products in loops. IReal objects are immutable, so "acc = acc + term" builds a
+new one per iteration; an IAccumulator updates its limits in place instead.
+The infimum is kept negated, so every update runs with the rounding mode set
+upwards only, and the batch methods switch the rounding mode once for all the
+terms.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.ireal.ireal import IReal
+from intpy.ireal.ireal import _from_limits
+from intpy.ireal.ireal import _mul_operands
+from intpy.ireal.ireal import _operand_limits
+from intpy.support import rounding
+
+
+__all__ = [
+    "IAccumulator"
+]
+
+
+def _limits(other):
+    """Returns the limits of an operand, accepting other accumulators too"""
+    if type(other) == IAccumulator:
+        return (-other._ninf, other._sup)
+    limits = _operand_limits(other)
+    if limits is None:
+        raise TypeError("unsupported operand type for IAccumulator: %r" %
+            type(other).__name__)
+    return limits
+
+
+class IAccumulator(object):
+    """A mutable Real Interval for accumulating sums and products
+
+    The in-place operators +=, -= and *= update the limits of the accumulator
+    with no new objects, and extend() and extend_products() add a whole
+    sequence of terms with a single switch of the rounding mode. Operands are
+    anything accepted by the IReal operators. The current value is given as an
+    IReal by the value property. Being mutable, accumulators aren't hashable
+    and don't take part in the other IReal operations.
+    """
+
+    __hash__ = None
+
+    def __init__(self, start=0.0):
+        """Constructor of the IAccumulator class
+
+        Some examples:
+
+        >>> IAccumulator()
+        IAccumulator([0.0, 0.0])
+        >>> IAccumulator(IReal(1, 2))
+        IAccumulator([1.0, 2.0])
+        >>> IAccumulator(IReal()) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        """
+        inf, sup = _limits(start)
+        self._ninf, self._sup = -inf, sup
+
+    def value(self):
+        inf, sup = -self._ninf, self._sup
+        if inf != inf or sup != sup:
+            return IReal("undefined")
+        return _from_limits(inf, sup)
+
+    value = property(fget=value)
+
+    def __repr__(self):
+        return "IAccumulator(%r)" % self.value
+
+    def __iadd__(self, other):
+        """In-place plus operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> acc = IAccumulator()
+        >>> for i in range(10):
+        ...     acc += "0.1"
+        >>> acc.value.inf < 1 < acc.value.sup
+        True
+        >>> acc += IAccumulator(IReal(-1, 1)); acc.value.diameter() > 2
+        True
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        inf, sup = _limits(other)
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        self._ninf = self._ninf - inf
+        self._sup = self._sup + sup
+        rounding.set_mode(rounding_mode_backup)
+        return self
+
+    def __isub__(self, other):
+        """In-place minus operator
+
+        Some examples:
+
+        >>> acc = IAccumulator(IReal(1, 2))
+        >>> acc -= IReal(0.5, 0.75); acc
+        IAccumulator([0.25, 1.5])
+        """
+        inf, sup = _limits(other)
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        self._ninf = self._ninf + sup
+        self._sup = self._sup - inf
+        rounding.set_mode(rounding_mode_backup)
+        return self
+
+    def __imul__(self, other):
+        """In-place multiplication operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> acc = IAccumulator(IReal(-1, 2))
+        >>> acc *= IReal(3, 4); acc
+        IAccumulator([-4.0, 8.0])
+        >>> acc *= "0.1"; acc.value.inf < acc.value.sup
+        True
+        >>> acc.value == IReal(-1, 2) * IReal(3, 4) * "0.1"
+        True
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        inf, sup = _limits(other)
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        self._ninf, self._sup = _product(-self._ninf, self._sup, inf, sup)
+        rounding.set_mode(rounding_mode_backup)
+        return self
+
+    def extend(self, values):
+        """Adds all the values to the accumulator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> acc = IAccumulator(); acc.extend([1, IReal(-1, 2), 0.5]); acc
+        IAccumulator([0.5, 3.5])
+        >>> acc = IAccumulator(); acc.extend(["0.1"] * 10)
+        >>> acc.value.inf < 1 < acc.value.sup
+        True
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        ninf, sup = self._ninf, self._sup
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        try:
+            for value in values:
+                if type(value) == float:
+                    ninf = ninf - value
+                    sup = sup + value
+                else:
+                    inf2, sup2 = _limits(value)
+                    ninf = ninf - inf2
+                    sup = sup + sup2
+        finally:
+            rounding.set_mode(rounding_mode_backup)
+        self._ninf, self._sup = ninf, sup
+
+    def extend_products(self, xs, ys):
+        """Adds the products of the pairs of values to the accumulator
+
+        It's the dot product of the sequences if the accumulator starts at
+        zero. Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> acc = IAccumulator()
+        >>> acc.extend_products([IReal(1, 2), -1], [IReal(-1, 1), 3]); acc
+        IAccumulator([-5.0, -1.0])
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        xs = [_limits(x) for x in xs]
+        ys = [_limits(y) for y in ys]
+        if len(xs) != len(ys):
+            raise ValueError("sequences of different lengths can't be operated")
+        ninf, sup = self._ninf, self._sup
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        for (x1, y1), (x2, y2) in zip(xs, ys):
+            ninf2, sup2 = _product(x1, y1, x2, y2)
+            ninf = ninf + ninf2
+            sup = sup + sup2
+        rounding.set_mode(rounding_mode_backup)
+        self._ninf, self._sup = ninf, sup
+
+
+def _product(x1, y1, x2, y2):
+    """Returns the negated infimum and the supremum of [x1, y1]*[x2, y2]
+
+    The rounding mode must be set upwards.
+    """
+    operands = _mul_operands(x1, y1, x2, y2)
+    if operands is None:
+        return (max(-x1 * y2, -y1 * x2), max(x1 * x2, y1 * y2))
+    return (-operands[0] * operands[1], operands[2] * operands[3])
+
+
+def _benchmark(n=100000):
+    """Reports the time of long accumulation loops"""
+    from random import random
+    from time import time
+    terms = [IReal(-random(), random()) for i in range(n)]
+    floats = [random() for i in range(n)]
+    results = []
+    start = time()
+    acc = IReal(0)
+    for term in terms:
+        acc = acc + term
+    results.append(("IReal sum", time() - start))
+    start = time()
+    acc = IAccumulator()
+    for term in terms:
+        acc += term
+    results.append(("IAccumulator +=", time() - start))
+    start = time()
+    IAccumulator().extend(terms)
+    results.append(("IAccumulator.extend", time() - start))
+    start = time()
+    acc = IReal(0)
+    for term in floats:
+        acc = acc + term
+    results.append(("IReal float sum", time() - start))
+    start = time()
+    IAccumulator().extend(floats)
+    results.append(("extend of floats", time() - start))
+    start = time()
+    acc = IReal(0)
+    for x, y in zip(terms, terms):
+        acc = acc + x * y
+    results.append(("IReal dot", time() - start))
+    start = time()
+    IAccumulator().extend_products(terms, terms)
+    results.append(("extend_products", time() - start))
+    for name, elapsed in results:
+        print("%-20s %10.4f s %12.0f terms/s" % (name, elapsed, n / elapsed))
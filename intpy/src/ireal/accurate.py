@@ -0,0 +1,286 @@
+# ireal/accurate.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Accurate sums and dot products module
+
+Sums and dot products with directed rounding widen the result by a rounding
+error per term. Here they are computed exactly instead, in the spirit of the
+exact scalar product of Kulisch [1]: each product of floats is split into its
+rounded value and its rounding error by an error-free transformation [2], and
+the exact sum of all the pieces is rounded with math.fsum, which is exact up
+to its final rounding [3]. The sign of what fsum left behind gives the other
+limit, so the result is the tightest interval around the exact value. The
+same algorithm, with fma for the products, runs in C in the rounding
+extension, and the Python code only does the dot products it declines.
+
+[1] Kulisch, U. W., Miranker, W. L., Computer Arithmetic in Theory and
+    Practice. Academic Press, 1981.
+[2] Ogita, T., Rump, S. M., Oishi, S., Accurate Sum and Dot Product. SIAM
+    Journal on Scientific Computing 26(6), 2005.
+[3] Shewchuk, J. R., Adaptive Precision Floating-Point Arithmetic and Fast
+    Robust Geometric Predicates. Discrete & Computational Geometry 18, 1997.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+import math
+from fractions import Fraction
+
+from intpy.ireal.accumulator import IAccumulator
+from intpy.ireal.irarray import IRealArray
+from intpy.ireal.ireal import IReal
+from intpy.ireal.ireal import _from_limits
+from intpy.ireal.ireal import _mul_operands
+from intpy.ireal.ireal import _operand_limits
+from intpy.support import NaN
+from intpy.support import PosInf
+from intpy.support import fraction2floats
+from intpy.support import nextafter
+from intpy.support import rounding
+
+
+__all__ = [
+    "accurate_dot",
+    "accurate_sum"
+]
+
+
+# Veltkamp's constant splitting a double in two halves of 26 bits
+_SPLITTER = 134217729.0
+
+# The error-free transformation of products is exact only if the factors
+# aren't too large to be split and the products don't fall in the subnormal
+# range; the few dot products out of these bounds are done with fractions
+_MAX_FACTOR = 2.0 ** 995
+_MIN_PRODUCT = 2.0 ** -969
+
+_fma = getattr(math, "fma", None)
+
+
+def _limits(values):
+    """Returns the lists of infimums and supremums of a sequence of values"""
+    if type(values) == IRealArray:
+        return list(values.inf), list(values.sup)
+    values = list(values)
+    if set(map(type, values)) == set([float]):
+        return values, values
+    limits = [_operand_limits(x) for x in values]
+    if None in limits:
+        raise TypeError("unsupported operand type for accurate sums")
+    return [x[0] for x in limits], [x[1] for x in limits]
+
+
+def _split_products(xs, ys):
+    """Returns the products and their rounding errors, whose sums are exact
+
+    It's TwoProduct of Dekker, or a fused multiply-add where Python has it.
+    The rounding mode must be to the nearest. Some examples:
+
+    >>> _split_products([0.1], [0.1])
+    ([0.010000000000000002], [-8.326672684688674e-19])
+    """
+    products = [x * y for x, y in zip(xs, ys)]
+    if _fma is not None:
+        return products, [_fma(x, y, -p) for x, y, p in zip(xs, ys,
+            products)]
+    # The high halves of the factors, the low ones being x - xh and y - yh
+    xhs = [c - (c - x) for x, c in zip(xs, [_SPLITTER * x for x in xs])]
+    yhs = [c - (c - y) for y, c in zip(ys, [_SPLITTER * y for y in ys])]
+    errors = [(x - xh) * (y - yh) - (((p - xh * yh) - (x - xh) * yh) - \
+        xh * (y - yh)) for x, xh, y, yh, p in zip(xs, xhs, ys, yhs, products)]
+    return products, errors
+
+
+def _round(terms):
+    """Rounds the exact sum of floats to the nearest float, down and up
+
+    The rounding mode must be to the nearest. Some examples:
+
+    >>> _round([1.0, 2.0 ** -60])
+    (1.0, 1.0000000000000002)
+    >>> _round([1.0, -2.0 ** -60])
+    (0.9999999999999999, 1.0)
+    >>> _round([0.5, 0.25])
+    (0.75, 0.75)
+    """
+    nearest = math.fsum(terms)
+    terms.append(-nearest)
+    residual = math.fsum(terms)
+    terms.pop()
+    if residual > 0.0:
+        return nearest, nextafter(nearest, PosInf)
+    if residual < 0.0:
+        return nextafter(nearest, -PosInf), nearest
+    return nearest, nearest
+
+
+def _dot_limits(xs, ys):
+    """Rounds the exact dot product of floats downwards and upwards
+
+    The rounding mode must be to the nearest. Some examples:
+
+    >>> _dot_limits([3.0, 1e308], [1.0, 1e308])
+    (1.7976931348623157e+308, inf)
+    >>> _dot_limits([1e-200, 1.0], [1e-200, 1.0])
+    (1.0, 1.0000000000000002)
+    """
+    if max(xs + ys) < _MAX_FACTOR and -min(xs + ys) < _MAX_FACTOR:
+        products, errors = _split_products(xs, ys)
+        underflows = [1 for x, y, p in zip(xs, ys, products) if \
+            -_MIN_PRODUCT < p < _MIN_PRODUCT and x != 0.0 and y != 0.0]
+        if not underflows and max(products) < PosInf and \
+            -min(products) < PosInf:
+            try:
+                return _round(products + errors)
+            except OverflowError:
+                pass
+    return fraction2floats(sum([Fraction(x) * Fraction(y) for x, y in \
+        zip(xs, ys)], Fraction(0)))
+
+
+def _selected(x1, y1, x2, y2, lower):
+    """Selects the endpoints whose exact product bounds the product of the
+    intervals [x1, y1] and [x2, y2] from below or from above"""
+    operands = _mul_operands(x1, y1, x2, y2)
+    if operands is not None:
+        return operands[0:2] if lower else operands[2:4]
+    first, second = ((x1, y2), (y1, x2)) if lower else ((x1, x2), (y1, y2))
+    # Rounding to the nearest is monotonic, so the rounded products order
+    # the exact ones unless they tie, e.g. both overflowing, when the exact
+    # products decide
+    p1, p2 = first[0] * first[1], second[0] * second[1]
+    if p1 == p2:
+        p1 = Fraction(first[0]) * Fraction(first[1])
+        p2 = Fraction(second[0]) * Fraction(second[1])
+    if (p1 < p2) == lower:
+        return first
+    return second
+
+
+def accurate_dot(xs, ys):
+    """Encloses the dot product of two sequences in the tightest interval
+
+    The sequences are IRealArrays or sequences of anything accepted by the
+    IReal operators. For intervals, the result is the tightest interval
+    around the exact set of the dot products of their elements. Some
+    examples:
+
+    >>> rounding_mode_backup = rounding.get_mode()
+    >>> accurate_dot([1e20, 1.0, -1e20], [1.0, 1.0, 1.0])
+    [1.0, 1.0]
+    >>> accurate_dot(["0.1"] * 10, [1] * 10).diameter() < 1e-15
+    True
+    >>> accurate_dot(IRealArray([IReal(1, 2), -1]), [IReal(-1, 1), 3])
+    [-5.0, -1.0]
+    >>> accurate_dot([1e300, 1e-300], [1e8, 1e-100])
+    [1e+308, 1.0000000000000002e+308]
+    >>> accurate_dot([1e300, -1e300], [1e300, 1e300])
+    [0.0, 0.0]
+    >>> accurate_dot([IReal(-2e300, 1e300), 1e300],
+    ...     [IReal(-1e300, 1e300), 1e300])
+    [-inf, inf]
+    >>> x = accurate_dot([2.0 ** -600, 1.0], [2.0 ** -500, 1.0])
+    >>> x.inf == 1.0 and x.sup == nextafter(1.0, 2.0)
+    True
+    >>> accurate_dot([NaN], [1])
+    undefined interval
+    >>> rounding_mode_backup == rounding.get_mode()
+    True
+    """
+    inf1, sup1 = _limits(xs)
+    inf2, sup2 = _limits(ys)
+    if len(inf1) != len(inf2):
+        raise ValueError("sequences of different lengths can't be operated")
+    if inf1 == sup1 and inf2 == sup2:
+        sup1, sup2 = inf1, inf2
+    # The rounding extension does the whole dot product in C, except when
+    # some limit isn't finite or some product can't be split exactly
+    limits = rounding.dot(inf1, sup1, inf2, sup2)
+    if limits is not None:
+        return _from_limits(*limits)
+    limits = inf1 + sup1 + inf2 + sup2
+    if not limits:
+        return IReal(0)
+    if [x for x in limits if x != x]:
+        return IReal("undefined")
+    if max(limits) == PosInf or min(limits) == -PosInf:
+        # The exact sums are meaningless, so it's the usual dot product
+        acc = IAccumulator()
+        acc.extend_products(IRealArray.from_limits(inf1, sup1),
+            IRealArray.from_limits(inf2, sup2))
+        return acc.value
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(0)
+    try:
+        if inf1 is sup1 and inf2 is sup2:
+            inf, sup = _dot_limits(inf1, inf2)
+        else:
+            operands = [(_selected(x1, y1, x2, y2, True),
+                _selected(x1, y1, x2, y2, False)) for x1, y1, x2, y2 in \
+                zip(inf1, sup1, inf2, sup2)]
+            inf = _dot_limits([x[0][0] for x in operands],
+                [x[0][1] for x in operands])[0]
+            sup = _dot_limits([x[1][0] for x in operands],
+                [x[1][1] for x in operands])[1]
+    finally:
+        rounding.set_mode(rounding_mode_backup)
+    return _from_limits(inf, sup)
+
+
+def accurate_sum(values):
+    """Encloses the sum of a sequence in the tightest interval
+
+    Some examples:
+
+    >>> accurate_sum([1e20, 0.1, -1e20]) == IReal(0.1)
+    True
+    >>> accurate_sum(IRealArray([IReal(1, 2), "0.1"])).diameter() < 1.0001
+    True
+    >>> accurate_sum([])
+    [0.0, 0.0]
+    """
+    inf, sup = _limits(values)
+    return accurate_dot(IRealArray.from_limits(inf, sup), [1.0] * len(inf))
+
+
+def _benchmark(n=100000):
+    """Reports the time of accurate dot products against other ones"""
+    from random import random
+    from time import time
+    xs = [random() - 0.5 for i in range(n)]
+    ys = [random() - 0.5 for i in range(n)]
+    results = []
+    start = time()
+    sum([x * y for x, y in zip(xs, ys)])
+    plain = time() - start
+    results.append(("float dot", plain))
+    start = time()
+    accurate_dot(xs, ys)
+    results.append(("accurate_dot", time() - start))
+    start = time()
+    IAccumulator().extend_products(xs, ys)
+    results.append(("extend_products", time() - start))
+    x, y = IRealArray(xs), IRealArray(ys) + IReal(0, 1e-3)
+    start = time()
+    accurate_dot(x, y)
+    results.append(("accurate_dot of intervals", time() - start))
+    for name, elapsed in results:
+        print("%-28s %8.4f s %6.1fx" % (name, elapsed, elapsed / plain))
@@ -0,0 +1,646 @@
+# ireal/irarray.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IRealArray class module
+
+This module contains an implementation of arrays of Real Intervals. The limits
+of the elements are kept in two contiguous buffers of floats, so an operation
+over the whole array is done with a single pair of rounding mode switches and
+without building an IReal object for each element.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from itertools import compress
+from itertools import repeat
+from operator import and_
+from operator import eq
+from operator import ge
+from operator import gt
+from operator import itemgetter
+from operator import le
+from operator import lt
+from operator import ne
+
+from intpy.errors import EmptyIntervalError
+from intpy.ireal.ireal import IReal
+from intpy.ireal.ireal import _div_operands
+from intpy.ireal.ireal import _mul_operands
+from intpy.ireal.ireal import _operand_limits
+from intpy.support import NaN
+from intpy.support import isnan
+from intpy.support import rounding
+
+
+__all__ = [
+    "IRealArray"
+]
+
+
+def _ireal(inf, sup):
+    """Builds an IReal from limits already rounded, skipping the parsing
+
+    >>> _ireal(0.25, 0.5)
+    [0.25, 0.5]
+    >>> _ireal(NaN, NaN)
+    undefined interval
+    """
+    ret = IReal.__new__(IReal)
+    ret._inf, ret._sup, ret._empty = inf, sup, False
+    return ret
+
+
+def _broadcast(other, length):
+    """Returns the limits of an operand as sequences of the given length
+
+    >>> [list(limits) for limits in _broadcast(2, 3)]
+    [[2.0, 2.0, 2.0], [2.0, 2.0, 2.0]]
+    >>> _broadcast(IRealArray([1, 2]), 3) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError: arrays of different lengths...
+    >>> _broadcast(IReal(), 3) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    EmptyIntervalError:...
+    """
+    if type(other) == IRealArray:
+        if len(other) != length:
+            raise ValueError("arrays of different lengths can't be operated")
+        return other._inf, other._sup
+    limits = _operand_limits(other)
+    if limits is None:
+        raise TypeError("unsupported operand type for IRealArray: %r" %
+            type(other).__name__)
+    return repeat(limits[0], length), repeat(limits[1], length)
+
+
+class IRealArray(object):
+    """An array of Real Intervals
+
+    The elements are stored as two buffers of floats, one for the infimums and
+    another for the supremums, and the arithmetic operators work element by
+    element on them. An IReal, or anything accepted by the IReal constructor,
+    can be used as operand and it's broadcast to all the elements. Undefined
+    intervals are represented by NaN limits as in IReal, but empty intervals
+    can't be held by an array.
+
+    The comparisons give masks telling which elements are certainly or
+    possibly in a relation, and the elements can be sorted, selected and
+    searched by their limits, all done on the buffers with no IReal objects
+    built. Undefined elements are never in a relation, and are sorted last.
+    """
+
+    def __init__(self, intervals=()):
+        """Constructor of the IRealArray class
+
+        For more information about the IRealArray class, see the class
+        docstring. Some examples of how to use this constructor follow below:
+
+        >>> IRealArray([IReal(1, 2), "0.5", 3])
+        IRealArray([[1.0, 2.0], [0.5, 0.5], [3.0, 3.0]])
+        >>> IRealArray()
+        IRealArray([])
+        >>> IRealArray([IReal()]) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        """
+        self._inf, self._sup = array("d"), array("d")
+        for interval in intervals:
+            if type(interval) != IReal:
+                interval = IReal(interval)
+            if interval.empty:
+                raise EmptyIntervalError("arrays can't hold empty intervals")
+            self._inf.append(interval.inf)
+            self._sup.append(interval.sup)
+
+    def from_limits(inf, sup):
+        """Builds an array from the sequences of infimums and supremums
+
+        The limits are taken as they are, so they should have already been
+        rounded outwards when needed. Some examples:
+
+        >>> IRealArray.from_limits([1, -1], [2, 0])
+        IRealArray([[1.0, 2.0], [-1.0, 0.0]])
+        >>> f = IRealArray.from_limits
+        >>> f([1], [2, 3]) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        ret = IRealArray()
+        ret._inf, ret._sup = array("d", inf), array("d", sup)
+        if len(ret._inf) != len(ret._sup):
+            raise ValueError("'inf' and 'sup' must have the same length")
+        return ret
+
+    from_limits = staticmethod(from_limits)
+
+    inf = property(fget=lambda self: self._inf)
+    sup = property(fget=lambda self: self._sup)
+
+    def __len__(self):
+        return len(self._inf)
+
+    def __getitem__(self, index):
+        """Gives an element as an IReal or a slice as an IRealArray
+
+        Some examples:
+
+        >>> x = IRealArray([1, IReal(2, 3), "undefined"])
+        >>> x[1]; x[-1]
+        [2.0, 3.0]
+        undefined interval
+        >>> x[:2]
+        IRealArray([[1.0, 1.0], [2.0, 3.0]])
+        """
+        if type(index) == slice:
+            return IRealArray.from_limits(self._inf[index], self._sup[index])
+        return _ireal(self._inf[index], self._sup[index])
+
+    def __iter__(self):
+        for inf, sup in zip(self._inf, self._sup):
+            yield _ireal(inf, sup)
+
+    def __repr__(self):
+        """Gives a representation of the array
+
+        Some examples:
+
+        >>> IRealArray([IReal(-1, 1), NaN])
+        IRealArray([[-1.0, 1.0], undefined interval])
+        """
+        return "IRealArray([%s])" % ", ".join([repr(x) for x in self])
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        """Unary minus operator
+
+        Some examples:
+
+        >>> -IRealArray([IReal(-1, 2), 3])
+        IRealArray([[-2.0, 1.0], [-3.0, -3.0]])
+        """
+        return IRealArray.from_limits([-sup for sup in self._sup],
+            [-inf for inf in self._inf])
+
+    def __invert__(self):
+        """Inversion operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> ~IRealArray([IReal(0.25, 0.5), IReal(-2, 2)])
+        IRealArray([[2.0, 4.0], undefined interval])
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        return 1 / self
+
+    def __add__(self, other):
+        """Binary plus operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IRealArray([IReal(0.25, 0.5), 3]) + IRealArray([2, IReal(-1, 1)])
+        IRealArray([[2.25, 2.5], [2.0, 4.0]])
+        >>> x = IRealArray(["0.1", 1]) + "0.1"; x[0] == IReal("0.1") + "0.1"
+        True
+        >>> 2 + IRealArray([IReal(-0.75, 0.75)])
+        IRealArray([[1.25, 2.75]])
+        >>> IReal(1, 2) + IRealArray([1, 2])
+        IRealArray([[2.0, 3.0], [3.0, 4.0]])
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        inf2, sup2 = _broadcast(other, len(self))
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(-1)
+        inf = [x1 + x2 for x1, x2 in zip(self._inf, inf2)]
+        rounding.set_mode(1)
+        sup = [y1 + y2 for y1, y2 in zip(self._sup, sup2)]
+        rounding.set_mode(rounding_mode_backup)
+        return IRealArray.from_limits(inf, sup)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Binary minus operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IRealArray([IReal(0.25, 0.5), 3]) - IRealArray([2, IReal(-1, 1)])
+        IRealArray([[-1.75, -1.5], [2.0, 4.0]])
+        >>> 2 - IRealArray([IReal(-0.75, 0.75)])
+        IRealArray([[1.25, 2.75]])
+        >>> IReal(3, 4) - IRealArray([1, 2])
+        IRealArray([[2.0, 3.0], [1.0, 2.0]])
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        inf2, sup2 = _broadcast(other, len(self))
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(-1)
+        inf = [x1 - y2 for x1, y2 in zip(self._inf, sup2)]
+        rounding.set_mode(1)
+        sup = [y1 - x2 for y1, x2 in zip(self._sup, inf2)]
+        rounding.set_mode(rounding_mode_backup)
+        return IRealArray.from_limits(inf, sup)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IRealArray([IReal(0.25, 0.5), 2]) * IRealArray([IReal(2, 3), -1])
+        IRealArray([[0.5, 1.5], [-2.0, -2.0]])
+        >>> x = IRealArray(["0.1"]) * "0.1"; x[0] == IReal("0.1") * "0.1"
+        True
+        >>> 2 * IRealArray([IReal(-0.75, 0.75)])
+        IRealArray([[-1.5, 1.5]])
+        >>> from random import Random
+        >>> from intpy.ireal.ireal import _random_limits
+        >>> random = Random(0)
+        >>> x = [IReal(*_random_limits(random)) for i in range(1000)]
+        >>> y = [IReal(*_random_limits(random)) for i in range(1000)]
+        >>> list(IRealArray(x) * IRealArray(y)) == [a * b for a, b in zip(x, y)]
+        True
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        inf2, sup2 = _broadcast(other, len(self))
+        operands = [_mul_operands(x1, y1, x2, y2) or (x1, y1, x2, y2, None) \
+            for x1, y1, x2, y2 in zip(self._inf, self._sup, inf2, sup2)]
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(-1)
+        inf = [x[0] * x[1] if len(x) == 4 else min(x[0] * x[3], x[1] * x[2]) \
+            for x in operands]
+        rounding.set_mode(1)
+        sup = [x[2] * x[3] if len(x) == 4 else max(x[0] * x[2], x[1] * x[3]) \
+            for x in operands]
+        rounding.set_mode(rounding_mode_backup)
+        return IRealArray.from_limits(inf, sup)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Division operator
+
+        The elements whose divisor contains zero become undefined intervals.
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> IRealArray([IReal(0.25, 0.5), 1]) / IRealArray([IReal(2, 4), \
+IReal(-2, 2)])
+        IRealArray([[0.0625, 0.25], undefined interval])
+        >>> x = IRealArray(["0.1"]) / "0.1"; x[0] == IReal("0.1") / "0.1"
+        True
+        >>> from random import Random
+        >>> from intpy.ireal.ireal import _random_limits
+        >>> random = Random(0)
+        >>> x = [IReal(*_random_limits(random)) for i in range(1000)]
+        >>> y = [IReal(*_random_limits(random)) for i in range(1000)]
+        >>> y = [b for b in y if 0.0 not in b]
+        >>> list(IRealArray(x[:len(y)]) / IRealArray(y)) == [a / b for a, b in \
+zip(x, y)]
+        True
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        inf2, sup2 = _broadcast(other, len(self))
+        operands = [_div_operands(x1, y1, x2, y2) if not x2 <= 0.0 <= y2 \
+            else (NaN, 1.0, NaN, 1.0) for x1, y1, x2, y2 in \
+            zip(self._inf, self._sup, inf2, sup2)]
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(-1)
+        inf = [a / b for a, b, c, d in operands]
+        rounding.set_mode(1)
+        sup = [c / d for a, b, c, d in operands]
+        rounding.set_mode(rounding_mode_backup)
+        return IRealArray.from_limits(inf, sup)
+
+    def __rdiv__(self, other):
+        """Reflected division operator
+
+        Some examples:
+
+        >>> 1 / IRealArray([IReal(2, 4)])
+        IRealArray([[0.25, 0.5]])
+        >>> IReal(1, 2) / IRealArray([IReal(2, 4)])
+        IRealArray([[0.25, 1.0]])
+        """
+        return IRealArray.from_limits(*_broadcast(other, len(self))) / self
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def diameter(self):
+        """Returns the diameters of the elements
+
+        Undefined elements have NaN diameters. Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> list(IRealArray([IReal(-10, 1), 2, NaN]).diameter())
+        [11.0, 0.0, nan]
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        ret = array("d", [sup - inf for inf, sup in zip(self._inf, self._sup)])
+        rounding.set_mode(rounding_mode_backup)
+        return ret
+
+    def middle(self):
+        """Returns the middle points of the elements
+
+        Undefined elements have NaN middle points. Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> list(IRealArray([IReal(-10, 5), 2]).middle())
+        [-2.5, 2.0]
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        ret = array("d", [(inf + sup) / 2.0 for inf, sup in \
+            zip(self._inf, self._sup)])
+        rounding.set_mode(rounding_mode_backup)
+        return ret
+
+    def hull(self):
+        """Convex union of all the elements
+
+        Some examples:
+
+        >>> IRealArray([IReal(-1, 0), IReal(0.25, 10)]).hull()
+        [-1.0, 10.0]
+        >>> IRealArray([1, "undefined"]).hull()
+        undefined interval
+        >>> IRealArray().hull()
+        empty interval
+        """
+        if not len(self):
+            return IReal()
+        for inf, sup in zip(self._inf, self._sup):
+            if isnan(inf) or isnan(sup):
+                return IReal("undefined")
+        return _ireal(min(self._inf), max(self._sup))
+
+    def certainly_lt(self, other):
+        """Mask of the elements certainly less than 'other'
+
+        That is, every point of the element is less than every point of
+        'other'. Some examples:
+
+        >>> x = IRealArray([IReal(1, 2), IReal(2, 3), 4, "undefined"])
+        >>> list(x.certainly_lt(IReal(2.5, 3))); list(x.possibly_lt(2.5))
+        [1, 0, 0, 0]
+        [1, 1, 0, 0]
+        >>> list(x.certainly_le(2)); list(x.possibly_le(2))
+        [1, 0, 0, 0]
+        [1, 1, 0, 0]
+        >>> list(x.certainly_gt(1)); list(x.possibly_gt(IRealArray([2] * 4)))
+        [0, 1, 1, 0]
+        [0, 1, 1, 0]
+        >>> list(x.certainly_ge(2)); list(x.possibly_ge(3))
+        [0, 1, 1, 0]
+        [0, 1, 1, 0]
+        """
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(lt, self._sup, inf2))
+
+    def certainly_le(self, other):
+        """Mask of the elements certainly less than or equal to 'other'"""
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(le, self._sup, inf2))
+
+    def certainly_gt(self, other):
+        """Mask of the elements certainly greater than 'other'"""
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(gt, self._inf, sup2))
+
+    def certainly_ge(self, other):
+        """Mask of the elements certainly greater than or equal to 'other'"""
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(ge, self._inf, sup2))
+
+    def possibly_lt(self, other):
+        """Mask of the elements possibly less than 'other'
+
+        That is, some point of the element is less than some point of
+        'other'.
+        """
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(lt, self._inf, sup2))
+
+    def possibly_le(self, other):
+        """Mask of the elements possibly less than or equal to 'other'"""
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(le, self._inf, sup2))
+
+    def possibly_gt(self, other):
+        """Mask of the elements possibly greater than 'other'"""
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(gt, self._sup, inf2))
+
+    def possibly_ge(self, other):
+        """Mask of the elements possibly greater than or equal to 'other'"""
+        inf2, sup2 = _broadcast(other, len(self))
+        return array("B", map(ge, self._sup, inf2))
+
+    def overlapping(self, other):
+        """Returns the indexes of the elements intersecting 'other'
+
+        It's meant for queries of an interval over the array, but another
+        array is intersected element by element. For an array sorted by the
+        infimums, the candidates can be narrowed first by searchsorted().
+        Some examples:
+
+        >>> x = IRealArray([IReal(1, 2), IReal(2, 3), 4, "undefined"])
+        >>> x.overlapping(IReal(1.5, 2)); x.overlapping(IReal(3.5, 5))
+        [0, 1]
+        [2]
+        """
+        inf2, sup2 = _broadcast(other, len(self))
+        return list(compress(range(len(self)), map(and_,
+            map(le, self._inf, sup2), map(ge, self._sup, inf2))))
+
+    def compress(self, mask):
+        """Returns the array of the elements selected by a mask
+
+        Some examples:
+
+        >>> x = IRealArray([IReal(1, 2), IReal(2, 3), 4])
+        >>> x.compress(x.certainly_lt(3)); x.compress(x.possibly_ge(3))
+        IRealArray([[1.0, 2.0]])
+        IRealArray([[2.0, 3.0], [4.0, 4.0]])
+        """
+        return IRealArray.from_limits(compress(self._inf, mask),
+            compress(self._sup, mask))
+
+    def take(self, indexes):
+        """Returns the array of the elements at a sequence of indexes
+
+        Some examples:
+
+        >>> IRealArray([IReal(1, 2), IReal(2, 3), 4]).take([2, 0])
+        IRealArray([[4.0, 4.0], [1.0, 2.0]])
+        """
+        if len(indexes) < 2:
+            return IRealArray.from_limits([self._inf[i] for i in indexes],
+                [self._sup[i] for i in indexes])
+        items = itemgetter(*indexes)
+        return IRealArray.from_limits(items(self._inf), items(self._sup))
+
+    def _keys(self, key):
+        """Returns the sort keys of the elements, given by their name"""
+        if key == "inf":
+            return self._inf
+        if key == "sup":
+            return self._sup
+        if key == "middle":
+            return self.middle()
+        if key == "diameter":
+            return self.diameter()
+        raise ValueError("unknown sort key: %r" % (key,))
+
+    def argsort(self, key="inf", reverse=False):
+        """Returns the indexes sorting the elements by a key
+
+        The key is "inf", "sup", "middle" or "diameter", and the sort is
+        stable, the undefined elements being left last. Some examples:
+
+        >>> x = IRealArray([IReal(2, 3), "undefined", IReal(-1, 10), 1])
+        >>> x.argsort(); x.argsort("sup", reverse=True)
+        [2, 3, 0, 1]
+        [2, 0, 3, 1]
+        >>> x.argsort("middle"); x.argsort("diameter")
+        [3, 0, 2, 1]
+        [3, 0, 2, 1]
+        >>> x.argsort("width") # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        keys = self._keys(key)
+        indexes = range(len(self))
+        if not any(map(ne, keys, keys)):
+            return sorted(indexes, key=keys.__getitem__, reverse=reverse)
+        ret = sorted(compress(indexes, map(eq, keys, keys)),
+            key=keys.__getitem__, reverse=reverse)
+        ret.extend(compress(indexes, map(ne, keys, keys)))
+        return ret
+
+    def sorted(self, key="inf", reverse=False):
+        """Returns the array sorted by a key, as given by argsort()
+
+        Some examples:
+
+        >>> IRealArray([IReal(2, 3), "undefined", IReal(-1, 10)]).sorted()
+        IRealArray([[-1.0, 10.0], [2.0, 3.0], undefined interval])
+        """
+        return self.take(self.argsort(key, reverse))
+
+    def searchsorted(self, values, side="left", key="inf"):
+        """Finds where values would be inserted keeping the array sorted
+
+        The array must be sorted by the key as given by sorted(), the
+        undefined elements being ignored. As with bisect, "left" gives the
+        first suitable position and "right" the last one. 'values' is a
+        number or a sequence of them. Some examples:
+
+        >>> x = IRealArray([1, IReal(2, 5), IReal(2, 3), 4, "undefined"])
+        >>> x.searchsorted(2); x.searchsorted(2, "right")
+        1
+        3
+        >>> x.searchsorted([0, 3.5, 9])
+        [0, 3, 4]
+        >>> x.sorted("sup").searchsorted(3, key="sup")
+        1
+        >>> x.searchsorted(2, "middle") # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        if side not in ("left", "right"):
+            raise ValueError("side must be 'left' or 'right', not %r" %
+                (side,))
+        search = bisect_left if side == "left" else bisect_right
+        keys = self._keys(key)
+        size = len(keys)
+        while size and isnan(keys[size - 1]):
+            size -= 1
+        if hasattr(values, "__iter__") and not isinstance(values, str):
+            return [search(keys, value, 0, size) for value in values]
+        return search(keys, values, 0, size)
+
+
+def _benchmark(n=1000000, seed=0):
+    """Reports the time of sorting and partitioning intervals"""
+    from random import Random
+    from time import time
+    random = Random(seed)
+    x = IRealArray.from_limits(*zip(*[sorted([random.uniform(-1, 1),
+        random.uniform(-1, 1)]) for i in range(n)]))
+    elements = list(x)
+    query = IReal(-0.01, 0.01)
+    results = []
+    start = time()
+    sorted(elements, key=lambda element: element.inf)
+    results.append(("sorted by inf", "IReals", time() - start))
+    start = time()
+    x.sorted()
+    results.append(("sorted by inf", "IRealArray", time() - start))
+    start = time()
+    sorted(elements, key=lambda element: element.middle())
+    results.append(("sorted by middle", "IReals", time() - start))
+    start = time()
+    x.sorted("middle")
+    results.append(("sorted by middle", "IRealArray", time() - start))
+    start = time()
+    [element for element in elements if element < query]
+    results.append(("partition", "IReals", time() - start))
+    start = time()
+    x.compress(x.certainly_lt(query))
+    results.append(("partition", "IRealArray", time() - start))
+    start = time()
+    [i for i, element in enumerate(elements) if not (element & query).empty]
+    results.append(("overlap query", "IReals", time() - start))
+    start = time()
+    x.overlapping(query)
+    results.append(("overlap query", "IRealArray", time() - start))
+    for name, kind, elapsed in results:
+        print("%-18s %-10s %8.4f s %12.0f intervals/s" % (name, kind,
+            elapsed, n / elapsed))
@@ -0,0 +1,748 @@
+# ireal/irealmp.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IRealMP class module
+
+This module contains Real Intervals whose limits are binary numbers of any
+precision, for the computations needing more than the 53 bits of the floats.
+A limit is a fraction whose denominator is a power of two and whose numerator
+has at most 'prec' bits, and each operation computes the exact result with
+Python integers and rounds it outwards to 'prec' bits. It doesn't depend on
+the rounding mode of the FPU, and the limits never overflow.
+
+The precision of new intervals comes from a per-thread context, and
+refine_precision raises it until an enclosure is as thin as requested.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+import threading
+from contextlib import contextmanager
+from fractions import Fraction
+
+from intpy.errors import EmptyIntervalError
+from intpy.errors import UndefinedIntervalError
+from intpy.ireal.ireal import IReal
+from intpy.ireal.ireal import _div_operands
+from intpy.ireal.ireal import _from_limits
+from intpy.ireal.ireal import _mul_operands
+from intpy.support import PosInf
+from intpy.support import fraction2floats
+from intpy.support import rational2fraction
+
+
+__all__ = [
+    "IRealMP",
+    "get_mp_precision",
+    "mp_precision",
+    "refine_precision",
+    "set_mp_precision"
+]
+
+
+_DEFAULT_PRECISION = 128
+
+_context = threading.local()
+
+
+def get_mp_precision():
+    """Returns the precision of the new IRealMPs in the current thread"""
+    return getattr(_context, "prec", _DEFAULT_PRECISION)
+
+
+def set_mp_precision(prec):
+    """Sets the precision of the new IRealMPs in the current thread
+
+    Some examples:
+
+    >>> prec_backup = get_mp_precision()
+    >>> set_mp_precision(64); IRealMP(1).prec
+    64
+    >>> set_mp_precision(1) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError:...
+    >>> set_mp_precision(prec_backup)
+    """
+    _context.prec = _check_precision(prec)
+
+
+@contextmanager
+def mp_precision(prec):
+    """Context manager setting the precision of the new IRealMPs
+
+    Some examples:
+
+    >>> with mp_precision(256):
+    ...     IRealMP("0.1").prec
+    256
+    >>> get_mp_precision()
+    128
+    """
+    prec_backup = get_mp_precision()
+    set_mp_precision(prec)
+    try:
+        yield prec
+    finally:
+        set_mp_precision(prec_backup)
+
+
+def _check_precision(prec):
+    prec = int(prec)
+    if prec < 2:
+        raise ValueError("the precision must be at least 2 bits")
+    return prec
+
+
+def _round(value, prec, direction):
+    """Rounds a fraction to 'prec' bits, downwards if 'direction' is negative
+    and upwards otherwise
+
+    Some examples:
+
+    >>> _round(Fraction(1, 3), 4, -1), _round(Fraction(1, 3), 4, 1)
+    (Fraction(5, 16), Fraction(11, 32))
+    >>> _round(Fraction(-1, 3), 4, -1)
+    Fraction(-11, 32)
+    >>> _round(Fraction(255), 4, 1), _round(Fraction(3, 8), 4, 1)
+    (Fraction(256, 1), Fraction(3, 8))
+    """
+    n, d = value.numerator, value.denominator
+    magnitude = abs(n)
+    if d & (d - 1) == 0 and magnitude.bit_length() <= prec:
+        return value
+    # The quotient of the scaled fraction has prec or prec + 1 bits
+    shift = prec - magnitude.bit_length() + d.bit_length()
+    if shift >= 0:
+        q, r = divmod(magnitude << shift, d)
+    else:
+        q, r = divmod(magnitude, d << -shift)
+    if q.bit_length() > prec:
+        q, r, shift = q >> 1, r or q & 1, shift - 1
+    if r and (n > 0) == (direction > 0):
+        q += 1
+    if n < 0:
+        q = -q
+    if shift >= 0:
+        return Fraction(q, 1 << shift)
+    return Fraction(q << -shift)
+
+
+def _exact_limit(value, lower):
+    """Returns the exact value of a limit given to the constructor
+
+    It's None for undefined limits, and of intervals the infimum or the
+    supremum is taken depending on 'lower'.
+    """
+    if type(value) == IReal or type(value) == IRealMP:
+        if value.empty:
+            raise EmptyIntervalError()
+        if value.undefined:
+            return None
+        value = value.inf if lower else value.sup
+    if type(value) == str:
+        if value == "undefined":
+            return None
+        n, d = rational2fraction(value)
+        return Fraction(n, d)
+    if type(value) == float:
+        if value != value:
+            return None
+        if value == PosInf or value == -PosInf:
+            raise ValueError("infinite limits can't be multi-precision")
+    try:
+        return Fraction(value)
+    except (TypeError, ValueError):
+        raise TypeError("unsupported type for the limits of an IRealMP")
+
+
+def _unbounded(value):
+    """Tells if a float or an IReal has an infinite limit
+
+    Such operands have no IRealMP holding them, so the operators leave them
+    to their reflected operators and a TypeError is raised at the end. Some
+    examples:
+
+    >>> _unbounded(IReal(0, PosInf)), _unbounded(-PosInf)
+    (True, True)
+    >>> _unbounded(IReal(0, 1)), _unbounded(IReal("undefined"))
+    (False, False)
+    """
+    if type(value) == IReal:
+        return not value.empty and (value.inf == -PosInf or \
+            value.sup == PosInf)
+    return type(value) == float and (value == PosInf or value == -PosInf)
+
+
+def _from_exact(inf, sup, prec):
+    """Builds an IRealMP from limits already rounded, None if undefined"""
+    ret = IRealMP.__new__(IRealMP)
+    ret._prec = prec
+    ret._empty = False
+    ret._inf, ret._sup = (inf, sup) if inf is not None and \
+        sup is not None else (None, None)
+    return ret
+
+
+def _decimal(value, digits, direction):
+    """Gives a decimal string of a fraction with 'digits' significant digits,
+    rounded downwards if 'direction' is negative and upwards otherwise
+
+    Some examples:
+
+    >>> _decimal(Fraction(1, 3), 5, -1), _decimal(Fraction(1, 3), 5, 1)
+    ('0.33333', '0.33334')
+    >>> _decimal(Fraction(-5, 2), 5, 1), _decimal(Fraction(10 ** 20), 5, 1)
+    ('-2.5', '1e+20')
+    >>> _decimal(Fraction(999999, 1000000), 3, 1), _decimal(Fraction(0), 3, 1)
+    ('1.0', '0.0')
+    """
+    n, d = value.numerator, value.denominator
+    if n == 0:
+        return "0.0"
+    if n < 0:
+        return "-" + _decimal(-value, digits, -direction)
+    # Scales the value by 10 ** scale to get an integer of 'digits' digits
+    scale = digits - len(str(n // d)) if n >= d else \
+        digits + len(str(d // n)) - 1
+    while True:
+        if scale >= 0:
+            q, r = divmod(n * 10 ** scale, d)
+        else:
+            q, r = divmod(n, d * 10 ** -scale)
+        if len(str(q)) > digits:
+            scale -= 1
+        elif len(str(q)) < digits:
+            scale += 1
+        else:
+            break
+    if r and direction > 0:
+        q += 1
+    text = str(q)
+    exponent = len(text) - 1 - scale
+    text = text.rstrip("0") or "0"
+    if -4 <= exponent < 16:
+        if exponent < 0:
+            return "0." + "0" * (-exponent - 1) + text
+        text = text + "0" * max(0, exponent + 1 - len(text))
+        return "%s.%s" % (text[:exponent+1], text[exponent+1:] or "0")
+    mantissa = text[0] + ("." + text[1:] if len(text) > 1 else "")
+    return "%se%+03d" % (mantissa, exponent)
+
+
+class IRealMP(object):
+    """Real Intervals whose limits have 'prec' bits of precision
+
+    The precision defaults to the one of the context, see mp_precision. The
+    limits are given as for IReal: numbers, strings of rational numbers,
+    fractions or intervals. Operations between intervals of different
+    precisions give the greatest of them, and the other operands, floats
+    included, are converted at the precision of the interval. It's also
+    obtained as IReal(inf, sup, prec=prec). Some examples:
+
+    >>> IRealMP("25/10", "1E1")
+    [2.5, 10.0]
+    >>> x = IRealMP("1e1000", prec=64); x.inf < 10 ** 1000 < x.sup, x.prec
+    (True, 64)
+    >>> IReal("1/3", prec=16)
+    [0.33332, 0.33334]
+    >>> IRealMP(); IRealMP("undefined")
+    empty interval
+    undefined interval
+    """
+
+    def __init__(self, inf=None, sup=None, prec=None):
+        self._prec = get_mp_precision() if prec is None else \
+            _check_precision(prec)
+        self._inf = self._sup = None
+        self._empty = inf is None
+        if self._empty:
+            return
+        inf, sup = _exact_limit(inf, True), _exact_limit(inf if sup is None \
+            else sup, False)
+        if inf is not None and sup is not None:
+            if inf > sup:
+                inf, sup = sup, inf
+            self._inf = _round(inf, self._prec, -1)
+            self._sup = _round(sup, self._prec, 1)
+
+    inf = property(fget=lambda self: self._inf)
+    sup = property(fget=lambda self: self._sup)
+    prec = property(fget=lambda self: self._prec)
+    empty = property(fget=lambda self: self._empty)
+    undefined = property(fget=lambda self: not self._empty and \
+        self._inf is None)
+
+    def _operand(self, other):
+        """Converts an operand to an IRealMP, None if it can't be converted"""
+        if type(other) == IRealMP:
+            if other._empty:
+                raise EmptyIntervalError()
+            return other
+        if _unbounded(other):
+            return None
+        try:
+            return IRealMP(other, prec=self._prec)
+        except TypeError:
+            return None
+
+    def __pos__(self):
+        if self._empty:
+            raise EmptyIntervalError()
+        return self
+
+    def __neg__(self):
+        """Unary minus operator
+
+        Some examples:
+
+        >>> -IRealMP("-25/100", 0.5)
+        [-0.5, 0.25]
+        >>> -IRealMP("undefined")
+        undefined interval
+        """
+        if self._empty:
+            raise EmptyIntervalError()
+        if self._inf is None:
+            return self
+        return _from_exact(-self._sup, -self._inf, self._prec)
+
+    def __invert__(self):
+        """Inversion operator
+
+        Some examples:
+
+        >>> ~IRealMP(0.25, 0.5)
+        [2.0, 4.0]
+        >>> ~IRealMP(-2, 2)
+        undefined interval
+        """
+        return 1 / self
+
+    def __add__(self, other):
+        """Binary plus operator
+
+        Some examples:
+
+        >>> IRealMP(0.25, 0.5) + 2
+        [2.25, 2.5]
+        >>> x = IRealMP(1e300, prec=4096) + 1e-300
+        >>> x.inf == Fraction(1e300) + Fraction(1e-300)
+        True
+        >>> 1 + IRealMP("undefined")
+        undefined interval
+        >>> IRealMP(2) + IRealMP() # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        >>> IRealMP(2) + IReal(0, PosInf) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        TypeError:...
+        """
+        other = self._operand(other)
+        if other is None:
+            return NotImplemented
+        if self._empty:
+            raise EmptyIntervalError()
+        prec = max(self._prec, other._prec)
+        if self._inf is None or other._inf is None:
+            return _from_exact(None, None, prec)
+        return _from_exact(_round(self._inf + other._inf, prec, -1),
+            _round(self._sup + other._sup, prec, 1), prec)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Binary minus operator
+
+        Some examples:
+
+        >>> IRealMP(0.25, 0.5) - IRealMP(2)
+        [-1.75, -1.5]
+        >>> 2 - IRealMP(0.25, 0.5)
+        [1.5, 1.75]
+        """
+        other = self._operand(other)
+        if other is None:
+            return NotImplemented
+        return self + -other
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def _operand_or_fail(self, other):
+        ret = self._operand(other)
+        if ret is None:
+            raise TypeError("unsupported operand for IRealMP, or one with "
+                "infinite limits")
+        return ret
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> IRealMP(0.25, 0.5) * IRealMP(2, 3)
+        [0.5, 1.5]
+        >>> IRealMP(-1, 2) * IRealMP(-3, 1)
+        [-6.0, 3.0]
+        >>> x = IRealMP("0.1") * "0.1"; x.inf < Fraction(1, 100) < x.sup
+        True
+        >>> -2 * IRealMP(0.25, 0.5)
+        [-1.0, -0.5]
+        """
+        other = self._operand(other)
+        if other is None:
+            return NotImplemented
+        if self._empty:
+            raise EmptyIntervalError()
+        prec = max(self._prec, other._prec)
+        if self._inf is None or other._inf is None:
+            return _from_exact(None, None, prec)
+        x1, y1, x2, y2 = self._inf, self._sup, other._inf, other._sup
+        operands = _mul_operands(x1, y1, x2, y2)
+        if operands is None:
+            inf, sup = min(x1*y2, y1*x2), max(x1*x2, y1*y2)
+        else:
+            inf = operands[0] * operands[1]
+            sup = operands[2] * operands[3]
+        return _from_exact(_round(inf, prec, -1), _round(sup, prec, 1), prec)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Division operator
+
+        Some examples:
+
+        >>> IRealMP(0.25, 0.5) / IRealMP(2, 4)
+        [0.0625, 0.25]
+        >>> x = IRealMP(1, prec=256) / 3; x.sup - x.inf < Fraction(1, 2**255)
+        True
+        >>> IRealMP(1) / IRealMP(-2, 2)
+        undefined interval
+        """
+        other = self._operand(other)
+        if other is None:
+            return NotImplemented
+        return _quotient(self, other)
+
+    def __rdiv__(self, other):
+        """Reflected division operator
+
+        Some examples:
+
+        >>> 1 / IRealMP(2, 4)
+        [0.25, 0.5]
+        """
+        other = self._operand(other)
+        if other is None:
+            return NotImplemented
+        return _quotient(other, self)
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def __and__(self, other):
+        """Intersection operator
+
+        Some examples:
+
+        >>> IRealMP(-1, 1) & IRealMP(0.25, 2)
+        [0.25, 1.0]
+        >>> IRealMP(-1, 0) & IRealMP(0.25, 10)
+        empty interval
+        """
+        other = self._operand(other) if type(other) != IRealMP else other
+        if other is None:
+            return NotImplemented
+        prec = max(self._prec, other._prec)
+        if self.undefined or other.undefined:
+            return _from_exact(None, None, prec)
+        if self._empty or other._empty:
+            return IRealMP(prec=prec)
+        inf, sup = max(self._inf, other._inf), min(self._sup, other._sup)
+        if inf <= sup:
+            return _from_exact(inf, sup, prec)
+        return IRealMP(prec=prec)
+
+    def __or__(self, other):
+        """Union operator, undefined for disjoint intervals
+
+        Some examples:
+
+        >>> IRealMP(-1, 0.25) | IRealMP(0.25, 2)
+        [-1.0, 2.0]
+        >>> IRealMP(-1, 0) | IRealMP(0.25, 10)
+        undefined interval
+        """
+        other = self._operand(other) if type(other) != IRealMP else other
+        if other is None:
+            return NotImplemented
+        if not (self.undefined or other.undefined or self._empty or \
+            other._empty) and max(self._inf, other._inf) > \
+            min(self._sup, other._sup):
+            return _from_exact(None, None, max(self._prec, other._prec))
+        return self.hull(other)
+
+    def __eq__(self, other):
+        """Equality operator
+
+        Some examples:
+
+        >>> IRealMP(-1, 1) == IReal(-1, 1)
+        True
+        >>> IRealMP("undefined") == IRealMP("undefined")
+        False
+        """
+        other = self._operand(other) if type(other) != IRealMP else other
+        if other is None:
+            return NotImplemented
+        return (self._empty and other._empty) or (self._inf is not None and \
+            self._inf == other._inf and self._sup == other._sup)
+
+    __ne__ = lambda self, other: not self == other
+
+    def __lt__(self, other):
+        """Less Than relation order operator
+
+        Some examples:
+
+        >>> IRealMP(2, 3) < 3.1, IRealMP(2, 3) < 2.5
+        (True, False)
+        """
+        other = self._operand_or_fail(other)
+        if self._empty:
+            raise EmptyIntervalError()
+        if self.undefined or other.undefined:
+            return False
+        return self._sup < other._inf
+
+    def __le__(self, other):
+        """Less Than Or Equal relation order operator
+
+        Some examples:
+
+        >>> IRealMP(2, 3) <= IRealMP(2.5, 3), IRealMP(2, 3) <= 2.5
+        (True, False)
+        """
+        if type(other) == IRealMP and self._empty and other._empty:
+            return True
+        other = self._operand_or_fail(other)
+        if self._empty:
+            raise EmptyIntervalError("this order relation can't be applied "
+                "to an empty and a non-empty interval")
+        if self.undefined or other.undefined:
+            return False
+        return self._inf <= other._inf and self._sup <= other._sup
+
+    def __gt__(self, other):
+        return self._operand_or_fail(other).__lt__(self)
+
+    def __ge__(self, other):
+        return self._operand_or_fail(other).__le__(self)
+
+    def __contains__(self, other):
+        """Tests if "other" is an element or a subset of the interval
+
+        Some examples:
+
+        >>> "0.1" in IRealMP(0, 1), IReal("0.1") in IRealMP("0.1")
+        (True, False)
+        >>> IRealMP() in IRealMP(-1), IReal() in IRealMP(-1)
+        (True, True)
+        >>> IReal(0, PosInf) in IRealMP(0, 1)
+        False
+        """
+        if _unbounded(other):
+            return False
+        if type(other) == IReal and other.empty:
+            other = IRealMP(prec=self._prec)
+        if type(other) != IRealMP:
+            other = IRealMP(other, prec=self._prec)
+        if self.undefined or other.undefined:
+            return False
+        if other._empty:
+            return True
+        if self._empty:
+            return False
+        return self._inf <= other._inf and other._sup <= self._sup
+
+    def __abs__(self):
+        """Returns the greatest absolute value in the interval, a fraction
+
+        Some examples:
+
+        >>> abs(IRealMP(-3, 1))
+        Fraction(3, 1)
+        """
+        self._check_limits()
+        return max(abs(self._inf), abs(self._sup))
+
+    def __repr__(self):
+        """Gives a representation of the interval
+
+        The limits are written with the decimal digits of their precision,
+        rounded outwards. Some examples:
+
+        >>> IRealMP(-1, 1)
+        [-1.0, 1.0]
+        >>> IRealMP("1/3", prec=53)
+        [0.3333333333333333, 0.3333333333333334]
+        """
+        if self._empty:
+            return "empty interval"
+        if self._inf is None:
+            return "undefined interval"
+        digits = len(str(1 << self._prec))
+        return "[%s, %s]" % (_decimal(self._inf, digits, -1),
+            _decimal(self._sup, digits, 1))
+
+    def _check_limits(self):
+        if self._empty:
+            raise EmptyIntervalError()
+        if self._inf is None:
+            raise UndefinedIntervalError()
+
+    def diameter(self):
+        """Returns the exact distance between supremum and infimum
+
+        Some examples:
+
+        >>> IRealMP(-10, 1).diameter()
+        Fraction(11, 1)
+        >>> IRealMP("undefined").diameter() # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        UndefinedIntervalError:...
+        """
+        self._check_limits()
+        return self._sup - self._inf
+
+    def middle(self):
+        """Returns the exact middle point of the interval
+
+        Some examples:
+
+        >>> IRealMP(-10, 5).middle()
+        Fraction(-5, 2)
+        """
+        self._check_limits()
+        return (self._inf + self._sup) / 2
+
+    def distance(self, other):
+        """Returns the exact Hausdorff distance of the intervals
+
+        Some examples:
+
+        >>> IRealMP(-10, 5).distance(IRealMP(10, 50))
+        Fraction(45, 1)
+        """
+        other = self._operand_or_fail(other)
+        self._check_limits()
+        other._check_limits()
+        return max(abs(self._inf - other._inf), abs(self._sup - other._sup))
+
+    def hull(self, other):
+        """Convex union operation
+
+        Some examples:
+
+        >>> IRealMP(-1, 0).hull(IRealMP(0.25, 10))
+        [-1.0, 10.0]
+        >>> IRealMP().hull(IRealMP())
+        empty interval
+        >>> IRealMP(1).hull(object()) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        TypeError:...
+        """
+        if type(other) != IRealMP:
+            other = self._operand_or_fail(other)
+        prec = max(self._prec, other._prec)
+        if self.undefined or other.undefined:
+            return _from_exact(None, None, prec)
+        if self._empty:
+            return other
+        if other._empty:
+            return self
+        return _from_exact(min(self._inf, other._inf),
+            max(self._sup, other._sup), prec)
+
+    def to_ireal(self):
+        """Returns the smallest IReal containing the interval
+
+        Some examples:
+
+        >>> IRealMP(0.5, 1).to_ireal()
+        [0.5, 1.0]
+        >>> x = IRealMP("0.1", prec=256).to_ireal(); x.inf < x.sup
+        True
+        >>> IRealMP("-1e400", "1e400").to_ireal()
+        [-inf, inf]
+        """
+        if self._empty:
+            return IReal()
+        if self._inf is None:
+            return IReal("undefined")
+        return _from_limits(fraction2floats(self._inf)[0],
+            fraction2floats(self._sup)[1])
+
+
+def _quotient(x, y):
+    """Returns x/y for IRealMPs, undefined if the divisor has zero"""
+    if x._empty or y._empty:
+        raise EmptyIntervalError()
+    prec = max(x._prec, y._prec)
+    if x._inf is None or y._inf is None or y._inf <= 0 <= y._sup:
+        return _from_exact(None, None, prec)
+    operands = _div_operands(x._inf, x._sup, y._inf, y._sup)
+    return _from_exact(_round(operands[0] / operands[1], prec, -1),
+        _round(operands[2] / operands[3], prec, 1), prec)
+
+
+def refine_precision(f, tol, prec=None, max_prec=65536):
+    """Evaluates 'f' raising the precision until its result is thin enough
+
+    The function 'f' takes no arguments and builds its intervals with the
+    precision of the context, which starts at 'prec' (default the current
+    one) and is doubled while the diameter of the result is greater than
+    'tol', up to 'max_prec'. It returns the last result; its precision is in
+    its 'prec' attribute. Some examples:
+
+    >>> f = lambda: ((1 + IRealMP("1e-30")) - 1) * 10 ** 30
+    >>> y = refine_precision(f, 1e-10, prec=53)
+    >>> y.prec, y.diameter() <= 1e-10
+    (212, True)
+    >>> y = refine_precision(lambda: IRealMP(1) / 0, 1e-10, prec=32,
+    ...     max_prec=64)
+    >>> y, y.prec
+    (undefined interval, 64)
+    """
+    prec = get_mp_precision() if prec is None else _check_precision(prec)
+    while True:
+        with mp_precision(prec):
+            ret = f()
+        if prec >= max_prec or (not ret.undefined and \
+            ret.diameter() <= tol):
+            return ret
+        prec = min(2 * prec, max_prec)
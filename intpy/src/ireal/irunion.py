@@ -0,0 +1,355 @@
+# ireal/irunion.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IRealUnion class module
+
+This module contains unions of disjoint Real Intervals and the extended
+division, which divides by intervals containing zero giving up to two
+unbounded intervals instead of an undefined one. Interval Newton methods and
+constraint propagation use them to discard the gap around a zero of the
+derivative. See:
+
+[1] Kahan, W. M., A More Complete Interval Arithmetic. Lecture notes,
+    University of Michigan, 1968.
+[2] Hansen, E., Walster, G. W., Global Optimization Using Interval Analysis.
+    2nd ed., Marcel Dekker, New York, 2004.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.ireal.ireal import IReal
+from intpy.ireal.ireal import _from_limits
+from intpy.ireal.ireal import _operand_limits
+from intpy.support import NegInf
+from intpy.support import PosInf
+from intpy.support import rounding
+
+
+__all__ = [
+    "IRealUnion",
+    "extended_div"
+]
+
+
+def _divided(numerator, low, high):
+    """Returns numerator/low rounded downwards and numerator/high upwards
+
+    An infinite divisor stands for the corresponding unbounded limit.
+    """
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(-1)
+    inf = NegInf if low == NegInf else numerator / low
+    rounding.set_mode(1)
+    sup = PosInf if high == PosInf else numerator / high
+    rounding.set_mode(rounding_mode_backup)
+    return inf, sup
+
+
+def extended_div(x, y):
+    """Extended division of intervals
+
+    Where the divisor doesn't contain zero, it's the usual division. Otherwise
+    the result is the set of all the quotients of the elements of the
+    operands, which is made of up to two unbounded intervals. It's always
+    given as an IRealUnion. Some examples:
+
+    >>> rounding_mode_backup = rounding.get_mode()
+    >>> extended_div(IReal(1, 2), IReal(-1, 4))
+    IRealUnion([[-inf, -1.0], [0.25, inf]])
+    >>> extended_div(IReal(-2, -1), IReal(0, 4))
+    IRealUnion([[-inf, -0.25]])
+    >>> extended_div(IReal(-2, -1), IReal(-4, 0))
+    IRealUnion([[0.25, inf]])
+    >>> extended_div(IReal(-1, 2), IReal(-1, 4))
+    IRealUnion([[-inf, inf]])
+    >>> extended_div(IReal(1, 2), IReal(0))
+    IRealUnion([])
+    >>> extended_div(1, IReal(2, 4))
+    IRealUnion([[0.25, 0.5]])
+    >>> x = extended_div("0.1", IReal(-1, "0.1")); x[1].inf < 1 < x[1].sup
+    True
+    >>> extended_div(IReal("undefined"), IReal(-1, 1))
+    IRealUnion([undefined interval])
+    >>> rounding_mode_backup == rounding.get_mode()
+    True
+    """
+    a, b = _operand_limits(x)
+    c, d = _operand_limits(y)
+    if a != a or b != b or c != c or d != d:
+        return IRealUnion([IReal("undefined")])
+    if not c <= 0.0 <= d:
+        return IRealUnion([IReal(a, b) / IReal(c, d)])
+    if a <= 0.0 <= b:
+        return IRealUnion([_from_limits(NegInf, PosInf)])
+    if c == 0.0 and d == 0.0:
+        return IRealUnion()
+    # The quotients go away from zero as the divisor approaches it, so each
+    # piece has an unbounded limit and one given by the nearest numerator
+    # limit divided by a nonzero limit of the divisor
+    pieces = []
+    if b < 0.0:
+        if d > 0.0:
+            pieces.append(_from_limits(*_divided(b, NegInf, d)))
+        if c < 0.0:
+            pieces.append(_from_limits(*_divided(b, c, PosInf)))
+    else:
+        if c < 0.0:
+            pieces.append(_from_limits(*_divided(a, NegInf, c)))
+        if d > 0.0:
+            pieces.append(_from_limits(*_divided(a, d, PosInf)))
+    return IRealUnion(pieces)
+
+
+def _pieces(other):
+    """Returns the pieces of an operand of the IRealUnion operators"""
+    if type(other) == IRealUnion:
+        return other._pieces
+    if type(other) != IReal:
+        other = IReal(other)
+    if other.empty:
+        return ()
+    return (other,)
+
+
+class IRealUnion(object):
+    """A union of disjoint Real Intervals
+
+    The pieces are kept sorted and the overlapping or touching ones are merged
+    into a single interval when the union is built. A union with no pieces is
+    the empty set, and a union having an undefined piece is undefined as a
+    whole. The arithmetic operators are applied piece by piece, the division
+    being the extended one, and the results are merged again.
+    """
+
+    def __init__(self, pieces=()):
+        """Constructor of the IRealUnion class
+
+        Some examples:
+
+        >>> IRealUnion([IReal(3, 4), IReal(-1, 1), IReal(0.5, 2)])
+        IRealUnion([[-1.0, 2.0], [3.0, 4.0]])
+        >>> IRealUnion([IReal(1, 2), IReal(2, 3), IReal()])
+        IRealUnion([[1.0, 3.0]])
+        >>> IRealUnion([1, IReal("undefined")])
+        IRealUnion([undefined interval])
+        """
+        pieces = [x if type(x) == IReal else IReal(x) for x in pieces]
+        pieces = [x for x in pieces if not x.empty]
+        for x in pieces:
+            if x.undefined:
+                self._pieces = (x,)
+                return
+        pieces.sort(key=lambda x: x.inf)
+        merged = []
+        for x in pieces:
+            if merged and x.inf <= merged[-1].sup:
+                if x.sup > merged[-1].sup:
+                    merged[-1] = _from_limits(merged[-1].inf, x.sup)
+            else:
+                merged.append(x)
+        self._pieces = tuple(merged)
+
+    pieces = property(fget=lambda self: self._pieces)
+    empty = property(fget=lambda self: not self._pieces)
+    undefined = property(fget=lambda self: len(self._pieces) == 1 and \
+        self._pieces[0].undefined)
+
+    def __len__(self):
+        return len(self._pieces)
+
+    def __getitem__(self, index):
+        return self._pieces[index]
+
+    def __iter__(self):
+        return iter(self._pieces)
+
+    def __repr__(self):
+        return "IRealUnion([%s])" % ", ".join([repr(x) for x in self._pieces])
+
+    def __eq__(self, other):
+        """Equality operator
+
+        Some examples:
+
+        >>> IRealUnion([IReal(1, 2)]) == IReal(1, 2)
+        True
+        >>> IRealUnion() == IReal()
+        True
+        >>> IRealUnion([IReal(1), IReal(2)]) == IReal(1, 2)
+        False
+        """
+        other = _pieces(other)
+        return len(self._pieces) == len(other) and \
+            all([x == y for x, y in zip(self._pieces, other)])
+
+    __ne__ = lambda self, other: not self == other
+
+    def __contains__(self, other):
+        """Tests if "other" is an element or a subset of the union
+
+        Some examples:
+
+        >>> 0.0 in extended_div(1, IReal(-1, 1))
+        False
+        >>> IReal(2, 3) in extended_div(1, IReal(-1, 1))
+        True
+        """
+        if type(other) != IReal:
+            other = IReal(other)
+        if other.empty:
+            return not self.undefined
+        for x in self._pieces:
+            if other in x:
+                return True
+        return False
+
+    def hull(self):
+        """Returns the smallest interval containing the union
+
+        Some examples:
+
+        >>> extended_div(IReal(1, 2), IReal(0, 4)).hull()
+        [0.25, inf]
+        >>> IRealUnion().hull()
+        empty interval
+        """
+        if not self._pieces:
+            return IReal()
+        if self.undefined:
+            return IReal("undefined")
+        return _from_limits(self._pieces[0].inf, self._pieces[-1].sup)
+
+    def __or__(self, other):
+        """Union operator
+
+        Some examples:
+
+        >>> IRealUnion([IReal(-1, 0)]) | IReal(0.25, 10)
+        IRealUnion([[-1.0, 0.0], [0.25, 10.0]])
+        >>> IReal(0, 1) | IRealUnion([IReal(-1, 0), IReal(2, 3)])
+        IRealUnion([[-1.0, 1.0], [2.0, 3.0]])
+        """
+        return IRealUnion(self._pieces + _pieces(other))
+
+    __ror__ = __or__
+
+    def __and__(self, other):
+        """Intersection operator
+
+        It's what an interval Newton step does to prune the search interval.
+        Some examples:
+
+        >>> x = IReal(-2, 2)
+        >>> x & (1 - extended_div(1, IReal(-1, 1)))
+        IRealUnion([[-2.0, 0.0], [2.0, 2.0]])
+        >>> IRealUnion([IReal(-2, -1), IReal(1, 2)]) & IReal(0, 1)
+        IRealUnion([[1.0, 1.0]])
+        """
+        return IRealUnion([x & y for x in self._pieces for y in
+            _pieces(other)])
+
+    __rand__ = __and__
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        """Unary minus operator
+
+        Some examples:
+
+        >>> -extended_div(1, IReal(0, 2))
+        IRealUnion([[-inf, -0.5]])
+        """
+        return IRealUnion([-x for x in self._pieces])
+
+    def __add__(self, other):
+        """Binary plus operator
+
+        Some examples:
+
+        >>> IRealUnion([IReal(-2, -1), IReal(1, 2)]) + 1
+        IRealUnion([[-1.0, 0.0], [2.0, 3.0]])
+        >>> IRealUnion([IReal(-2, -1), IReal(1, 2)]) + IReal(0, 2)
+        IRealUnion([[-2.0, 4.0]])
+        """
+        return self._apply(other, lambda x, y: x + y)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._apply(other, lambda x, y: x - y)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> IRealUnion([IReal(-2, -1), IReal(1, 2)]) * 2
+        IRealUnion([[-4.0, -2.0], [2.0, 4.0]])
+        """
+        return self._apply(other, lambda x, y: x * y)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Division operator, which is the extended division
+
+        Some examples:
+
+        >>> IRealUnion([IReal(1, 2), IReal(4)]) / IReal(-1, 1)
+        IRealUnion([[-inf, -1.0], [1.0, inf]])
+        """
+        return self._apply(other, lambda x, y: extended_div(x, y)._pieces)
+
+    def __rdiv__(self, other):
+        return IRealUnion(_pieces(other)) / self
+
+    def __invert__(self):
+        """Inversion operator, which is extended as the division
+
+        Some examples:
+
+        >>> ~IRealUnion([IReal(-4, 2)])
+        IRealUnion([[-inf, -0.25], [0.5, inf]])
+        """
+        return 1 / self
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def _apply(self, other, operation):
+        """Applies an operation to all the pairs of pieces and merges them"""
+        other = _pieces(other)
+        if self.undefined or (len(other) == 1 and other[0].undefined):
+            return IRealUnion([IReal("undefined")])
+        results = []
+        for x in self._pieces:
+            for y in other:
+                result = operation(x, y)
+                if type(result) == tuple:
+                    results.extend(result)
+                else:
+                    results.append(result)
+        return IRealUnion(results)
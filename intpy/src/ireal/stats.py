@@ -0,0 +1,370 @@
+# ireal/stats.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""IStatistics class module
+
+This module contains streaming statistics of Real Intervals, such as readings
+of sensors given as a value and its tolerance. An IStatistics keeps the mean,
+the hull, the intersection and bounds on the variance of all the readings
+added to it in constant memory, so streams of any length can be summarized.
+
+As in IAccumulator, the infimums of the sums are kept negated, so the updates
+run with the rounding mode set upwards only, and the batch methods switch the
+rounding mode once for all the readings. The sums are taken from the first
+reading, which avoids the cancellation of the variance of readings far from
+zero.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.ireal.irarray import IRealArray
+from intpy.ireal.ireal import IReal
+from intpy.ireal.ireal import _from_limits
+from intpy.ireal.ireal import _operand_limits
+from intpy.support import NegInf
+from intpy.support import PosInf
+from intpy.support import rounding
+
+
+__all__ = [
+    "IStatistics"
+]
+
+
+def _limits(reading):
+    """Returns the limits of a reading"""
+    limits = _operand_limits(reading)
+    if limits is None:
+        raise TypeError("unsupported reading type for IStatistics: %r" %
+            type(reading).__name__)
+    return limits
+
+
+def _square(ninf, sup):
+    """Returns the negated infimum and the supremum of [-ninf, sup]**2
+
+    The rounding mode must be set upwards.
+    """
+    if ninf <= 0.0:
+        return (ninf * -ninf, sup * sup)
+    if sup <= 0.0:
+        return (sup * -sup, ninf * ninf)
+    return (0.0, max(ninf * ninf, sup * sup))
+
+
+class IStatistics(object):
+    """Streaming statistics of Real Intervals
+
+    The readings are added by update(), extend() and extend_limits(), and
+    are anything accepted by the IReal operators. The statistics are given
+    as IReals by the properties mean, hull, intersection and variance, all of
+    them empty while there are no readings and undefined once an undefined
+    reading is added. Being mutable, they aren't hashable.
+    """
+
+    __hash__ = None
+
+    def __init__(self, readings=()):
+        """Constructor of the IStatistics class
+
+        Some examples:
+
+        >>> IStatistics()
+        IStatistics(0 readings)
+        >>> IStatistics([1, IReal(2, 3)])
+        IStatistics(2 readings)
+        >>> IStatistics([IReal()]) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        """
+        self._count = 0
+        self._undefined = False
+        self._shift = None
+        self._hull = (PosInf, NegInf)
+        self._meet = (NegInf, PosInf)
+        self._sum = (0.0, 0.0)
+        self._squares = (0.0, 0.0)
+        self.extend(readings)
+
+    count = property(fget=lambda self: self._count)
+
+    def __repr__(self):
+        return "IStatistics(%d readings)" % self._count
+
+    def _consume(self, limits):
+        """Adds the readings given by pairs of limits
+
+        The rounding mode must be set upwards.
+        """
+        count, undefined, shift = self._count, self._undefined, self._shift
+        hull_inf, hull_sup = self._hull
+        meet_inf, meet_sup = self._meet
+        nsum, total = self._sum
+        nsquares, squares = self._squares
+        for inf, sup in limits:
+            if inf != inf or sup != sup:
+                undefined = True
+                continue
+            if shift is None:
+                shift = 0.5 * inf + 0.5 * sup
+                if shift - shift != 0.0:
+                    shift = 0.0
+            count += 1
+            if inf < hull_inf:
+                hull_inf = inf
+            if sup > hull_sup:
+                hull_sup = sup
+            if inf > meet_inf:
+                meet_inf = inf
+            if sup < meet_sup:
+                meet_sup = sup
+            nlow, high = shift - inf, sup - shift
+            nsum = nsum + nlow
+            total = total + high
+            if nlow <= 0.0:
+                nsquares = nsquares + nlow * -nlow
+                squares = squares + high * high
+            elif high <= 0.0:
+                nsquares = nsquares + high * -high
+                squares = squares + nlow * nlow
+            else:
+                squares = squares + max(nlow * nlow, high * high)
+        self._count, self._undefined, self._shift = count, undefined, shift
+        self._hull = (hull_inf, hull_sup)
+        self._meet = (meet_inf, meet_sup)
+        self._sum = (nsum, total)
+        self._squares = (nsquares, squares)
+
+    def update(self, reading):
+        """Adds a reading
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> stats = IStatistics(); stats.update(IReal(1, 2)); stats.hull
+        [1.0, 2.0]
+        >>> stats.update("0.1"); stats.mean.inf < 0.55 < stats.mean.sup
+        True
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        self.extend((reading,))
+
+    def extend(self, readings):
+        """Adds all the readings
+
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> stats = IStatistics(); stats.extend([IReal(1, 2), 3, 4.5]); stats
+        IStatistics(3 readings)
+        >>> stats.extend(IRealArray([1, 2])); stats.count
+        5
+        >>> stats.extend([IReal("undefined")]); stats.mean
+        undefined interval
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        if type(readings) == IRealArray:
+            self.extend_limits(readings.inf, readings.sup)
+            return
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        try:
+            self._consume(_limits(reading) for reading in readings)
+        finally:
+            rounding.set_mode(rounding_mode_backup)
+
+    def extend_limits(self, infs, sups):
+        """Adds the readings whose limits are given by two buffers
+
+        The buffers are sequences of floats, such as arrays or the limits of
+        an IRealArray, so chunks of a stream are added with no IReals built.
+        Some examples:
+
+        >>> from array import array
+        >>> stats = IStatistics()
+        >>> stats.extend_limits(array("d", [1, 2]), array("d", [3, 4]))
+        >>> stats.hull; stats.intersection
+        [1.0, 4.0]
+        [2.0, 3.0]
+        >>> stats.extend_limits([2], [1]) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        if len(infs) != len(sups):
+            raise ValueError("sequences of different lengths can't be operated")
+        for inf, sup in zip(infs, sups):
+            if inf > sup:
+                raise ValueError("infimum greater than supremum: %r > %r" %
+                    (inf, sup))
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        try:
+            self._consume(zip(infs, sups))
+        finally:
+            rounding.set_mode(rounding_mode_backup)
+
+    def _result(self, inf, sup):
+        """Returns the IReal of a statistic, empty or undefined if due"""
+        if self._undefined:
+            return IReal("undefined")
+        if self._count == 0:
+            return IReal()
+        return _from_limits(inf, sup)
+
+    def mean(self):
+        """The interval of the means of all the choices of the readings
+
+        Some examples:
+
+        >>> IStatistics([IReal(1, 2), IReal(2, 4)]).mean
+        [1.5, 3.0]
+        >>> x = IStatistics(["0.1"] * 10 + [1e6]).mean
+        >>> x.inf < (1e6 + 1) / 11 < x.sup
+        True
+        """
+        n = float(self._count or 1)
+        nsum, total = self._sum
+        shift = self._shift or 0.0
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        try:
+            ninf = nsum / n - shift
+            sup = total / n + shift
+        finally:
+            rounding.set_mode(rounding_mode_backup)
+        return self._result(-ninf, sup)
+
+    mean = property(fget=mean)
+
+    def hull(self):
+        """The smallest interval containing all the readings
+
+        Unlike the union operator of IReals, it isn't undefined on disjoint
+        readings. Some examples:
+
+        >>> IStatistics([IReal(1, 2), IReal(-1, 0)]).hull
+        [-1.0, 2.0]
+        >>> IStatistics().hull
+        empty interval
+        """
+        return self._result(*self._hull)
+
+    hull = property(fget=hull)
+
+    def intersection(self):
+        """The intersection of all the readings, as given by the & operator
+
+        It's empty as soon as two readings are disjoint, meaning they can't
+        all be readings of the same value. Some examples:
+
+        >>> stats = IStatistics([IReal(1, 3), IReal(2, 4)])
+        >>> stats.intersection
+        [2.0, 3.0]
+        >>> stats.update(IReal(0, 1)); stats.intersection
+        empty interval
+        """
+        inf, sup = self._meet
+        if inf > sup and not self._undefined:
+            return IReal()
+        return self._result(inf, sup)
+
+    intersection = property(fget=intersection)
+
+    def variance(self):
+        """Bounds on the population variance of all choices of the readings
+
+        It's an enclosure of the variances of all the samples taken from the
+        readings, computed from the sums of the readings and of their squares
+        and narrowed by the bound (max - min)**2/4 on the variance, with the
+        hull as the range. Some examples:
+
+        >>> IStatistics([1, 2, 3, 4]).variance
+        [1.25, 1.25]
+        >>> x = IStatistics([IReal(0.9, 1.1), IReal(1.9, 2.1)]).variance
+        >>> x.inf <= 0.16 and 0.36 <= x.sup
+        True
+        >>> x = IStatistics([IReal(1e9, 1e9 + 1), 1e9 + 2]).variance
+        >>> x.inf <= 0.25 and 1 <= x.sup <= 1.5
+        True
+        >>> IStatistics([IReal(-1, 1)]).variance
+        [0.0, 1.0]
+        """
+        n = float(self._count or 1)
+        hull_inf, hull_sup = self._hull
+        rounding_mode_backup = rounding.get_mode()
+        rounding.set_mode(1)
+        try:
+            nlow, high = _square(self._sum[0] / n, self._sum[1] / n)
+            ninf = high + self._squares[0] / n
+            sup = self._squares[1] / n + nlow
+            width = hull_sup - hull_inf
+            bound = width * width / 4.0
+        finally:
+            rounding.set_mode(rounding_mode_backup)
+        inf = max(-ninf, 0.0) if ninf == ninf else 0.0
+        if not sup <= bound:
+            sup = bound if bound == bound else PosInf
+        return self._result(inf, sup)
+
+    variance = property(fget=variance)
+
+
+def _benchmark(n=100000):
+    """Reports the throughput of the statistics of long streams"""
+    from random import random
+    from time import time
+    readings = []
+    for i in range(n):
+        value = 20.0 + random()
+        readings.append(IReal(value - 0.01, value + 0.01))
+    buffers = IRealArray(readings)
+    results = []
+    start = time()
+    mean, hull, meet = IReal(0), readings[0], readings[0]
+    for reading in readings:
+        mean = mean + reading
+        hull = IReal(min(hull.inf, reading.inf), max(hull.sup, reading.sup))
+        meet = meet & reading
+    mean = mean / n
+    results.append(("IReal operators", time() - start))
+    start = time()
+    stats = IStatistics()
+    for reading in readings:
+        stats.update(reading)
+    results.append(("IStatistics.update", time() - start))
+    start = time()
+    IStatistics().extend(readings)
+    results.append(("IStatistics.extend", time() - start))
+    start = time()
+    stats = IStatistics()
+    chunk = 4096
+    for i in range(0, n, chunk):
+        stats.extend_limits(buffers.inf[i:i + chunk],
+            buffers.sup[i:i + chunk])
+    results.append(("extend_limits", time() - start))
+    for name, elapsed in results:
+        print("%-20s %10.4f s %12.0f readings/s" % (name, elapsed,
+            n / elapsed))
+    print("mean %r, variance %r" % (stats.mean, stats.variance))
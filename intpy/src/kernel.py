@@ -0,0 +1,449 @@
+# kernel.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Fused elementwise kernels module
+
+Evaluating an expression on IRealArrays builds a pair of temporary arrays of
+limits per operation, and switches the rounding mode twice per operation. A
+Kernel translates an expression tree into a single C loop instead, which
+keeps the intermediate limits in local variables and sets the rounding mode
+upwards once for the whole loop, the infimums being computed negated as in
+the "negation" backend. It's compiled with the C compiler Python was built
+with, as the rounding extension, and loaded with ctypes.
+
+The compiled kernels are kept in a cache directory, named by the hash of
+their source, so an expression is compiled only the first time it's seen.
+The directory is given by the INTPY_KERNEL_CACHE environment variable, being
+~/.cache/intpy by default. When there's no compiler, the kernels evaluate
+the expression on IRealArrays instead.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+import ctypes
+import hashlib
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import warnings
+from array import array
+
+from intpy.expr import Expression
+from intpy.ireal import IReal
+from intpy.ireal import IRealArray
+from intpy.ireal.ireal import _operand_limits
+
+
+__all__ = [
+    "Kernel"
+]
+
+
+_TEMPLATE = """\
+#include <fenv.h>
+#include <math.h>
+
+#ifdef _MSC_VER
+#pragma fenv_access (on)
+#define INTPY_INLINE __inline
+#else
+#define INTPY_INLINE inline
+#endif
+
+/* The rounding mode is upwards, so the infimums are computed negated and
+   subtracted from zero, as in the "negation" backend. The endpoints are
+   selected as in the IReal operators. */
+
+static INTPY_INLINE void intpy_mul(double x1, double y1, double x2, double y2,
+    double *inf, double *sup)
+{
+    double a, b, c, d;
+    if (x1 >= 0.0) {
+        if (x2 >= 0.0) { a = x1; b = x2; c = y1; d = y2; }
+        else if (y2 <= 0.0) { a = y1; b = x2; c = x1; d = y2; }
+        else { a = y1; b = x2; c = y1; d = y2; }
+    } else if (y1 <= 0.0) {
+        if (x2 >= 0.0) { a = x1; b = y2; c = y1; d = x2; }
+        else if (y2 <= 0.0) { a = y1; b = y2; c = x1; d = x2; }
+        else { a = x1; b = y2; c = x1; d = x2; }
+    } else if (x2 >= 0.0) { a = x1; b = y2; c = y1; d = y2; }
+    else if (y2 <= 0.0) { a = y1; b = x2; c = x1; d = x2; }
+    else {
+        double inf1 = 0.0 - (-x1 * y2), inf2 = 0.0 - (-y1 * x2);
+        double sup1 = x1 * x2, sup2 = y1 * y2;
+        *inf = inf2 < inf1 ? inf2 : inf1;
+        *sup = sup2 > sup1 ? sup2 : sup1;
+        return;
+    }
+    *inf = 0.0 - (-a * b);
+    *sup = c * d;
+}
+
+static INTPY_INLINE void intpy_div(double x1, double y1, double x2, double y2,
+    double *inf, double *sup)
+{
+    double a, b, c, d;
+    if (x2 <= 0.0 && y2 >= 0.0) {
+        *inf = *sup = NAN;
+        return;
+    }
+    if (x2 > 0.0) {
+        if (x1 >= 0.0) { a = x1; b = y2; c = y1; d = x2; }
+        else if (y1 <= 0.0) { a = x1; b = x2; c = y1; d = y2; }
+        else { a = x1; b = x2; c = y1; d = x2; }
+    } else if (x1 >= 0.0) { a = y1; b = y2; c = x1; d = x2; }
+    else if (y1 <= 0.0) { a = y1; b = x2; c = x1; d = y2; }
+    else { a = y1; b = y2; c = x1; d = y2; }
+    *inf = 0.0 - (-a / b);
+    *sup = c / d;
+}
+
+static INTPY_INLINE void intpy_sqr(double x1, double y1, double *inf,
+    double *sup)
+{
+    if (x1 >= 0.0) {
+        *inf = 0.0 - (-x1 * x1);
+        *sup = y1 * y1;
+    } else if (y1 <= 0.0) {
+        *inf = 0.0 - (-y1 * y1);
+        *sup = x1 * x1;
+    } else {
+        double magnitude = -x1 > y1 ? -x1 : y1;
+        *inf = 0.0;
+        *sup = magnitude * magnitude;
+    }
+}
+
+void intpy_kernel(long n, const double **infs, const double **sups,
+    const long *strides, double *out_inf, double *out_sup)
+{
+    int mode = fegetround();
+    long i;
+    fesetround(FE_UPWARD);
+    for (i = 0; i < n; i++) {
+%s
+        if (%s != %s || %s != %s) {
+            out_inf[i] = out_sup[i] = NAN;
+        } else {
+            out_inf[i] = %s;
+            out_sup[i] = %s;
+        }
+    }
+    fesetround(mode);
+}
+"""
+
+_STATEMENTS = {
+    "add": "l%(k)d = 0.0 - (-l%(a)d - l%(b)d); u%(k)d = u%(a)d + u%(b)d;",
+    "sub": "l%(k)d = 0.0 - (u%(b)d - l%(a)d); u%(k)d = u%(a)d - l%(b)d;",
+    "mul": "intpy_mul(l%(a)d, u%(a)d, l%(b)d, u%(b)d, &l%(k)d, &u%(k)d);",
+    "div": "intpy_div(l%(a)d, u%(a)d, l%(b)d, u%(b)d, &l%(k)d, &u%(k)d);",
+    "neg": "l%(k)d = -u%(a)d; u%(k)d = -l%(a)d;",
+    "sqr": "intpy_sqr(l%(a)d, u%(a)d, &l%(k)d, &u%(k)d);"
+}
+
+# Kernels already loaded in this process, by the hash of their source
+_loaded = {}
+
+
+def _literal(x):
+    """Returns a C literal of a float, exact through the hexadecimal form
+
+    Some examples:
+
+    >>> _literal(0.1), _literal(-2.0), _literal(float("-inf"))
+    ('0x1.999999999999ap-4', '-0x1.0000000000000p+1', '-INFINITY')
+    """
+    if x != x:
+        return "NAN"
+    if x in (float("inf"), float("-inf")):
+        return x > 0 and "INFINITY" or "-INFINITY"
+    return x.hex()
+
+
+def _source(expression):
+    """Generates the C source of the kernel of an expression
+
+    Some examples:
+
+    >>> from intpy.expr import Variable
+    >>> lines = _source(-Variable(0) * 2).split("\\n")
+    >>> print("\\n".join([x for x in lines if "double l" in x]))
+            double l0 = infs[0][i * strides[0]], u0 = sups[0][i * strides[0]];
+            double l1, u1;
+            double l2 = 0x1.0000000000000p+1, u2 = 0x1.0000000000000p+1;
+            double l3, u3;
+    """
+    nodes = expression.nodes()
+    index = dict([(id(node), k) for k, node in enumerate(nodes)])
+    lines = []
+    for k, node in enumerate(nodes):
+        if node.op == "var":
+            lines.append("double l%d = infs[%d][i * strides[%d]], u%d = "
+                "sups[%d][i * strides[%d]];" % (k, node.index, node.index, k,
+                node.index, node.index))
+        elif node.op == "const":
+            lines.append("double l%d = %s, u%d = %s;" % (k,
+                _literal(node.value.inf), k, _literal(node.value.sup)))
+        else:
+            args = [index[id(x)] for x in node.args]
+            lines.append("double l%d, u%d;" % (k, k))
+            lines.append(_STATEMENTS[node.op] % {"k": k, "a": args[0],
+                "b": args[-1]})
+    k = len(nodes) - 1
+    body = "\n".join(["        " + line for line in lines])
+    return _TEMPLATE % (body, "l%d" % k, "l%d" % k, "u%d" % k, "u%d" % k,
+        "l%d" % k, "u%d" % k)
+
+
+def _cache_dir():
+    return os.environ.get("INTPY_KERNEL_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "intpy"))
+
+
+def _command(name):
+    """Returns a compiler command of the build of Python, split in words
+
+    As distutils did, the environment variable of the same name overrides
+    the value of the build.
+    """
+    value = os.environ.get(name) or sysconfig.get_config_var(name)
+    if not value:
+        raise OSError("the build of Python doesn't tell its %s" % name)
+    return shlex.split(value)
+
+
+def _msvc_compile(source_file, library):
+    """Compiles a kernel with the compiler of setuptools, for MSVC"""
+    # Importing setuptools first gives its distutils, since Python 3.12
+    # hasn't its own
+    import setuptools
+    from distutils.ccompiler import new_compiler
+    from distutils.sysconfig import customize_compiler
+    compiler = new_compiler()
+    customize_compiler(compiler)
+    objects = compiler.compile([source_file],
+        output_dir=os.path.dirname(library), extra_postargs=["/O2",
+        "/fp:strict"])
+    compiler.link_shared_object(objects, library)
+
+
+def _compile(source, path):
+    """Compiles a kernel into the shared library 'path'
+
+    The compiler and the linker of shared libraries are the ones of the build
+    of Python, as in the sysconfig variables CC, CCSHARED and LDSHARED, and
+    they're run directly, since distutils isn't in Python 3.12. On Windows
+    the compiler of setuptools is used. It's built in a temporary directory
+    and then renamed, so concurrent processes never load a partial library.
+    """
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    build_dir = tempfile.mkdtemp(dir=directory)
+    try:
+        source_file = os.path.join(build_dir, "kernel.c")
+        f = open(source_file, "w")
+        try:
+            f.write(source)
+        finally:
+            f.close()
+        library = os.path.join(build_dir, os.path.basename(path))
+        if sys.platform == "win32":
+            _msvc_compile(source_file, library)
+        else:
+            object_file = os.path.join(build_dir, "kernel.o")
+            null = open(os.devnull, "w")
+            try:
+                subprocess.check_call(_command("CC") + shlex.split(
+                    sysconfig.get_config_var("CCSHARED") or "") + ["-O2",
+                    "-frounding-math", "-ffp-contract=off", "-c",
+                    source_file, "-o", object_file], stdout=null,
+                    stderr=null)
+                subprocess.check_call(_command("LDSHARED") + [object_file,
+                    "-o", library, "-lm"], stdout=null, stderr=null)
+            finally:
+                null.close()
+        os.rename(library, path)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+
+def _load(source, cache_dir):
+    """Returns the compiled function of a kernel, compiling it if needed"""
+    key = hashlib.sha1((source + sys.version).encode("utf-8")).hexdigest()
+    if key in _loaded:
+        return _loaded[key]
+    path = os.path.join(cache_dir, "kernel_%s%s" % (key,
+        ".dll" if sys.platform == "win32" else ".so"))
+    if not os.path.exists(path):
+        _compile(source, path)
+    function = ctypes.CDLL(path).intpy_kernel
+    function.restype = None
+    function.argtypes = [ctypes.c_long] + [ctypes.c_void_p] * 5
+    _loaded[key] = function
+    return function
+
+
+class Kernel(object):
+    """A fused elementwise kernel of an expression
+
+    The expression is an intpy.expr Expression, and the kernel evaluates it
+    on IRealArrays element by element, giving the same limits as evaluating
+    the expression on the arrays, apart from squares of elements containing
+    zero, which are nonnegative here.
+    """
+
+    def __init__(self, expression, cache_dir=None):
+        """Constructor of the Kernel class
+
+        For more information about the Kernel class, see the class docstring.
+        Some examples of how to use this constructor follow below:
+
+        >>> from intpy.expr import Variable
+        >>> x, y = Variable(0), Variable(1)
+        >>> cache_dir = tempfile.mkdtemp()
+        >>> kernel = Kernel(x * y + 1, cache_dir)
+        >>> kernel.expression
+        add(mul(x0, x1), 1.0)
+        >>> shutil.rmtree(cache_dir)
+        """
+        if not isinstance(expression, Expression):
+            raise TypeError("a kernel needs an expression")
+        self._expression = expression
+        self._arity = max(expression.variables() + [-1]) + 1
+        self._source = _source(expression)
+        self._function = None
+        try:
+            self._function = _load(self._source, cache_dir or _cache_dir())
+        except Exception:
+            warnings.warn("the kernel couldn't be compiled, so it evaluates "
+                "the expression on IRealArrays", RuntimeWarning)
+
+    expression = property(fget=lambda self: self._expression)
+    source = property(fget=lambda self: self._source)
+    compiled = property(fget=lambda self: self._function is not None)
+
+    def __call__(self, *values):
+        """Evaluates the kernel on the values of the variables
+
+        The values are IRealArrays of the same length, or anything accepted
+        by the IReal constructor, which is broadcast to all the elements.
+        Some examples:
+
+        >>> from intpy.expr import Variable
+        >>> x, y = Variable(0), Variable(1)
+        >>> cache_dir = tempfile.mkdtemp()
+        >>> kernel = Kernel(x * y - x ** 2 / "0.1", cache_dir)
+        >>> kernel(IRealArray([IReal(1, 2), -1, "undefined"]), 3)
+        IRealArray([[-37.00000000000001, -3.9999999999999982], \
+[-13.000000000000002, -12.999999999999998], undefined interval])
+        >>> Kernel(x / y, cache_dir)(IRealArray([1, 1]),
+        ...     IRealArray([IReal(-1, 1), 4]))
+        IRealArray([undefined interval, [0.25, 0.25]])
+        >>> from random import Random
+        >>> from intpy.ireal.ireal import _random_limits
+        >>> random = Random(0)
+        >>> a = IRealArray([IReal(*_random_limits(random)) for i in range(99)])
+        >>> b = IRealArray([IReal(*_random_limits(random)) for i in range(99)])
+        >>> e = (x - y) * (x + "0.1") / (y * y + 1) - -x
+        >>> pairs = zip(Kernel(e, cache_dir)(a, b),
+        ...     [e.evaluate(v) for v in zip(a, b)])
+        >>> len([p for p, q in pairs if p == q or p.undefined and q.undefined])
+        99
+        >>> Kernel(x * x + 1, cache_dir)(IRealArray([]))
+        IRealArray([])
+        >>> a, b = IRealArray([1]), IRealArray([1, 2])
+        >>> kernel(a, b) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        >>> shutil.rmtree(cache_dir)
+        """
+        if len(values) < self._arity:
+            raise TypeError("the kernel takes %d values" % self._arity)
+        lengths = set([len(x) for x in values if type(x) == IRealArray])
+        if len(lengths) > 1:
+            raise ValueError("arrays of different lengths can't be operated")
+        n = lengths.pop() if lengths else 1
+        if n == 0:
+            return IRealArray()
+        if self._function is None:
+            values = [x if type(x) == IRealArray else
+                IRealArray.from_limits(*[[limit] * n for limit in
+                _operand_limits(x)]) for x in values]
+            return self._expression.evaluate(values)
+        infs, sups, strides = [], [], array("l")
+        for x in values:
+            if type(x) == IRealArray:
+                inf, sup = x.inf, x.sup
+                strides.append(1)
+            else:
+                inf, sup = [array("d", [limit]) for limit in
+                    _operand_limits(x)]
+                strides.append(0)
+            infs.append(inf)
+            sups.append(sup)
+        out_inf, out_sup = array("d", [0.0]) * n, array("d", [0.0]) * n
+        pointers = ctypes.c_void_p * max(len(values), 1)
+        self._function(n, pointers(*[x.buffer_info()[0] for x in infs]),
+            pointers(*[x.buffer_info()[0] for x in sups]),
+            strides.buffer_info()[0], out_inf.buffer_info()[0],
+            out_sup.buffer_info()[0])
+        return IRealArray.from_limits(out_inf, out_sup)
+
+
+def _benchmark(n=100000, seed=0):
+    """Reports the time of a kernel against the evaluation on IRealArrays"""
+    from random import Random
+    from time import time
+    from intpy.expr import Variable
+    random = Random(seed)
+    x, y = Variable(0), Variable(1)
+    expression = (x - y) * (x + "0.1") / (y * y + 1) - x * 3
+    a = IRealArray([IReal(u, u + random.random()) for u in
+        [random.uniform(-10, 10) for i in range(n)]])
+    b = IRealArray([IReal(u, u + random.random()) for u in
+        [random.uniform(-10, 10) for i in range(n)]])
+    cache_dir = tempfile.mkdtemp()
+    try:
+        start = time()
+        kernel = Kernel(expression, cache_dir)
+        print("compile                 %8.4f s" % (time() - start))
+        _loaded.clear()
+        start = time()
+        kernel = Kernel(expression, cache_dir)
+        print("load from the cache     %8.4f s" % (time() - start))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    start = time()
+    expression.evaluate([a, b])
+    plain = time() - start
+    print("IRealArray operators    %8.4f s" % plain)
+    start = time()
+    kernel(a, b)
+    elapsed = time() - start
+    print("fused kernel            %8.4f s %6.1fx" % (elapsed,
+        plain / elapsed))
@@ -0,0 +1,590 @@
+# lazy.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Lazy Real Interval module
+
+This module contains a Real Interval whose arithmetic operations are recorded
+as a graph of tuples, and evaluated only when its value is demanded. Only
+the subexpressions the demanded value depends on are evaluated, all of them
+with the rounding mode set upwards once, the infimums being kept negated as
+in IAccumulator.
+
+The chains of additions and subtractions, and of multiplications, are fused
+into single sums and products. The terms of a fused sum are added in order of
+increasing magnitude, separately for the infimums and the supremums, which
+keeps the widening due to the rounding of the partial sums smallest.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.errors import EmptyIntervalError
+from intpy.ireal import IReal
+from intpy.ireal.accumulator import _product
+from intpy.ireal.ireal import _div_operands
+from intpy.ireal.ireal import _from_limits
+from intpy.ireal.ireal import _operand_limits
+from intpy.ireal.stats import _square
+from intpy.support import NaN
+from intpy.support import rounding
+
+
+__all__ = [
+    "LazyIReal"
+]
+
+
+# The kinds of the operations fused into chains
+_CHAINS = {
+    "add": "sum",
+    "sub": "sum",
+    "neg": "sum",
+    "mul": "product"
+}
+
+
+def _lazy(node):
+    """Builds a LazyIReal from a node"""
+    ret = LazyIReal.__new__(LazyIReal)
+    ret._node = node
+    ret._value = None
+    return ret
+
+
+def _leaf(value):
+    """Returns the node of an operand, None if unsupported
+
+    The nodes of the operations are tuples (op, a, b), b being None for the
+    unary ones, and their leaves are floats and IReals. A forced LazyIReal
+    is a leaf with its value. Some examples:
+
+    >>> _leaf(0.5), _leaf(IReal(1, 2)), _leaf([1]) is None
+    (0.5, [1.0, 2.0], True)
+    >>> (LazyIReal(IReal(1, 2)) * 2 - 1)._node
+    ('sub', ('mul', [1.0, 2.0], 2.0), 1.0)
+    """
+    kind = type(value)
+    if kind == float:
+        return value
+    if kind == LazyIReal:
+        return value._node if value._value is None else value._value
+    if kind == IReal:
+        if value._empty:
+            raise EmptyIntervalError()
+        return value
+    limits = _operand_limits(value)
+    if limits is None:
+        return None
+    if limits[0] == limits[1]:
+        return limits[0]
+    return _from_limits(*limits)
+
+
+def _forced(value):
+    """Returns the IReal of an operand, forcing it if it's lazy"""
+    if type(value) == LazyIReal:
+        return value.force()
+    if type(value) == IReal:
+        return value
+    return IReal(value)
+
+
+def _nodes(root):
+    """Returns the operations under 'root', children before parents
+
+    It also returns the number of uses of each one, keyed by its id. The
+    shared operations are listed once.
+    """
+    ret, uses, stack = [], {}, [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            ret.append(node)
+            continue
+        if id(node) in uses:
+            uses[id(node)] += 1
+            continue
+        uses[id(node)] = 1
+        stack.append((node, True))
+        if type(node[2]) == tuple:
+            stack.append((node[2], False))
+        if type(node[1]) == tuple:
+            stack.append((node[1], False))
+    return ret, uses
+
+
+def _limits(arg, limits):
+    """Returns the negated infimum and the supremum of a node"""
+    if type(arg) == tuple:
+        return limits[id(arg)]
+    if type(arg) == float:
+        return (-arg, arg)
+    return (-arg._inf, arg._sup)
+
+
+def _terms(node, absorbed, limits):
+    """Returns the limits of the terms of a fused sum, signs applied
+
+    The limits are pairs of negated infimum and supremum.
+    """
+    ret, stack = [], [(node, False)]
+    while stack:
+        term, negated = stack.pop()
+        if term is node or (type(term) == tuple and id(term) in absorbed):
+            op = term[0]
+            if op == "add":
+                stack.extend([(term[1], negated), (term[2], negated)])
+            elif op == "sub":
+                stack.extend([(term[1], negated), (term[2], not negated)])
+            else:
+                stack.append((term[1], not negated))
+        else:
+            ninf, sup = _limits(term, limits)
+            ret.append((sup, ninf) if negated else (ninf, sup))
+    return ret
+
+
+def _factors(node, absorbed, limits):
+    """Returns the limits of the factors of a fused product"""
+    ret, stack = [], [node]
+    while stack:
+        factor = stack.pop()
+        if factor is node or (type(factor) == tuple and \
+                id(factor) in absorbed):
+            stack.extend((factor[1], factor[2]))
+        else:
+            ret.append(_limits(factor, limits))
+    return ret
+
+
+def _sum(terms):
+    """Adds the terms in order of increasing magnitude
+
+    The rounding mode must be set upwards.
+    """
+    ninf = sup = 0.0
+    for term in sorted([x[0] for x in terms], key=abs):
+        ninf = ninf + term
+    for term in sorted([x[1] for x in terms], key=abs):
+        sup = sup + term
+    return (ninf, sup)
+
+
+def _multiply(factors):
+    """Multiplies the factors
+
+    The rounding mode must be set upwards.
+    """
+    ninf, sup = factors[0]
+    for ninf2, sup2 in factors[1:]:
+        ninf, sup = _product(-ninf, sup, -ninf2, sup2)
+    return (ninf, sup)
+
+
+def _operation(op, x, y):
+    """Computes a single operation, on pairs of negated infimum and supremum
+
+    The rounding mode must be set upwards.
+    """
+    if op == "add":
+        return (x[0] + y[0], x[1] + y[1])
+    if op == "sub":
+        return (x[0] + y[1], x[1] + y[0])
+    if op == "mul":
+        return _product(-x[0], x[1], -y[0], y[1])
+    if op == "neg":
+        return (x[1], x[0])
+    if op == "sqr":
+        return _square(*x)
+    x1, y1, x2, y2 = -x[0], x[1], -y[0], y[1]
+    if x2 <= 0.0 <= y2:
+        return (NaN, NaN)
+    a, b, c, d = _div_operands(x1, y1, x2, y2)
+    return (-a / b, c / d)
+
+
+def _evaluate(root, fuse):
+    """Evaluates the node 'root' as an IReal"""
+    if type(root) != tuple:
+        return root if type(root) == IReal else _from_limits(root, root)
+    nodes, uses = _nodes(root)
+    # The heads of the chains are the nodes absorbing some of their args
+    absorbed, heads = set(), set()
+    if fuse:
+        for node in nodes:
+            chain = _CHAINS.get(node[0])
+            if not chain:
+                continue
+            for arg in node[1:]:
+                if type(arg) == tuple and _CHAINS.get(arg[0]) == chain and \
+                        uses[id(arg)] == 1:
+                    absorbed.add(id(arg))
+                    heads.add(id(node))
+    limits = {}
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(1)
+    try:
+        for node in nodes:
+            key = id(node)
+            if key in absorbed:
+                continue
+            op, x, y = node
+            if key in heads:
+                if _CHAINS[op] == "sum":
+                    args = _terms(node, absorbed, limits)
+                else:
+                    args = _factors(node, absorbed, limits)
+                if [z for z in args if z[0] != z[0] or z[1] != z[1]]:
+                    limits[key] = (NaN, NaN)
+                elif _CHAINS[op] == "sum":
+                    limits[key] = _sum(args)
+                else:
+                    limits[key] = _multiply(args)
+                continue
+            x = limits[id(x)] if type(x) == tuple else _limits(x, limits)
+            if y is None:
+                y = x
+            else:
+                y = limits[id(y)] if type(y) == tuple else _limits(y, limits)
+            if x[0] != x[0] or x[1] != x[1] or y[0] != y[0] or y[1] != y[1]:
+                limits[key] = (NaN, NaN)
+            else:
+                limits[key] = _operation(op, x, y)
+    finally:
+        rounding.set_mode(rounding_mode_backup)
+    ninf, sup = limits[id(root)]
+    return _from_limits(0.0 - ninf, sup)
+
+
+class LazyIReal(object):
+    """A Real Interval evaluated on demand
+
+    The arithmetic operators build new lazy intervals recording the
+    operations, mixing freely with IReals and anything accepted by the IReal
+    operators. The value is computed by force(), and the other operations
+    and attributes of IReal force it and work on it, so a LazyIReal can be
+    used wherever an IReal is. A forced value is kept, and the operations
+    built afterwards start from it.
+    """
+
+    __hash__ = None
+    __slots__ = ("_node", "_value")
+
+    def __init__(self, value=0.0):
+        """Constructor of the LazyIReal class
+
+        Some examples:
+
+        >>> LazyIReal(IReal(1, 2)); LazyIReal("0.5")
+        LazyIReal([1.0, 2.0])
+        LazyIReal([0.5, 0.5])
+        >>> LazyIReal(IReal()) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        """
+        if type(value) != IReal and type(value) != LazyIReal:
+            value = IReal(value)
+        self._node, self._value = _leaf(value), None
+
+    def force(self, fuse=True):
+        """Evaluates the interval, returning it as an IReal
+
+        If 'fuse' is false the operations are evaluated one by one as the
+        IReal operators do, giving the same limits. Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> x = LazyIReal(IReal(1, 2))
+        >>> y = (x * 3 + "0.1" - x) / 2
+        >>> y.force(fuse=False) == (IReal(1, 2) * 3 + "0.1" - IReal(1, 2)) / 2
+        True
+        >>> s = LazyIReal()
+        >>> for term in [1e16] + [1.0] * 10 + [-1e16]:
+        ...     s = s + term
+        >>> s.force(fuse=False); s.force()
+        [0.0, 20.0]
+        [10.0, 10.0]
+        >>> (x / IReal(-1, 1)).force()
+        undefined interval
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+
+        The lazy and the eager evaluations give the same limits, unless the
+        operations are fused:
+
+        >>> from random import Random
+        >>> from intpy.ireal.ireal import _random_limits
+        >>> random = Random(0)
+        >>> xs = [IReal(*_random_limits(random)) for i in range(300)]
+        >>> eager, lazy, same = xs[0], LazyIReal(xs[0]), True
+        >>> for i, x in enumerate(xs[1:]):
+        ...     if i % 3 == 0:
+        ...         eager, lazy = eager + x, lazy + x
+        ...     elif i % 3 == 1:
+        ...         eager, lazy = eager * x, lazy * x
+        ...     else:
+        ...         eager, lazy = eager - x, lazy - x
+        ...     y = lazy.force(fuse=False)
+        ...     same = same and (y == eager or y.undefined and eager.undefined)
+        >>> same
+        True
+        """
+        if not fuse:
+            return _evaluate(self._node, False)
+        if self._value is None:
+            self._value = _evaluate(self._node, True)
+        return self._value
+
+    def __repr__(self):
+        return "LazyIReal(%r)" % self.force()
+
+    def __getattr__(self, name):
+        if name in ("_node", "_value") or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.force(), name)
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return _lazy(("neg", _leaf(self), None))
+
+    def __invert__(self):
+        return 1.0 / self
+
+    def __add__(self, other):
+        """Binary plus operator
+
+        Some examples:
+
+        >>> LazyIReal(IReal(1, 2)) + 1; IReal(1, 2) + LazyIReal(1)
+        LazyIReal([2.0, 3.0])
+        LazyIReal([2.0, 3.0])
+        >>> LazyIReal(1) + [1] # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        TypeError:...
+        """
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("add", self._node if self._value is None else \
+            self._value, other))
+
+    def __radd__(self, other):
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("add", other, self._node if self._value is None else \
+            self._value))
+
+    def __sub__(self, other):
+        """Binary minus operator
+
+        Some examples:
+
+        >>> LazyIReal(IReal(1, 2)) - 1; 1 - LazyIReal(IReal(1, 2))
+        LazyIReal([0.0, 1.0])
+        LazyIReal([-1.0, 0.0])
+        """
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("sub", self._node if self._value is None else \
+            self._value, other))
+
+    def __rsub__(self, other):
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("sub", other, self._node if self._value is None else \
+            self._value))
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> LazyIReal(IReal(-1, 2)) * IReal(3, 4); -2 * LazyIReal(3)
+        LazyIReal([-4.0, 8.0])
+        LazyIReal([-6.0, -6.0])
+        """
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("mul", self._node if self._value is None else \
+            self._value, other))
+
+    def __rmul__(self, other):
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("mul", other, self._node if self._value is None else \
+            self._value))
+
+    def __div__(self, other):
+        """Division operator
+
+        Some examples:
+
+        >>> LazyIReal(IReal(1, 2)) / 4; 1 / LazyIReal(IReal(2, 4))
+        LazyIReal([0.25, 0.5])
+        LazyIReal([0.25, 0.5])
+        >>> ~LazyIReal(IReal(-1, 1))
+        LazyIReal(undefined interval)
+        """
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("div", self._node if self._value is None else \
+            self._value, other))
+
+    def __rdiv__(self, other):
+        other = _leaf(other)
+        if other is None:
+            return NotImplemented
+        return _lazy(("div", other, self._node if self._value is None else \
+            self._value))
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def __pow__(self, exponent):
+        """Power operator, for positive integer exponents
+
+        Unlike a product of the interval by itself, a square is never
+        negative. Some examples:
+
+        >>> LazyIReal(IReal(-1, 2)) ** 2; LazyIReal(IReal(-1, 2)) ** 3
+        LazyIReal([0.0, 4.0])
+        LazyIReal([-4.0, 8.0])
+        """
+        if type(exponent) != int or exponent < 1:
+            raise ValueError("only positive integer exponents are supported")
+        node = _leaf(self)
+        if exponent == 1:
+            return self
+        ret = ("sqr", node, None)
+        for i in range(exponent - 2):
+            ret = ("mul", ret, node)
+        return _lazy(ret)
+
+    def __and__(self, other):
+        """Intersection operator, forcing the operands
+
+        Some examples:
+
+        >>> LazyIReal(IReal(1, 3)) & IReal(2, 4)
+        [2.0, 3.0]
+        >>> IReal(1, 3) | LazyIReal(IReal(2, 4))
+        [1.0, 4.0]
+        """
+        return self.force() & _forced(other)
+
+    def __rand__(self, other):
+        return _forced(other) & self.force()
+
+    def __or__(self, other):
+        return self.force() | _forced(other)
+
+    def __ror__(self, other):
+        return _forced(other) | self.force()
+
+    def __eq__(self, other):
+        """Relational operators, forcing the operands
+
+        Some examples:
+
+        >>> x = LazyIReal(IReal(1, 2)) + 1
+        >>> x == IReal(2, 3); IReal(2, 3) != x; x < 4; IReal(0.5) <= x
+        True
+        False
+        True
+        True
+        >>> 2.5 in x; abs(-x)
+        True
+        3.0
+        """
+        return self.force() == _forced(other)
+
+    def __ne__(self, other):
+        return self.force() != _forced(other)
+
+    def __lt__(self, other):
+        return self.force() < _forced(other)
+
+    def __le__(self, other):
+        return self.force() <= _forced(other)
+
+    def __gt__(self, other):
+        return _forced(other) < self.force()
+
+    def __ge__(self, other):
+        return _forced(other) <= self.force()
+
+    def __contains__(self, other):
+        return _forced(other) in self.force()
+
+    def __abs__(self):
+        return abs(self.force())
+
+
+def _time_outputs(step, start, xs, outputs):
+    """Runs 'step' over xs into 'outputs' accumulators, returning the time"""
+    from time import time
+    begin = time()
+    acc = [start] * outputs
+    for i, x in enumerate(xs):
+        acc[i % outputs] = step(acc[i % outputs], x)
+    return time() - begin, acc[0]
+
+
+def _benchmark(n=100000, outputs=10, seed=0):
+    """Reports the time of large graphs of which one output is used
+
+    In "x*x" the squares are IReals and only the sums are lazy; in "Horner"
+    both operations of each step are lazy.
+    """
+    from random import Random
+    from time import time
+    random = Random(seed)
+    xs = []
+    for i in range(n):
+        x = random.uniform(-1, 1)
+        xs.append(IReal(x, x + random.uniform(0, 1e-6)))
+    steps = [
+        ("x*x", lambda acc, x: acc + x * x),
+        ("Horner", lambda acc, x: acc * 0.5 + x)
+    ]
+    for name, step in steps:
+        print(name)
+        elapsed, value = _time_outputs(step, IReal(0), xs, outputs)
+        print("  %-20s %8.4f s  width %.17g" % ("IReal, all outputs",
+            elapsed, value.diameter()))
+        graph, lazy = _time_outputs(step, LazyIReal(), xs, outputs)
+        print("  %-20s %8.4f s" % ("LazyIReal graph", graph))
+        for fuse in (False, True):
+            start = time()
+            value = lazy.force(fuse=fuse)
+            elapsed = time() - start
+            print("  %-20s %8.4f s  width %.17g" % ("force, %s" % \
+                ("fused" if fuse else "unfused"), elapsed, value.diameter()))
+        print("  %-20s %8.4f s" % ("graph + fused", graph + elapsed))
+        lazy = None
@@ -0,0 +1,407 @@
+# ode.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Validated ODE integration module
+
+Provides an integrator computing guaranteed enclosures of the solutions of
+autonomous systems of ordinary differential equations x' = f(x), through the
+validated Taylor series method: each step finds an a priori enclosure of the
+solution over the step, bounds the Taylor remainder on it and propagates the
+set of solutions in Lohner's QR form to keep the wrapping effect under
+control. See:
+
+[1] Lohner, R. J., Enclosing the Solutions of Ordinary Initial and Boundary
+    Value Problems. In Computer Arithmetic: Scientific Computation and
+    Programming Languages, Teubner, Stuttgart, 1987.
+[2] Nedialkov, N. S., Jackson, K. R., Corliss, G. F., Validated Solutions of
+    Initial Value Problems for Ordinary Differential Equations. Applied
+    Mathematics and Computation 105, 1999.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.errors import IntervalError
+from intpy.ireal import IReal
+from intpy.taylor import Taylor
+
+
+__all__ = [
+    "TaylorIntegrator"
+]
+
+
+def _as_ireal(x):
+    return x if type(x) == IReal else IReal(x)
+
+
+class _Dual(object):
+    """An interval with enclosures of its partial derivatives
+
+    It's the forward mode of automatic differentiation over IReal, used to get
+    the Jacobian of the Taylor coefficients with respect to the initial
+    condition. Numbers and IReals are taken as constants.
+    """
+
+    def __init__(self, value, grad):
+        self.value, self.grad = value, grad
+
+    def __neg__(self):
+        return _Dual(-self.value, [-g for g in self.grad])
+
+    def __add__(self, other):
+        if type(other) == _Dual:
+            return _Dual(self.value + other.value,
+                [g1 + g2 for g1, g2 in zip(self.grad, other.grad)])
+        return _Dual(self.value + other, self.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) == _Dual:
+            return _Dual(self.value - other.value,
+                [g1 - g2 for g1, g2 in zip(self.grad, other.grad)])
+        return _Dual(self.value - other, self.grad)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> x = _Dual(IReal(3), [IReal(1), IReal(0)])
+        >>> y = _Dual(IReal(2), [IReal(0), IReal(1)])
+        >>> z = x * y * 2; z.value, z.grad
+        ([12.0, 12.0], [[4.0, 4.0], [6.0, 6.0]])
+        """
+        if type(other) == _Dual:
+            return _Dual(self.value * other.value,
+                [g1 * other.value + g2 * self.value for g1, g2 in \
+                zip(self.grad, other.grad)])
+        return _Dual(self.value * other, [g * other for g in self.grad])
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Division operator
+
+        Some examples:
+
+        >>> x = _Dual(IReal(3), [IReal(1)])
+        >>> z = 1 / x; z.value.inf <= 1.0/3 <= z.value.sup
+        True
+        >>> z.grad[0].inf <= -1.0/9 <= z.grad[0].sup
+        True
+        """
+        if type(other) == _Dual:
+            quotient = self.value / other.value
+            return _Dual(quotient, [(g1 - quotient * g2) / other.value for \
+                g1, g2 in zip(self.grad, other.grad)])
+        return _Dual(self.value / other, [g / other for g in self.grad])
+
+    def __rdiv__(self, other):
+        quotient = _as_ireal(other) / self.value
+        return _Dual(quotient, [-(quotient * g) / self.value for g in \
+            self.grad])
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+
+def _coefficients(f, x, coeffs):
+    """Computes the Taylor coefficients of the solution through 'x'
+
+    The coefficients are written in 'coeffs', a list with a list of the
+    coefficients for each component, whose length gives the order. The
+    recurrence x[k+1] = f(x)[k] / (k+1) is used, evaluating 'f' on the series
+    truncated at each order. Some examples:
+
+    >>> coeffs = [[None] * 4]
+    >>> _coefficients(lambda x: [x[0]], [IReal(1)], coeffs)
+    >>> coeffs[0][3].inf <= 1.0/6 <= coeffs[0][3].sup
+    True
+    """
+    n = len(x)
+    for i in range(n):
+        coeffs[i][0] = x[i]
+    for k in range(len(coeffs[0]) - 1):
+        values = f([Taylor(coeffs[i][:k+1]) for i in range(n)])
+        for i in range(n):
+            value = values[i]
+            if isinstance(value, Taylor):
+                value = value[k]
+            elif k > 0:
+                value = x[i] * 0
+            else:
+                value = x[i] * 0 + value
+            coeffs[i][k+1] = value / (k + 1)
+
+
+def _horner(coeffs, h):
+    """Evaluates the polynomial with the given coefficients at 'h'
+
+    >>> _horner([IReal(1), IReal(2), IReal(3)], IReal(2))
+    [17.0, 17.0]
+    """
+    ret = coeffs[-1]
+    for c in coeffs[-2::-1]:
+        ret = ret * h + c
+    return ret
+
+
+def _subset(x, y):
+    return min([x[i].inf > y[i].inf and x[i].sup < y[i].sup for i in \
+        range(len(x))])
+
+
+def _matmul(a, b):
+    """Product of matrices of IReals or floats, with IReals in 'a' or 'b'"""
+    n, m, p = len(a), len(b), len(b[0])
+    return [[sum([_as_ireal(a[i][k]) * b[k][j] for k in range(1, m)],
+        _as_ireal(a[i][0]) * b[0][j]) for j in range(p)] for i in range(n)]
+
+
+def _matvec(a, v):
+    return [row[0] for row in _matmul(a, [[x] for x in v])]
+
+
+def _orthonormalize(m, r):
+    """Returns a float orthogonal matrix close to the float matrix 'm'
+
+    The columns are taken by decreasing length of their contribution to the
+    parallelepiped m*r and orthonormalized by Gram-Schmidt, which is the
+    pivoting suggested by Lohner. Some examples:
+
+    >>> _orthonormalize([[2.0, 0.0], [0.0, 1.0]], [IReal(-1, 1)] * 2)
+    [[1.0, 0.0], [0.0, 1.0]]
+    >>> _orthonormalize([[1.0, 0.0], [0.0, 3.0]], [IReal(-1, 1)] * 2)
+    [[0.0, 1.0], [1.0, 0.0]]
+    """
+    n = len(m)
+    columns = [[m[i][j] for i in range(n)] for j in range(n)]
+    lengths = [sum([c*c for c in columns[j]]) ** 0.5 * r[j].diameter() for \
+        j in range(n)]
+    order = sorted(range(n), key=lambda j: -lengths[j])
+    candidates = [columns[j] for j in order] + \
+        [[float(i == j) for i in range(n)] for j in range(n)]
+    q = []
+    for v in candidates:
+        if len(q) == n:
+            break
+        scale = max([abs(c) for c in v])
+        for u in q:
+            dot = sum([a*b for a, b in zip(u, v)])
+            v = [a - dot*b for a, b in zip(v, u)]
+        norm = sum([a*a for a in v]) ** 0.5
+        if norm > 1e-8 * scale:
+            q.append([a / norm for a in v])
+    return [[q[j][i] for j in range(n)] for i in range(n)]
+
+
+def _inverse(q):
+    """Encloses the inverse of a float matrix close to an orthogonal one
+
+    With E = I - Q'Q and ||E|| <= b < 1, the inverse (I - E)^-1 Q' differs
+    from Q' by at most b/(1 - b) ||Q'|| in each entry. Some examples:
+
+    >>> x = _inverse([[0.6, -0.8], [0.8, 0.6]])
+    >>> 0.8 in x[0][1] and -0.8 in x[1][0] and x[0][0].diameter() < 1e-14
+    True
+    """
+    n = len(q)
+    qt = [[IReal(q[j][i]) for j in range(n)] for i in range(n)]
+    e = _matmul(qt, q)
+    b = IReal(0)
+    for i in range(n):
+        row = IReal(0)
+        for j in range(n):
+            row = row + abs(e[i][j] - IReal(float(i == j)))
+        b = IReal(max(b.sup, row.sup))
+    if b.sup >= 1.0:
+        raise IntervalError("the QR factor is too far from orthogonal")
+    delta = (b / (IReal(1) - b)).sup
+    ret = []
+    for i in range(n):
+        ret.append([])
+        for j in range(n):
+            radius = IReal(delta) * sum([IReal(abs(c)) for c in q[j]],
+                IReal(0))
+            ret[i].append(qt[i][j] + IReal(-radius.sup, radius.sup))
+    return ret
+
+
+class TaylorIntegrator(object):
+    """Validated Taylor series integrator for autonomous ODE systems
+
+    The vector field 'f' takes a list with the state components and returns
+    a list with their derivatives, written only with the arithmetic operators,
+    since it's evaluated on IReals, on Taylor series and on their derivatives.
+    Constants not exactly representable should be given as IReals, like
+    IReal("8/3"), and put on the right side of the operators. Non-autonomous
+    systems can be integrated by adding the time as a state component with
+    derivative 1.
+
+    The set of solutions is kept in Lohner's form {m + A*r}, with a point 'm',
+    an orthogonal float matrix 'A' and an interval vector 'r', and the
+    coefficient lists used by each step are allocated once and reused.
+    """
+
+    def __init__(self, f, x0, step=0.01, order=10, min_step=1e-12):
+        """Constructor of the TaylorIntegrator class
+
+        The initial condition 'x0' is a list of IReals, or anything accepted by
+        the IReal constructor, and 'step' is the largest step size. When the a
+        priori enclosure can't be validated the step is halved down to
+        'min_step'. Some examples:
+
+        >>> ode = TaylorIntegrator(lambda x: [x[1], -x[0]], [1, 0], step=0.125)
+        >>> x = ode.integrate(1)
+        >>> from math import cos, sin
+        >>> cos(1) in x[0] and -sin(1) in x[1]
+        True
+        >>> x[0].diameter() < 1e-12 and ode.steps
+        8
+        >>> ode.time
+        [1.0, 1.0]
+        """
+        self._f = f
+        x0 = [_as_ireal(x) for x in x0]
+        n = len(x0)
+        self._x = x0
+        self._m = [x.middle() for x in x0]
+        self._a = [[float(i == j) for j in range(n)] for i in range(n)]
+        self._r = [x - m for x, m in zip(x0, self._m)]
+        self._time = IReal(0)
+        self._step = float(step)
+        self._min_step = float(min_step)
+        self._order = order
+        self._steps = 0
+        self._point_coeffs = [[None] * (order + 1) for i in range(n)]
+        self._jacobian_coeffs = [[None] * order for i in range(n)]
+
+    enclosure = property(fget=lambda self: list(self._x))
+    time = property(fget=lambda self: self._time)
+    steps = property(fget=lambda self: self._steps)
+
+    def _a_priori(self, h):
+        """Finds a box containing all the solutions over a step of size 'h'
+
+        It returns None if the box couldn't be validated.
+        """
+        f, x = self._f, self._x
+        t = IReal(0, h.sup)
+        b = [xi + t * fi for xi, fi in zip(x, f(x))]
+        for i in range(4):
+            radius = [bi.diameter() * 0.1 + 1e-14 * abs(bi) + 1e-300 for bi \
+                in b]
+            b = [bi + IReal(-r, r) for bi, r in zip(b, radius)]
+            new_b = [xi + t * fi for xi, fi in zip(x, f(b))]
+            if _subset(new_b, b):
+                return new_b
+            b = new_b
+        return None
+
+    def _try_step(self, h):
+        """Tries a step of size 'h' returning True if it was validated"""
+        b = self._a_priori(h)
+        if b is None:
+            return False
+        f, n, p = self._f, len(self._x), self._order
+        coeffs = self._point_coeffs
+        _coefficients(f, b, coeffs)
+        remainder = [coeffs[i][p] for i in range(n)]
+        _coefficients(f, [IReal(m) for m in self._m], coeffs)
+        power = IReal(1)
+        for k in range(p):
+            power = power * h
+        y = [_horner(coeffs[i][:p], h) + remainder[i] * power for i in \
+            range(n)]
+        grad = [[IReal(float(i == j)) for j in range(n)] for i in range(n)]
+        duals = [_Dual(xi, gi) for xi, gi in zip(self._x, grad)]
+        _coefficients(f, duals, self._jacobian_coeffs)
+        s = [[_horner([c.grad[j] for c in self._jacobian_coeffs[i]], h) for \
+            j in range(n)] for i in range(n)]
+        sa = _matmul(s, self._a)
+        m = [yi.middle() for yi in y]
+        a = _orthonormalize([[x.middle() for x in row] for row in sa], self._r)
+        a_inverse = _inverse(a)
+        r = [u + v for u, v in zip(_matvec(_matmul(a_inverse, sa), self._r),
+            _matvec(a_inverse, [yi - mi for yi, mi in zip(y, m)]))]
+        x = [u + v for u, v in zip(y, _matvec(sa, self._r))]
+        lohner = [u + mi for u, mi in zip(_matvec(a, r), m)]
+        for i in range(n):
+            if not (x[i] & lohner[i]).empty:
+                x[i] = x[i] & lohner[i]
+        self._x = x
+        self._m, self._a, self._r = m, a, r
+        return True
+
+    def step(self, t_end=None):
+        """Does one validated step, without going past 't_end' if given
+
+        It returns the size of the step as an IReal, which is not degenerate
+        only for the last step reaching 't_end'. An IntervalError is raised if
+        no step larger than the minimum step size could be validated.
+        """
+        h = self._step
+        while h >= self._min_step:
+            if t_end is not None and (self._time + h).sup >= t_end:
+                step = IReal(t_end) - self._time
+                last = True
+            else:
+                step = IReal(h)
+                last = False
+            if self._try_step(step):
+                self._time = IReal(t_end) if last else self._time + step
+                self._steps += 1
+                return step
+            h = h / 2
+        raise IntervalError("the a priori enclosure couldn't be validated")
+
+    def integrate(self, t_end):
+        """Integrates up to the time 't_end' returning the state enclosure"""
+        while self._time.sup < t_end:
+            self.step(t_end)
+        return self.enclosure
+
+
+def _lorenz(x):
+    return [(x[1] - x[0]) * 10.0, x[0] * (-x[2] + 28.0) - x[1],
+        x[0] * x[1] - x[2] * IReal("8/3")]
+
+
+def _benchmark(t_end=1.0, step=0.01, order=10):
+    """Reports steps per second and final enclosure widths on some systems"""
+    from time import time
+    systems = [
+        ("harmonic oscillator", lambda x: [x[1], -x[0]], [1, 0]),
+        ("Van der Pol (mu=1)", lambda x: [x[1], (-(x[0] * x[0]) + 1) * \
+            x[1] - x[0]], [2, 0]),
+        ("Lorenz (10, 28, 8/3)", _lorenz, [15, 15, 36]),
+    ]
+    for name, f, x0 in systems:
+        ode = TaylorIntegrator(f, x0, step=step, order=order)
+        start = time()
+        x = ode.integrate(t_end)
+        elapsed = time() - start
+        print("%-22s %5d steps %8.1f steps/s  max width %.3e" % (name,
+            ode.steps, ode.steps / elapsed, max([c.diameter() for c in x])))
@@ -0,0 +1,437 @@
+# persist.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Persistent memoization module
+
+It provides a decorator keeping the results of expensive interval functions
+in a file, so they're computed only once across runs of a program. The
+results are keyed on the exact bits of the limits of the arguments, as well
+as on their emptiness or undefinedness, and on the function itself: its
+module, its name, its code and the values bound to it, so changing the
+function invalidates its old results.
+
+The file is a SQLite database, whose locking lets concurrent processes share
+it safely. The least recently used results are evicted once the total size
+of the stored results exceeds a cap.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+from functools import update_wrapper
+from struct import pack
+
+from intpy.icomplex import IComplex
+from intpy.ireal import IReal
+from intpy.ireal import IRealArray
+from intpy.ireal import IRealMP
+
+
+__all__ = [
+    "memoize"
+]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+"""
+
+
+_TOUCH = "(SELECT COALESCE(MAX(used), 0) + 1 FROM results)"
+
+
+_integer_types = tuple(set([type(0), type(2 ** 64)]))
+_text_types = tuple(set([str, type(u"")]))
+
+
+def _bytes(values):
+    """Returns the raw bytes of an array of limits"""
+    return values.tobytes() if hasattr(values, "tobytes") else \
+        values.tostring()
+
+
+def _encode(value, chunks):
+    """Appends the canonical bytes of an argument to the list 'chunks'
+
+    Every type gets its own tag, so equal keys only come from arguments of
+    the same type, and the containers are prefixed by their lengths.
+    """
+    kind = type(value)
+    if kind in (IReal, IRealMP):
+        if value.empty:
+            chunks.append(b"E")
+        elif value.undefined:
+            chunks.append(b"U")
+        elif kind == IReal:
+            chunks.append(b"R" + pack("<dd", value.inf, value.sup))
+        else:
+            text = "%d:%d/%d:%d/%d;" % (value.prec, value.inf.numerator,
+                value.inf.denominator, value.sup.numerator,
+                value.sup.denominator)
+            chunks.append(b"M" + text.encode("ascii"))
+    elif kind == IRealArray:
+        chunks.append(b"A" + pack("<q", len(value)))
+        chunks.append(_bytes(value.inf) + _bytes(value.sup))
+    elif kind == IComplex:
+        chunks.append(b"C")
+        _encode(value.real, chunks)
+        _encode(value.imag, chunks)
+    elif kind == float:
+        chunks.append(b"F" + pack("<d", value))
+    elif kind == bool:
+        chunks.append(b"B1" if value else b"B0")
+    elif kind in _integer_types:
+        chunks.append(b"I" + ("%d;" % value).encode("ascii"))
+    elif kind in _text_types:
+        if not isinstance(value, bytes):
+            value = value.encode("utf-8")
+        chunks.append(b"S" + pack("<q", len(value)) + value)
+    elif kind == bytes:
+        chunks.append(b"Y" + pack("<q", len(value)) + value)
+    elif value is None:
+        chunks.append(b"N")
+    elif kind in (tuple, list):
+        chunks.append((b"T" if kind == tuple else b"L") + pack("<q",
+            len(value)))
+        for item in value:
+            _encode(item, chunks)
+    else:
+        raise TypeError("unsupported argument type for memoize: %s" %
+            kind.__name__)
+
+
+def _code_digest(code, digest):
+    """Updates 'digest' with what defines the behavior of a code object
+
+    The nested code objects of its constants are digested recursively, since
+    their representations hold their addresses, and the items of frozensets
+    are sorted, since their order changes between runs.
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _code_digest(const, digest)
+        elif type(const) == frozenset:
+            digest.update(("frozenset(%r)" % sorted([repr(x) for x in \
+                const])).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def _global_names(code, names):
+    """Adds the names used by a code object and its nested ones to a set"""
+    names.update(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _global_names(const, names)
+
+
+def _encode_bound(value, chunks, seen):
+    """Appends the bytes of a value bound to a function
+
+    Functions are given by their identities, the others as arguments.
+    """
+    if hasattr(value, "__code__"):
+        chunks.append(b"G" + (b"" if id(value) in seen else
+            _identity(value, seen)))
+    else:
+        _encode(value, chunks)
+
+
+def _identity(function, seen=None):
+    """Returns the digest identifying a function
+
+    Besides its name and its code, the values bound to it are digested: its
+    default arguments and closure cells, which must be supported argument
+    types or functions, and the globals it uses which are, while the others,
+    such as modules and classes, are left out.
+    """
+    seen = set() if seen is None else seen
+    seen.add(id(function))
+    digest = hashlib.sha1()
+    name = getattr(function, "__qualname__", function.__name__)
+    digest.update(("%s.%s;" % (function.__module__, name)).encode("utf-8"))
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return digest.digest()
+    _code_digest(code, digest)
+    chunks = []
+    for value in function.__defaults__ or ():
+        _encode_bound(value, chunks, seen)
+    kwdefaults = getattr(function, "__kwdefaults__", None) or {}
+    for key in sorted(kwdefaults):
+        _encode(key, chunks)
+        _encode_bound(kwdefaults[key], chunks, seen)
+    for cell in function.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            chunks.append(b"N")
+            continue
+        _encode_bound(value, chunks, seen)
+    names = set()
+    _global_names(code, names)
+    scope = getattr(function, "__globals__", {})
+    for key in sorted([key for key in names if key in scope]):
+        value, bound = scope[key], []
+        try:
+            _encode_bound(value, bound, seen)
+        except TypeError:
+            continue
+        _encode(key, chunks)
+        chunks.extend(bound)
+    digest.update(b"".join(chunks))
+    return digest.digest()
+
+
+class _Store(object):
+    """SQLite store of pickled results with least recently used eviction"""
+
+    def __init__(self, path, max_size):
+        self.path = path
+        self.max_size = max_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _connection(self):
+        """Returns the connection of the current thread and process
+
+        A connection can't be shared by threads nor survive a fork, so one
+        is opened for each of them. They're all kept, so close() can close
+        them from any thread.
+        """
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=60.0,
+                isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._lock.acquire()
+            try:
+                self._connections.append((connection, os.getpid()))
+            finally:
+                self._lock.release()
+            local.connection, local.pid = connection, os.getpid()
+        return local.connection
+
+    def close(self):
+        """Closes the connections opened by the threads of this process
+
+        No thread may be using the store meanwhile. The connections
+        inherited from a parent process are left to it, and the store opens
+        new ones if it's used again.
+        """
+        self._lock.acquire()
+        try:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        finally:
+            self._lock.release()
+        for connection, pid in connections:
+            if pid == os.getpid():
+                connection.close()
+
+    def get(self, key):
+        """Returns (True, value) for a stored key, otherwise (False, None)"""
+        connection = self._connection()
+        row = connection.execute("SELECT value FROM results WHERE key = ?",
+            (key,)).fetchone()
+        if row is None:
+            return False, None
+        connection.execute("UPDATE results SET used = %s WHERE key = ?" %
+            _TOUCH, (key,))
+        return True, pickle.loads(bytes(row[0]))
+
+    def put(self, key, value):
+        """Stores a value, evicting the least recently used ones if needed"""
+        data = pickle.dumps(value, 2)
+        size = len(key) + len(data)
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("INSERT OR REPLACE INTO results VALUES "
+                "(?, ?, ?, %s)" % _TOUCH, (key, sqlite3.Binary(data), size))
+            total = connection.execute("SELECT SUM(size) FROM results"
+                ).fetchone()[0]
+            if total > self.max_size:
+                evicted = []
+                for old, old_size in connection.execute("SELECT key, size "
+                        "FROM results ORDER BY used"):
+                    if total <= self.max_size:
+                        break
+                    evicted.append((old,))
+                    total -= old_size
+                connection.executemany("DELETE FROM results WHERE key = ?",
+                    evicted)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM results"
+            ).fetchone()[0]
+
+
+class _Memoized(object):
+    """Function wrapped by memoize, counting its hits and misses"""
+
+    def __init__(self, function, store):
+        update_wrapper(self, function)
+        self._function = function
+        self._store = store
+        self._identity = _identity(function)
+        self.hits = self.misses = 0
+
+    def __call__(self, *args, **kwargs):
+        chunks = [self._identity]
+        _encode(args, chunks)
+        for name in sorted(kwargs):
+            _encode(name, chunks)
+            _encode(kwargs[name], chunks)
+        key = sqlite3.Binary(hashlib.sha1(b"".join(chunks)).digest())
+        found, value = self._store.get(key)
+        if found:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = self._function(*args, **kwargs)
+        self._store.put(key, value)
+        return value
+
+    hit_rate = property(fget=lambda self: float(self.hits) / \
+        (self.hits + self.misses) if self.hits + self.misses else 0.0)
+
+    def close(self):
+        """Closes the file of the results, shared by the functions wrapped by
+        the same decorator, which reopen it if they're called again"""
+        self._store.close()
+
+
+def memoize(path, max_size=64 * 2 ** 20):
+    """Decorator keeping the results of a function in the file 'path'
+
+    The total size of the results kept, in bytes, is at most 'max_size', the
+    least recently used ones being evicted. The arguments may be IReals,
+    IRealMPs, IRealArrays, IComplexes, numbers, strings, None, and tuples or
+    lists of them, and the results anything that can be pickled. The wrapped
+    function counts its hits and misses, reports its hit rate, and its
+    close() method closes the file.
+
+    Some examples:
+
+    >>> from os.path import join
+    >>> from shutil import rmtree
+    >>> from tempfile import mkdtemp
+    >>> directory = mkdtemp()
+    >>> path = join(directory, "results.db")
+    >>> @memoize(path)
+    ... def square(x):
+    ...     return x * x
+    >>> square(IReal(1, 2)); square(IReal(1, 2)); square(IReal(1, 3))
+    [1.0, 4.0]
+    [1.0, 4.0]
+    [1.0, 9.0]
+    >>> square.hits, square.misses, square.hit_rate
+    (1, 2, 0.3333333333333333)
+    >>> square(IReal("undefined")); square(IReal("undefined")); square.hits
+    undefined interval
+    undefined interval
+    2
+    >>> square.close()
+
+    The results are kept across runs, as long as the function isn't changed:
+
+    >>> @memoize(path)
+    ... def square(x):
+    ...     return x * x
+    >>> square(IReal(1, 3)); square.hits
+    [1.0, 9.0]
+    1
+    >>> square.close()
+    >>> @memoize(path)
+    ... def square(x):
+    ...     return x * +x
+    >>> square(IReal(1, 3)); square.hits
+    [1.0, 9.0]
+    0
+    >>> square.close()
+
+    The default arguments and the closures are part of the function:
+
+    >>> def make(k):
+    ...     return memoize(path)(lambda x: x * k)
+    >>> f, g = make(2), make(3)
+    >>> f(IReal(1)); g(IReal(1))
+    [2.0, 2.0]
+    [3.0, 3.0]
+    >>> f.close(); g.close()
+    >>> @memoize(path)
+    ... def scale(x, k=2):
+    ...     return x * k
+    >>> scale(IReal(1)); scale.close()
+    [2.0, 2.0]
+    >>> @memoize(path)
+    ... def scale(x, k=3):
+    ...     return x * k
+    >>> scale(IReal(1)); scale.hits
+    [3.0, 3.0]
+    0
+    >>> scale.close()
+    >>> memoize(path)(lambda x, k={}: x) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    TypeError: unsupported argument type for memoize: dict
+
+    The least recently used results are evicted once over the cap:
+
+    >>> @memoize(join(directory, "capped.db"), max_size=200)
+    ... def double(x):
+    ...     return x + x
+    >>> double(IReal(1)); double(IReal(2)); double(IReal(1))
+    [2.0, 2.0]
+    [4.0, 4.0]
+    [2.0, 2.0]
+    >>> double.misses
+    3
+    >>> double([1, "a"])
+    [1, 'a', 1, 'a']
+    >>> double({}) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    TypeError: unsupported argument type for memoize: dict
+    >>> double.close(); rmtree(directory)
+    """
+    store = _Store(path, max_size)
+    return lambda function: _Memoized(function, store)
+
@@ -0,0 +1,454 @@
+# poly.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Interval polynomials module
+
+Evaluating a polynomial with the IReal operators parses its coefficients and
+builds a temporary interval at each operation, and the power form, where x
+occurs once per term, overestimates the range much more than needed. Here the
+coefficients are parsed once into an IRealArray, and the polynomial is
+evaluated on the limits of the intervals by the Horner scheme
+
+    p(x) = c[0] + x*(c[1] + x*(c[2] + ... + x*c[n]))
+
+and by the centered (mean value) form
+
+    p(x) = p(m) + p'(x)*(x - m),  m the middle of x
+
+whose overestimation decreases quadratically with the diameter of x [1].
+Both contain the range of the polynomial, so their intersection is taken.
+The real roots are isolated by bisection and the interval Newton method [2].
+
+[1] Moore, R. E., Methods and Applications of Interval Analysis. SIAM Studies
+    in Applied Mathematics, Philadelphia, 1979.
+[2] Hansen, E., Walster, G. W., Global Optimization Using Interval Analysis.
+    2nd ed., Marcel Dekker, New York, 2004.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.ireal import IReal
+from intpy.ireal import IRealArray
+from intpy.ireal.ireal import _from_limits
+from intpy.ireal.ireal import _mul_operands
+from intpy.ireal.ireal import _operand_limits
+from intpy.support import backend
+from intpy.support import rounding
+
+
+__all__ = [
+    "Polynomial"
+]
+
+
+def _mul(x1, y1, x2, y2):
+    """Returns the limits of the product [x1, y1]*[x2, y2]"""
+    operands = _mul_operands(x1, y1, x2, y2)
+    if operands is None:
+        inf1, sup1 = backend.mul(x1, y2, x1, x2)
+        inf2, sup2 = backend.mul(y1, x2, y1, y2)
+        return min(inf1, inf2), max(sup1, sup2)
+    return backend.mul(*operands)
+
+
+def _horner(infs, sups, x1, y1):
+    """Returns the limits of the Horner scheme on the interval [x1, y1]
+
+    The coefficients are given by their infimums and supremums, from the
+    constant term up. Some examples:
+
+    >>> _horner([1.0, -2.0, 1.0], [1.0, -2.0, 1.0], 0.0, 2.0)
+    (-3.0, 1.0)
+    """
+    inf, sup = infs[-1], sups[-1]
+    for k in range(len(infs) - 2, -1, -1):
+        inf, sup = _mul(inf, sup, x1, y1)
+        inf, sup = backend.add(inf, infs[k], sup, sups[k])
+    return inf, sup
+
+
+def _middle(x1, y1):
+    """Returns a float in [x1, y1] near its middle, safe from overflow"""
+    return max(x1, min(y1, x1 * 0.5 + y1 * 0.5))
+
+
+def _intersection(inf1, sup1, inf2, sup2):
+    """Returns the limits of the intersection of two enclosures of a range
+
+    Both contain the range, so the intersection isn't empty, and an undefined
+    enclosure gives place to the other one. Some examples:
+
+    >>> _intersection(-1.0, 2.0, 0.0, 3.0)
+    (0.0, 2.0)
+    >>> _intersection(float("nan"), float("nan"), 0.0, 3.0)
+    (0.0, 3.0)
+    """
+    if inf1 != inf1 or sup1 != sup1:
+        return inf2, sup2
+    if inf2 != inf2 or sup2 != sup2:
+        return inf1, sup1
+    return max(inf1, inf2), min(sup1, sup2)
+
+
+class Polynomial(object):
+    """A polynomial with Real Interval coefficients
+
+    The coefficients are given from the constant term up, as anything accepted
+    by the IReal constructor, and they're parsed once when the polynomial is
+    built. Calling the polynomial on an interval encloses its range over it,
+    and calling it on an IRealArray encloses its ranges over all the elements
+    at once.
+    """
+
+    def __init__(self, coeffs):
+        """Constructor of the Polynomial class
+
+        For more information about the Polynomial class, see the class
+        docstring. Some examples of how to use this constructor follow below:
+
+        >>> Polynomial([1, IReal(-2, -1), "0.5"]).degree
+        2
+        >>> Polynomial(IRealArray([1, 2])).coeffs
+        IRealArray([[1.0, 1.0], [2.0, 2.0]])
+        >>> Polynomial([]) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        if type(coeffs) != IRealArray:
+            coeffs = IRealArray(coeffs)
+        if not len(coeffs):
+            raise ValueError("a polynomial needs at least one coefficient")
+        self._coeffs = coeffs
+        self._infs, self._sups = list(coeffs.inf), list(coeffs.sup)
+        self._terms = list(coeffs)
+        self._derivative = None
+
+    coeffs = property(fget=lambda self: self._coeffs)
+    degree = property(fget=lambda self: len(self._coeffs) - 1)
+
+    def __repr__(self):
+        """Gives a representation of the polynomial
+
+        Some examples:
+
+        >>> Polynomial([1, IReal(-1, 1)])
+        Polynomial([[1.0, 1.0], [-1.0, 1.0]])
+        """
+        return "Polynomial([%s])" % ", ".join([repr(x) for x in self._terms])
+
+    def derivative(self):
+        """Returns the derivative of the polynomial
+
+        Some examples:
+
+        >>> Polynomial([1, 2, 3]).derivative()
+        Polynomial([[2.0, 2.0], [6.0, 6.0]])
+        >>> Polynomial([1]).derivative()
+        Polynomial([[0.0, 0.0]])
+        """
+        if self._derivative is None:
+            if len(self._coeffs) == 1:
+                self._derivative = Polynomial([0])
+            else:
+                self._derivative = Polynomial(self._coeffs[1:] *
+                    IRealArray(range(1, len(self._coeffs))))
+        return self._derivative
+
+    def horner(self, x):
+        """Encloses the range of the polynomial over 'x' by the Horner scheme
+
+        The result is the one of the Horner scheme written with the IReal
+        operators. Some examples:
+
+        >>> p = Polynomial([1, -2, 1])
+        >>> p.horner(IReal(0, 2))
+        [-3.0, 1.0]
+        >>> x = IReal("0.1", "0.3")
+        >>> p.horner(x) == 1 + x * (-2 + x * 1)
+        True
+        >>> p.horner(IReal("undefined"))
+        undefined interval
+        >>> p.horner(IReal()) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        """
+        x1, y1 = _operand_limits(x)
+        if x1 != x1 or y1 != y1:
+            return IReal("undefined")
+        return _from_limits(*_horner(self._infs, self._sups, x1, y1))
+
+    def centered(self, x):
+        """Encloses the range of the polynomial over 'x' by the centered form
+
+        Some examples:
+
+        >>> p = Polynomial([1, -2, 1])
+        >>> p.centered(IReal(0, 2))
+        [-2.0, 2.0]
+        >>> p.centered(IReal(0.875, 1.125))
+        [-0.03125, 0.03125]
+        """
+        x1, y1 = _operand_limits(x)
+        if x1 != x1 or y1 != y1:
+            return IReal("undefined")
+        return _from_limits(*self._centered(x1, y1))
+
+    def _centered(self, x1, y1):
+        derivative = self.derivative()
+        middle = _middle(x1, y1)
+        inf, sup = _horner(self._infs, self._sups, middle, middle)
+        slope = _horner(derivative._infs, derivative._sups, x1, y1)
+        offset = backend.sub(x1, middle, y1, middle)
+        slope = _mul(slope[0], slope[1], offset[0], offset[1])
+        return backend.add(inf, slope[0], sup, slope[1])
+
+    def __call__(self, x):
+        """Encloses the range of the polynomial over 'x'
+
+        It's the intersection of the Horner scheme and the centered form, or
+        the Horner scheme alone up to degree one, where it's exact. An
+        IRealArray is evaluated as a whole by evaluate(). Some examples:
+
+        >>> p = Polynomial([1, -2, 1])
+        >>> p.horner(IReal(0.875, 1.125))
+        [-0.265625, 0.234375]
+        >>> p(IReal(0.875, 1.125))
+        [-0.03125, 0.03125]
+        >>> p(IReal(-1, 0))
+        [1.0, 4.0]
+        >>> p(IRealArray([IReal(0.875, 1.125), IReal(-1, 0)]))
+        IRealArray([[-0.03125, 0.03125], [1.0, 4.0]])
+        >>> Polynomial([1, IReal(-1, 1)])(2)
+        [-1.0, 3.0]
+        """
+        if type(x) == IRealArray:
+            return self.evaluate(x)
+        x1, y1 = _operand_limits(x)
+        if x1 != x1 or y1 != y1:
+            return IReal("undefined")
+        inf, sup = _horner(self._infs, self._sups, x1, y1)
+        if len(self._infs) > 2 and x1 != y1:
+            inf, sup = _intersection(inf, sup, *self._centered(x1, y1))
+        return _from_limits(inf, sup)
+
+    def _evaluate_horner(self, xs):
+        n = len(xs)
+        ret = IRealArray.from_limits([self._infs[-1]] * n,
+            [self._sups[-1]] * n)
+        for k in range(len(self._terms) - 2, -1, -1):
+            ret = ret * xs + self._terms[k]
+        return ret
+
+    def evaluate(self, xs):
+        """Encloses the ranges of the polynomial over the elements of 'xs'
+
+        The operations are done on whole arrays, so it's much faster than
+        calling the polynomial on each element, giving the same enclosures.
+        Some examples:
+
+        >>> rounding_mode_backup = rounding.get_mode()
+        >>> p = Polynomial([1, -2, 1])
+        >>> p.evaluate([IReal(0.875, 1.125), "undefined", 3])
+        IRealArray([[-0.03125, 0.03125], undefined interval, [4.0, 4.0]])
+        >>> from random import Random
+        >>> from intpy.ireal.ireal import _random_limits
+        >>> random = Random(0)
+        >>> x = [IReal(*_random_limits(random)) for i in range(100)]
+        >>> p = Polynomial(["0.1", -3, IReal(1, 2), "-0.7"])
+        >>> list(p.evaluate(x)) == [p(a) for a in x]
+        True
+        >>> rounding_mode_backup == rounding.get_mode()
+        True
+        """
+        if type(xs) != IRealArray:
+            xs = IRealArray(xs)
+        ret = self._evaluate_horner(xs)
+        if len(self._infs) <= 2:
+            return ret
+        middles = [_middle(x1, y1) for x1, y1 in zip(xs.inf, xs.sup)]
+        middles = IRealArray.from_limits(middles, middles)
+        centered = self._evaluate_horner(middles) + \
+            self.derivative()._evaluate_horner(xs) * (xs - middles)
+        limits = [_intersection(*limits[2:]) if limits[0] != limits[1] else
+            limits[2:4] for limits in zip(xs.inf, xs.sup, ret.inf, ret.sup,
+            centered.inf, centered.sup)]
+        return IRealArray.from_limits([x[0] for x in limits],
+            [x[1] for x in limits])
+
+    def roots(self, domain=None, tol=1e-12, max_iter=10000):
+        """Isolates the real roots of the polynomial in 'domain'
+
+        The domain defaults to the interval bounding all the roots by the
+        Cauchy bound, so the leading coefficient can't contain zero then. It
+        returns a sorted list of pairs (x, unique), meaning that no root of
+        the domain lies outside the intervals x, and that x contains exactly
+        one simple root if unique is true. Otherwise x has a diameter of at
+        most 'tol', or it's left when 'max_iter' intervals have been
+        processed, and it may contain no root or several ones. Some examples:
+
+        >>> p = Polynomial([2, 0, -1])
+        >>> [(x.inf <= 2 ** 0.5 <= x.sup, unique) for x, unique in p.roots()]
+        [(False, True), (True, True)]
+        >>> [x for x, unique in p.roots(IReal(-1, 1))]
+        []
+        >>> Polynomial([-2, 1]).roots(IReal(0, 4))
+        [([2.0, 2.0], True)]
+        >>> roots = Polynomial([1, -2, 1]).roots(tol=1e-6)
+        >>> [unique for x, unique in roots if 1 in x]
+        [False]
+        >>> max([x.distance(IReal(1)) for x, unique in roots]) <= 1e-5
+        True
+        >>> p = Polynomial([1, IReal(-1, 1)])
+        >>> p.roots() # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        if domain is None:
+            lead = self._terms[-1]
+            if 0.0 in lead:
+                raise ValueError("the leading coefficient contains zero, so "
+                    "a domain must be given")
+            bound = max([abs(x) for x in self._terms[:-1]] + [0.0])
+            bound = (1 + IReal(bound) / min(abs(lead.inf), abs(lead.sup))).sup
+            domain = IReal(-bound, bound)
+        domain = _from_limits(*_operand_limits(domain))
+        derivative = self.derivative()
+        ret = []
+        stack = [domain]
+        while stack and max_iter > 0:
+            max_iter -= 1
+            x = stack.pop()
+            if 0.0 not in self(x):
+                continue
+            slope = derivative(x)
+            if 0.0 not in slope:
+                # Newton steps while they contract well, the interval holding
+                # a unique root once a step maps it into itself
+                unique = False
+                while True:
+                    middle = _middle(x.inf, x.sup)
+                    step = middle - self.horner(middle) / slope
+                    unique = unique or step in x
+                    new = x & step
+                    if new.empty:
+                        break
+                    done = new.diameter() <= tol or \
+                        new.diameter() > 0.5 * x.diameter()
+                    x = new
+                    if done:
+                        break
+                    slope = derivative(x)
+                if new.empty:
+                    continue
+                if unique:
+                    _append(ret, x, True)
+                    continue
+            middle = _middle(x.inf, x.sup)
+            if x.diameter() <= tol or not x.inf < middle < x.sup:
+                _append(ret, x, False)
+            else:
+                stack.extend([IReal(middle, x.sup), IReal(x.inf, middle)])
+        for x in reversed(stack):
+            _append(ret, x, False)
+        return ret
+
+
+def _append(roots, x, unique):
+    """Appends an enclosure of roots, merging it with an overlapping last one
+
+    Some examples:
+
+    >>> roots = [(IReal(0, 1), True)]
+    >>> _append(roots, IReal(1, 2), True); roots
+    [([0.0, 2.0], False)]
+    >>> _append(roots, IReal(3), True); roots
+    [([0.0, 2.0], False), ([3.0, 3.0], True)]
+    >>> _append(roots, IReal(3), True); roots
+    [([0.0, 2.0], False), ([3.0, 3.0], True)]
+    """
+    if roots and roots[-1][0].sup >= x.inf:
+        last, last_unique = roots.pop()
+        if last == x:
+            unique = unique and last_unique
+        else:
+            x, unique = IReal(last.inf, max(last.sup, x.sup)), False
+    roots.append((x, unique))
+
+
+def _chained(coeffs, x):
+    """Evaluates the power form of a polynomial with the IReal operators"""
+    ret, power = IReal(coeffs[0]), IReal(1)
+    for coeff in coeffs[1:]:
+        power = power * x
+        ret = ret + IReal(coeff) * power
+    return ret
+
+
+def _chained_horner(coeffs, x):
+    """Evaluates the Horner scheme of a polynomial with the IReal operators"""
+    ret = IReal(coeffs[-1])
+    for coeff in coeffs[-2::-1]:
+        ret = ret * x + IReal(coeff)
+    return ret
+
+
+def _benchmark(n=10000, degree=8, seed=0):
+    """Reports times and mean widths of polynomial evaluations
+
+    The polynomial is the Chebyshev one of the given degree, evaluated on
+    random intervals of [-1, 1] of diameters up to 0.01.
+    """
+    from random import Random
+    from time import time
+    random = Random(seed)
+    coeffs = [[1], [0, 1]]
+    while len(coeffs) <= degree:
+        coeffs.append([0] + [2 * c for c in coeffs[-1]])
+        coeffs[-1] = [a - b for a, b in zip(coeffs[-1], coeffs[-3] + [0, 0])]
+    coeffs = [str(c) for c in coeffs[degree]]
+    xs = []
+    for i in range(n):
+        low = random.uniform(-1, 0.99)
+        xs.append(IReal(low, low + random.uniform(0, 0.01)))
+    p = Polynomial(coeffs)
+    ys = IRealArray(xs)
+    results = []
+    for name, f in (("chained power form", lambda x: _chained(coeffs, x)),
+        ("chained Horner", lambda x: _chained_horner(coeffs, x)),
+        ("Polynomial.horner", p.horner), ("Polynomial.centered", p.centered),
+        ("Polynomial", p)):
+        start = time()
+        results.append((name, [f(x) for x in xs], time() - start))
+    start = time()
+    results.append(("Polynomial.evaluate", list(p.evaluate(ys)),
+        time() - start))
+    plain = results[0][2]
+    for name, values, elapsed in results:
+        width = sum([x.diameter() for x in values]) / n
+        print("%-22s %8.4f s %6.2fx  mean width %.3g" % (name, elapsed,
+            plain / elapsed, width))
+    start = time()
+    roots = p.roots()
+    print("%d roots of the Chebyshev polynomial isolated in %.4f s, %d unique"
+        % (len(roots), time() - start, len([x for x in roots if x[1]])))
@@ -0,0 +1,316 @@
+# shared.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Shared memory interval arrays module
+
+Provides arrays of Real Intervals living in a shared memory segment, so
+processes exchanging intervals see the same buffers with no copies. The
+segment holds the length of the array, the buffer of infimums, the buffer of
+supremums, and a buffer of states telling the undefined and the empty
+intervals apart. Pickling an array, e.g. to send it to the workers of a
+process pool, only pickles the name of its segment, and unpickling attaches
+to it.
+
+The process creating an array owns its segment and must unlink it when it's
+no longer needed, which the with statement does; the other processes only
+close their views. Before Python 3.13, a process attaching to a segment
+registers it in the resource tracker of multiprocessing as well, so the
+segment should be used by processes started by multiprocessing from the
+owner, which share its tracker.
+
+This module needs multiprocessing.shared_memory, i.e. Python 3.8 or newer,
+so it isn't imported by the package.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from operator import ne
+from struct import pack
+from struct import unpack_from
+
+from intpy.errors import EmptyIntervalError
+from intpy.ireal import IReal
+from intpy.ireal import IRealArray
+from intpy.ireal.ireal import _from_limits
+from intpy.support import NaN
+
+
+__all__ = [
+    "SharedIRealArray"
+]
+
+
+# The states of the elements
+_DEFINED, _UNDEFINED, _EMPTY = 0, 1, 2
+
+# The size of the header holding the length
+_HEADER = 8
+
+
+def _attach(name):
+    """Attaches to the array in the segment 'name', as unpickling does"""
+    return SharedIRealArray.attach(name)
+
+
+class SharedIRealArray(object):
+    """An array of Real Intervals in a shared memory segment
+
+    The elements are kept in the buffers given by the inf, sup and state
+    properties, as memoryviews of the segment, and are read and written as
+    IReals by indexing. Unlike IRealArray, it can hold empty intervals. The
+    arrays are built by the constructor, which copies the given intervals to
+    a new segment owned by the calling process, or by attach(), which views
+    an existing segment. Some examples:
+
+    >>> x = SharedIRealArray([IReal(1, 2), IReal(), "undefined"])
+    >>> y = SharedIRealArray.attach(x.name)
+    >>> y[0]; y[1]; y[2]; len(y)
+    [1.0, 2.0]
+    empty interval
+    undefined interval
+    3
+    >>> y[1] = IReal(-1, 0); x[1]
+    [-1.0, 0.0]
+    >>> x.owner, y.owner
+    (True, False)
+    >>> y.close(); x.close(); x.unlink()
+    >>> x[0] # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError:...
+    """
+
+    def __init__(self, intervals=()):
+        """Constructor of the SharedIRealArray class
+
+        The intervals are anything accepted by the IRealArray constructor, or
+        an IRealArray, whose buffers are copied at once. Some examples:
+
+        >>> with SharedIRealArray(IRealArray([1, IReal(2, 3)])) as x:
+        ...     list(x)
+        [[1.0, 1.0], [2.0, 3.0]]
+        >>> with SharedIRealArray() as x:
+        ...     len(x)
+        0
+        """
+        if type(intervals) != IRealArray:
+            intervals = list(intervals)
+        size = len(intervals)
+        self._open(SharedMemory(create=True, size=_HEADER + 17 * size),
+            size, True)
+        self._memory.buf[:_HEADER] = pack("<q", size)
+        if type(intervals) == IRealArray:
+            self._inf[:] = intervals.inf
+            self._sup[:] = intervals.sup
+            self._state[:] = bytes(map(ne, intervals.inf, intervals.inf))
+        else:
+            for i, interval in enumerate(intervals):
+                self[i] = interval
+
+    def attach(name):
+        """Builds a view of the array in the segment 'name'
+
+        Some examples:
+
+        >>> import pickle
+        >>> with SharedIRealArray([IReal(1, 2)]) as x:
+        ...     y = pickle.loads(pickle.dumps(x))
+        ...     y.name == x.name, y.owner, y[0]
+        ...     y.close()
+        (True, False, [1.0, 2.0])
+        """
+        try:
+            memory = SharedMemory(name=name, track=False)
+        except TypeError:
+            memory = SharedMemory(name=name)
+        ret = SharedIRealArray.__new__(SharedIRealArray)
+        ret._open(memory, unpack_from("<q", memory.buf)[0], False)
+        return ret
+
+    attach = staticmethod(attach)
+
+    def _open(self, memory, size, owner):
+        """Sets the views of the buffers of a segment"""
+        self._memory, self._size, self._owner = memory, size, owner
+        self._closed = False
+        buf = memory.buf
+        self._inf = buf[_HEADER:_HEADER + 8 * size].cast("d")
+        self._sup = buf[_HEADER + 8 * size:_HEADER + 16 * size].cast("d")
+        self._state = buf[_HEADER + 16 * size:_HEADER + 17 * size]
+
+    name = property(fget=lambda self: self._memory.name)
+    owner = property(fget=lambda self: self._owner)
+    inf = property(fget=lambda self: self._inf)
+    sup = property(fget=lambda self: self._sup)
+    state = property(fget=lambda self: self._state)
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        state = self._state[index]
+        if state == _EMPTY:
+            return IReal()
+        return _from_limits(self._inf[index], self._sup[index])
+
+    def __setitem__(self, index, value):
+        if type(value) != IReal:
+            value = IReal(value)
+        if value.empty:
+            self._inf[index] = self._sup[index] = NaN
+            self._state[index] = _EMPTY
+        else:
+            self._inf[index], self._sup[index] = value.inf, value.sup
+            self._state[index] = _UNDEFINED if value.undefined else _DEFINED
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self[i]
+
+    def __reduce__(self):
+        return (_attach, (self.name,))
+
+    def __repr__(self):
+        return "SharedIRealArray([%s])" % ", ".join([repr(x) for x in self])
+
+    def to_array(self):
+        """Copies the elements to an IRealArray
+
+        Some examples:
+
+        >>> with SharedIRealArray([IReal(1, 2), "undefined"]) as x:
+        ...     x.to_array()
+        IRealArray([[1.0, 2.0], undefined interval])
+        >>> with SharedIRealArray([IReal()]) as x:
+        ...     x.to_array() # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        EmptyIntervalError:...
+        """
+        if _EMPTY in self._state:
+            raise EmptyIntervalError("arrays can't hold empty intervals")
+        inf, sup = array("d"), array("d")
+        inf.frombytes(self._inf.tobytes())
+        sup.frombytes(self._sup.tobytes())
+        return IRealArray.from_limits(inf, sup)
+
+    def close(self):
+        """Closes the views of the segment, which is kept for the others
+
+        The memoryviews given by the inf, sup and state properties are
+        released, and so must be any other view of them. It can be called
+        more than once.
+        """
+        if self._closed:
+            return
+        for view in (self._inf, self._sup, self._state):
+            view.release()
+        self._memory.close()
+        self._closed = True
+
+    def unlink(self):
+        """Destroys the segment, as its owner, once it's closed everywhere
+
+        Some examples:
+
+        >>> x = SharedIRealArray([1]); y = SharedIRealArray.attach(x.name)
+        >>> y.unlink() # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        >>> y.close(); x.close(); x.unlink()
+        """
+        if not self._owner:
+            raise ValueError("only the owner can unlink the segment")
+        self.close()
+        self._memory.unlink()
+        self._owner = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __del__(self):
+        if not getattr(self, "_closed", True):
+            self.close()
+
+
+def _hull(intervals):
+    """Returns the hull of the infimums and supremums, as a worker job"""
+    return (min(x.inf for x in intervals), max(x.sup for x in intervals))
+
+
+def _shared_hull(x):
+    """Returns the hull of the buffers of a shared array, as a worker job"""
+    ret = (min(x.inf), max(x.sup))
+    x.close()
+    return ret
+
+
+def _benchmark(n=1000000, workers=2):
+    """Reports the time of sending intervals to workers of a process pool"""
+    import pickle
+    from multiprocessing import Pool
+    from random import random
+    from time import time
+    intervals = []
+    for i in range(n):
+        x = random()
+        intervals.append(IReal(x, x + random()))
+    x = IRealArray(intervals)
+    results = []
+    start = time()
+    data = pickle.dumps(intervals, pickle.HIGHEST_PROTOCOL)
+    pickle.loads(data)
+    results.append(("pickle list of IReals", time() - start, len(data)))
+    start = time()
+    data = pickle.dumps(x, pickle.HIGHEST_PROTOCOL)
+    pickle.loads(data)
+    results.append(("pickle IRealArray", time() - start, len(data)))
+    with SharedIRealArray(x) as shared:
+        start = time()
+        data = pickle.dumps(shared, pickle.HIGHEST_PROTOCOL)
+        pickle.loads(data).close()
+        results.append(("pickle SharedIRealArray", time() - start,
+            len(data)))
+    pool = Pool(workers)
+    try:
+        pool.apply(_hull, ([IReal(0)],))
+        start = time()
+        pool.apply(_hull, (intervals,))
+        results.append(("pool job, list", time() - start, None))
+        start = time()
+        with SharedIRealArray(x) as shared:
+            pool.apply(_shared_hull, (shared,))
+        results.append(("pool job, shared", time() - start, None))
+    finally:
+        pool.close()
+        pool.join()
+    for name, elapsed, size in results:
+        print("%-24s %8.4f s %s" % (name, elapsed, "" if size is None else
+            "%12d bytes" % size))
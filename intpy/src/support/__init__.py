@@ -28,5 +28,6 @@ It was developed in CIn/UFPE (Brazil) by Rafael Menezes Barreto
 
 
 from intpy.support import rounding
+from intpy.support import backend
 from intpy.support import stdfunc
 from intpy.support.general import *
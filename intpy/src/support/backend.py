@@ -0,0 +1,452 @@
+# support/backend.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Directed rounding backends module
+
+The limits of the intervals are computed with directed rounding, which can be
+obtained in more than one way. This module provides the elementary operations
+rounded downwards and upwards by three backends:
+
+    "switching": sets the rounding mode to each direction in turn with the
+        rounding extension, i.e. with fesetround;
+    "negation": sets the rounding mode upwards only and rounds downwards by
+        negating, as in down(a + b) = -up(-a - b);
+    "software": keeps rounding to the nearest and moves a result to the next
+        float outwards when its error-free transformation shows it's inexact.
+
+The rounding mode may be silently ignored, e.g. in builds with fast math or
+using the x87 unit with extended precision, so each backend is verified on
+operations with known correctly rounded results before it's used. The
+self-test runs once per process, at import, and the fastest verified backend
+becomes the active one, unless the environment variable
+INTPY_ROUNDING_BACKEND names another one.
+
+The kernels add, sub, mul and div take the operands of both limits and return
+the pair (down(a op b), up(c op d)); sqrt(a, b) returns (down(sqrt(a)),
+up(sqrt(b))). The IReal operators are computed by the active backend, while
+the array kernels set the rounding mode directly, so a warning is given when
+the "switching" backend fails.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+import math
+import os
+import warnings
+from fractions import Fraction
+from time import time
+
+from intpy.support import rounding
+from intpy.support.general import fraction2floats
+from intpy.support.general import nextafter
+
+
+__all__ = [
+    "active_backend",
+    "self_test",
+    "use_backend"
+]
+
+
+_POS_INF = float("1e1000")
+
+# Veltkamp's constant splitting a double in two halves of 26 bits
+_SPLITTER = 134217729.0
+
+
+def _switching_add(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(-1)
+    inf = a + b
+    rounding.set_mode(1)
+    sup = c + d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _switching_sub(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(-1)
+    inf = a - b
+    rounding.set_mode(1)
+    sup = c - d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _switching_mul(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(-1)
+    inf = a * b
+    rounding.set_mode(1)
+    sup = c * d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _switching_div(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(-1)
+    inf = a / b
+    rounding.set_mode(1)
+    sup = c / d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _switching_sqrt(a, b):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(-1)
+    inf = math.sqrt(a)
+    rounding.set_mode(1)
+    sup = math.sqrt(b)
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+# The negated results are subtracted from zero rather than negated, so exact
+# zeros are +0.0 as with rounding to the nearest
+
+def _negation_add(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(1)
+    inf = 0.0 - (-a - b)
+    sup = c + d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _negation_sub(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(1)
+    inf = 0.0 - (b - a)
+    sup = c - d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _negation_mul(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(1)
+    inf = 0.0 - (-a * b)
+    sup = c * d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _negation_div(a, b, c, d):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(1)
+    inf = 0.0 - (-a / b)
+    sup = c / d
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _negation_sqrt(a, b):
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(1)
+    inf = math.sqrt(a)
+    # The square rounded upwards isn't below the exact one
+    if not inf * inf <= a:
+        inf = nextafter(inf, -_POS_INF)
+    sup = math.sqrt(b)
+    rounding.set_mode(rounding_mode_backup)
+    return (inf, sup)
+
+
+def _product_error(a, b, p):
+    """Returns the error a*b - p of a product, exact for the normalized
+    mantissas of the factors of Dekker's TwoProduct"""
+    a_hi = _SPLITTER * a
+    a_hi = a_hi - (a_hi - a)
+    b_hi = _SPLITTER * b
+    b_hi = b_hi - (b_hi - b)
+    return (a - a_hi) * (b - b_hi) - (((p - a_hi * b_hi) - (a - a_hi) * \
+        b_hi) - a_hi * (b - b_hi))
+
+
+def _sum_sign(a, b, s):
+    """Returns a float with the sign of a + b - s, for s = a + b rounded to
+    the nearest, by Knuth's TwoSum"""
+    b_virtual = s - a
+    ret = (a - (s - b_virtual)) + (b - b_virtual)
+    if ret != ret:
+        # Infinite operands are exact and infinite results of finite ones
+        # overflowed
+        if a - a != 0.0 or b - b != 0.0:
+            return 0.0
+        return -s
+    return ret
+
+
+def _mul_sign(a, b, p):
+    """Returns a float with the sign of a*b - p, for p = a*b rounded to the
+    nearest
+
+    The factors are scaled to their mantissas first, so neither the
+    splitting overflows nor the error underflows.
+    """
+    a, a_exponent = math.frexp(a)
+    b, b_exponent = math.frexp(b)
+    q = a * b
+    ret = (q - math.ldexp(p, -a_exponent - b_exponent)) + \
+        _product_error(a, b, q)
+    return 0.0 if ret != ret else ret
+
+
+def _div_sign(a, b, q):
+    """Returns a float with the sign of a/b - q, for q = a/b rounded to the
+    nearest"""
+    if q - q != 0.0:
+        # An infinite quotient of finite operands overflowed
+        return -q if a - a == 0.0 and b - b == 0.0 else 0.0
+    a, a_exponent = math.frexp(a)
+    b, b_exponent = math.frexp(b)
+    q = math.ldexp(q, b_exponent - a_exponent)
+    p = q * b
+    ret = ((a - p) - _product_error(q, b, p)) * b
+    return 0.0 if ret != ret else ret
+
+
+def _sqrt_sign(a, s):
+    """Returns a float with the sign of sqrt(a) - s, for s = sqrt(a) rounded
+    to the nearest"""
+    m, exponent = math.frexp(a)
+    if exponent % 2:
+        m, exponent = 2.0 * m, exponent - 1
+    s = math.ldexp(s, -exponent // 2)
+    p = s * s
+    ret = (m - p) - _product_error(s, s, p)
+    return 0.0 if ret != ret else ret
+
+
+def _below(value, sign):
+    return nextafter(value, -_POS_INF) if sign < 0.0 else value
+
+
+def _above(value, sign):
+    return nextafter(value, _POS_INF) if sign > 0.0 else value
+
+
+def _software_add(a, b, c, d):
+    inf, sup = a + b, c + d
+    return (_below(inf, _sum_sign(a, b, inf)), _above(sup, _sum_sign(c, d,
+        sup)))
+
+
+def _software_sub(a, b, c, d):
+    inf, sup = a - b, c - d
+    return (_below(inf, _sum_sign(a, -b, inf)), _above(sup, _sum_sign(c, -d,
+        sup)))
+
+
+def _software_mul(a, b, c, d):
+    inf, sup = a * b, c * d
+    return (_below(inf, _mul_sign(a, b, inf)), _above(sup, _mul_sign(c, d,
+        sup)))
+
+
+def _software_div(a, b, c, d):
+    inf, sup = a / b, c / d
+    return (_below(inf, _div_sign(a, b, inf)), _above(sup, _div_sign(c, d,
+        sup)))
+
+
+def _software_sqrt(a, b):
+    inf, sup = math.sqrt(a), math.sqrt(b)
+    return (_below(inf, _sqrt_sign(a, inf)), _above(sup, _sqrt_sign(b, sup)))
+
+
+_BACKENDS = {
+    "switching": (_switching_add, _switching_sub, _switching_mul,
+        _switching_div, _switching_sqrt),
+    "negation": (_negation_add, _negation_sub, _negation_mul, _negation_div,
+        _negation_sqrt),
+    "software": (_software_add, _software_sub, _software_mul, _software_div,
+        _software_sqrt)
+}
+
+# From the cheapest to the most expensive, which breaks ties
+_CANDIDATES = ("negation", "switching", "software")
+
+# Operands whose exact results have known enclosures: additions and
+# multiplications with tiny parts lost, overflows and underflows
+_CASES = {
+    "add": [(1.0, 2.0 ** -60), (-1.0, -(2.0 ** -60)), (0.1, 0.2),
+        (1e308, 1e308), (1.0, -1.0)],
+    "sub": [(1.0, 2.0 ** -60), (0.3, 0.1), (-1e308, 1e308), (0.5, 0.5)],
+    "mul": [(1.0 + 2.0 ** -52, 1.0 + 2.0 ** -52), (0.1, -0.1),
+        (1e200, 1e200), (1e-200, -1e-200), (3.0, 0.5)],
+    "div": [(1.0, 3.0), (-2.0, 3.0), (1.0, 1e-310), (1e-300, -1e100),
+        (6.0, 3.0)],
+    "sqrt": [2.0, 0.25, 1e-300, 3.0]
+}
+
+
+def _verify(name):
+    """Returns the names of the operations failing for a backend
+
+    Some examples:
+
+    >>> _verify("software")
+    []
+    """
+    add, sub, mul, div, sqrt = _BACKENDS[name]
+    exact = {
+        "add": (add, lambda a, b: Fraction(a) + Fraction(b)),
+        "sub": (sub, lambda a, b: Fraction(a) - Fraction(b)),
+        "mul": (mul, lambda a, b: Fraction(a) * Fraction(b)),
+        "div": (div, lambda a, b: Fraction(a) / Fraction(b))
+    }
+    failed = []
+    rounding_mode_backup = rounding.get_mode()
+    rounding.set_mode(0)
+    try:
+        for operation in sorted(exact):
+            kernel, reference = exact[operation]
+            for a, b in _CASES[operation]:
+                if kernel(a, b, a, b) != fraction2floats(reference(a, b)):
+                    failed.append(operation)
+                    break
+        for a in _CASES["sqrt"]:
+            inf, sup = sqrt(a, a)
+            # The limits must be consecutive floats enclosing the root
+            if not (Fraction(inf) ** 2 <= Fraction(a) <= Fraction(sup) ** 2
+                and sup in (inf, nextafter(inf, _POS_INF)) and (inf < sup) \
+                == (Fraction(inf) ** 2 < Fraction(a))):
+                failed.append("sqrt")
+                break
+        if rounding.get_mode() != rounding_mode_backup:
+            failed.append("restore")
+    finally:
+        rounding.set_mode(rounding_mode_backup)
+    return failed
+
+
+_self_test_results = None
+
+
+def self_test():
+    """Verifies all the backends, once per process
+
+    It returns a dictionary from the names of the backends to the lists of
+    the operations they failed, empty for the verified ones. Some examples:
+
+    >>> self_test()["software"]
+    []
+    >>> sorted(self_test())
+    ['negation', 'software', 'switching']
+    """
+    global _self_test_results
+    if _self_test_results is None:
+        _self_test_results = dict([(name, _verify(name)) for name in \
+            _BACKENDS])
+    return dict(_self_test_results)
+
+
+def _time(name, n=200):
+    """Times a backend on a few operations of each kind"""
+    add, sub, mul, div = _BACKENDS[name][:4]
+    a, b = 0.1, 0.3
+    start = time()
+    for i in range(n):
+        add(a, b, a, b)
+        mul(a, b, a, b)
+        div(a, b, a, b)
+    return time() - start
+
+
+def _choose():
+    """Returns the name of the backend to be used in this process"""
+    results = self_test()
+    if results["switching"]:
+        warnings.warn("the rounding mode can't be switched reliably (%s "
+            "failed), so the results of the kernels setting it directly may "
+            "be wrong" % ", ".join(results["switching"]), RuntimeWarning)
+    forced = os.environ.get("INTPY_ROUNDING_BACKEND")
+    if forced:
+        if forced in _BACKENDS and not results[forced]:
+            return forced
+        warnings.warn("the rounding backend %r in INTPY_ROUNDING_BACKEND "
+            "is unknown or failed the self-test" % (forced,), RuntimeWarning)
+    verified = [name for name in _CANDIDATES if not results[name]]
+    if not verified:
+        warnings.warn("no rounding backend passed the self-test, the "
+            "software one is used anyway", RuntimeWarning)
+        return "software"
+    timings = [(_time(name), k, name) for k, name in enumerate(verified)]
+    return min(timings)[2]
+
+
+def use_backend(name):
+    """Makes a verified backend the active one
+
+    Some examples:
+
+    >>> backend_backup = active_backend()
+    >>> use_backend("software"); active_backend()
+    'software'
+    >>> sqrt(2.0, 2.0)
+    (1.414213562373095, 1.4142135623730951)
+    >>> use_backend("nonsense") # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError:...
+    >>> use_backend(backend_backup)
+    """
+    global _active, add, sub, mul, div, sqrt
+    if name not in _BACKENDS:
+        raise ValueError("unknown rounding backend %r" % (name,))
+    failed = self_test()[name]
+    if failed:
+        raise ValueError("the %s rounding backend failed the self-test for "
+            "%s" % (name, ", ".join(failed)))
+    add, sub, mul, div, sqrt = _BACKENDS[name]
+    _active = name
+
+
+def active_backend():
+    """Returns the name of the active backend
+
+    Some examples:
+
+    >>> active_backend() in ("switching", "negation", "software")
+    True
+    """
+    return _active
+
+
+_active = None
+add, sub, mul, div, sqrt = _BACKENDS["software"]
+use_backend(_choose())
+
+
+def _benchmark(n=100000):
+    """Reports the time of each verified backend and the active one"""
+    results = self_test()
+    for name in _CANDIDATES:
+        if results[name]:
+            print("%-10s failed: %s" % (name, ", ".join(results[name])))
+        else:
+            elapsed = _time(name, n)
+            print("%-10s %8.3f us/operation%s" % (name, elapsed / (3 * n) * \
+                1e6, " (active)" if name == _active else ""))
@@ -30,15 +30,28 @@ it's free software.
 
 
 import re
+import struct
+from fractions import Fraction
 
 from intpy.errors import InvalidRationalNumberError
 
 
 __all__ = [
+    "NaN",
+    "NegInf",
+    "PosInf",
+    "fraction2floats",
     "isnan",
+    "nextafter",
     "rational2fraction"
 ]
 
+# IEEE 754 special values, as in fpconst, which is only available for
+# Python 2; float accepts their names since Python 2.6
+NaN = float("nan")
+PosInf = float("inf")
+NegInf = -PosInf
+
 # prefered instead of isNaN from fpconst because of performance
 isnan = lambda number: number != number
 
@@ -61,6 +74,68 @@ _rational_number_pattern = re.compile(r"""
 )
 
 
+def nextafter(x, y):
+    """Returns the next float after 'x' in the direction of 'y'
+
+    It works on the bits of the IEEE 754 double, so it doesn't depend on the
+    rounding mode. Some examples:
+
+    >>> nextafter(1.0, 2.0) - 1.0 == 2.0 ** -52
+    True
+    >>> nextafter(-1.0, 0.0) > -1.0
+    True
+    >>> nextafter(0.0, -1.0)
+    -5e-324
+    >>> nextafter(2.0, 2.0)
+    2.0
+    """
+    if x != x or y != y:
+        return x + y
+    if x == y:
+        return y
+    if x == 0.0:
+        return 5e-324 if y > 0.0 else -5e-324
+    bits = struct.unpack("<q", struct.pack("<d", x))[0]
+    # The integer order of the bits follows the magnitude of the float
+    if (y > x) == (x > 0.0):
+        bits += 1
+    else:
+        bits -= 1
+    return struct.unpack("<d", struct.pack("<q", bits))[0]
+
+
+_MAX_FLOAT = 1.7976931348623157e+308
+
+
+def fraction2floats(value):
+    """Encloses a fraction by the nearest floats below and above it
+
+    The fraction is rounded once, to the nearest, and compared exactly with
+    the float obtained, so it doesn't depend on the rounding mode. Beyond the
+    range of the floats the enclosure is up to the infinity. Some examples:
+
+    >>> fraction2floats(Fraction(1, 4))
+    (0.25, 0.25)
+    >>> x = fraction2floats(Fraction(1, 10)); x[0] < Fraction(1, 10) < x[1]
+    True
+    >>> fraction2floats(Fraction(10 ** 16 + 1, 10 ** 16))
+    (1.0, 1.0000000000000002)
+    >>> fraction2floats(-Fraction(10) ** 400)
+    (-inf, -1.7976931348623157e+308)
+    """
+    try:
+        nearest = float(value)
+    except OverflowError:
+        if value > 0:
+            return (_MAX_FLOAT, PosInf)
+        return (NegInf, -_MAX_FLOAT)
+    if Fraction(nearest) < value:
+        return (nearest, nextafter(nearest, PosInf))
+    if Fraction(nearest) > value:
+        return (nextafter(nearest, NegInf), nearest)
+    return (nearest, nearest)
+
+
 def _mdc(a, b):
     while a % b != 0:
         a, b = b, a % b
@@ -83,11 +158,11 @@ def rational2fraction(rational):
     (200000000, 1)
     >>> rational2fraction("1/2/4")
     (2, 1)
-    >>> rational2fraction("1/0") # doctest: +ELLIPSIS
+    >>> rational2fraction("1/0") # doctest: +IGNORE_EXCEPTION_DETAIL
     Traceback (most recent call last):
     ...
     ZeroDivisionError: there's some 0 in the denominators
-    >>> rational2fraction("1/") # doctest: +ELLIPSIS
+    >>> rational2fraction("1/") # doctest: +IGNORE_EXCEPTION_DETAIL
     Traceback (most recent call last):
     ...
     InvalidRationalNumberError:...
@@ -117,5 +192,5 @@ def rational2fraction(rational):
     else:
         ret = (new_frac * 10 ** new_exponent * denominator[1], denominator[0])
     mdc_numerator_denominator = _mdc(ret[0], ret[1])
-    return (ret[0] / mdc_numerator_denominator,
-        ret[1] / mdc_numerator_denominator)
+    return (ret[0] // mdc_numerator_denominator,
+        ret[1] // mdc_numerator_denominator)
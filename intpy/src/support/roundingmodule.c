@@ -34,21 +34,35 @@
 
 #include <Python.h>
 #include <fenv.h>
+#include <float.h>
+#include <math.h>
 
 
-static PyObject * rounding_get_mode(PyObject * self, PyObject * args) {
-    if (!PyArg_ParseTuple(args, "")) {
-        return NULL;
-    }
-    return Py_BuildValue("i", fegetround());
+/*
+ * The functions of the rounding mode take no arguments or a single one
+ * (METH_NOARGS and METH_O), so no tuple of arguments is built and parsed at
+ * each call.
+ */
+
+#if PY_MAJOR_VERSION >= 3
+#define INT_FROM_LONG PyLong_FromLong
+#define INT_AS_LONG PyLong_AsLong
+#else
+#define INT_FROM_LONG PyInt_FromLong
+#define INT_AS_LONG PyInt_AsLong
+#endif
+
+
+static PyObject * rounding_get_mode(PyObject * self, PyObject * unused) {
+    return INT_FROM_LONG(fegetround());
 }
 
-static PyObject * rounding_set_mode(PyObject * self, PyObject * args) {
-    int mode;
-    if (!PyArg_ParseTuple(args, "i", &mode)) {
+static PyObject * rounding_set_mode(PyObject * self, PyObject * arg) {
+    long mode = INT_AS_LONG(arg);
+    int return_val;
+    if (mode == -1 && PyErr_Occurred()) {
         return NULL;
     }
-    int return_val = 1;
     if (mode == -1) {
         return_val = fesetround(FE_DOWNWARD);
     } else if (mode == 0) {
@@ -56,33 +70,291 @@ static PyObject * rounding_set_mode(PyObject * self, PyObject * args) {
     } else if (mode == 1) {
         return_val = fesetround(FE_UPWARD);
     } else {
-        return_val = fesetround(mode);
+        return_val = fesetround((int) mode);
+    }
+    return INT_FROM_LONG(return_val);
+}
+
+
+/*
+ * Exact dot products, rounded downwards and upwards
+ *
+ * Each product x*y is split by fma into the rounded product and its exact
+ * error, and the terms are added without error into non-overlapping partial
+ * sums, as in math.fsum (Shewchuk's algorithm). The largest partials rounded
+ * to the nearest give a float within an ulp of the exact sum, and the first
+ * non-zero error of that rounding has the sign of the remainder, which tells
+ * the directed roundings. The splitting is exact only if no product
+ * underflows or overflows, otherwise the function gives None and the caller
+ * computes the dot product with fractions.
+ */
+
+/* Below 2**-969 the error of a product may be lost in the subnormal range */
+#define DOT_MIN_PRODUCT (DBL_MIN * 9007199254740992.0)
+
+typedef struct {
+    double *items;
+    Py_ssize_t count, size;
+} partials_t;
+
+static int partials_add(partials_t *partials, double x) {
+    Py_ssize_t i, j = 0;
+    double y, hi, lo, t;
+    for (i = 0; i < partials->count; i++) {
+        y = partials->items[i];
+        if (fabs(x) < fabs(y)) {
+            t = x;
+            x = y;
+            y = t;
+        }
+        hi = x + y;
+        lo = y - (hi - x);
+        if (lo != 0.0) {
+            partials->items[j++] = lo;
+        }
+        x = hi;
+    }
+    if (j >= partials->size) {
+        double *items = PyMem_Realloc(partials->items,
+            2 * partials->size * sizeof(double));
+        if (items == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        partials->items = items;
+        partials->size *= 2;
+    }
+    partials->items[j++] = x;
+    partials->count = j;
+    return 0;
+}
+
+/* Adds x*y exactly, returning 1 if it can't be split exactly */
+static int partials_add_product(partials_t *partials, double x, double y) {
+    double p = x * y;
+    if (!isfinite(p) || (fabs(p) < DOT_MIN_PRODUCT && x != 0.0 &&
+            y != 0.0)) {
+        return 1;
     }
-    return Py_BuildValue("i", return_val);
+    if (partials_add(partials, p) < 0 ||
+            partials_add(partials, fma(x, y, -p)) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+/* Rounds the sum of the partials downwards and upwards, 1 on overflow */
+static int partials_round(partials_t *partials, double *down, double *up) {
+    Py_ssize_t n = partials->count;
+    double hi = 0.0, lo = 0.0, x, y;
+    while (n > 0) {
+        if (!isfinite(partials->items[--n])) {
+            return 1;
+        }
+    }
+    n = partials->count;
+    if (n > 0) {
+        hi = partials->items[--n];
+        while (n > 0) {
+            x = hi;
+            y = partials->items[--n];
+            hi = x + y;
+            lo = y - (hi - x);
+            if (lo != 0.0) {
+                break;
+            }
+        }
+    }
+    if (!isfinite(hi)) {
+        return 1;
+    }
+    *down = lo < 0.0 ? nextafter(hi, -HUGE_VAL) : hi;
+    *up = lo > 0.0 ? nextafter(hi, HUGE_VAL) : hi;
+    return 0;
+}
+
+/* The endpoints whose products bound [x1, y1]*[x2, y2], as IReal does */
+static int select_operands(double x1, double y1, double x2, double y2,
+    double *operands)
+{
+    double a[4];
+    if (x1 >= 0.0) {
+        if (x2 >= 0.0) {
+            a[0] = x1; a[1] = x2; a[2] = y1; a[3] = y2;
+        } else if (y2 <= 0.0) {
+            a[0] = y1; a[1] = x2; a[2] = x1; a[3] = y2;
+        } else {
+            a[0] = y1; a[1] = x2; a[2] = y1; a[3] = y2;
+        }
+    } else if (y1 <= 0.0) {
+        if (x2 >= 0.0) {
+            a[0] = x1; a[1] = y2; a[2] = y1; a[3] = x2;
+        } else if (y2 <= 0.0) {
+            a[0] = y1; a[1] = y2; a[2] = x1; a[3] = x2;
+        } else {
+            a[0] = x1; a[1] = y2; a[2] = x1; a[3] = x2;
+        }
+    } else if (x2 >= 0.0) {
+        a[0] = x1; a[1] = y2; a[2] = y1; a[3] = y2;
+    } else if (y2 <= 0.0) {
+        a[0] = y1; a[1] = x2; a[2] = x1; a[3] = x2;
+    } else {
+        /* Both contain zero in their interiors, the exact products decide,
+           and the rounded ones tie only if their errors decide */
+        double p1 = x1 * y2, p2 = y1 * x2;
+        if (!isfinite(p1) || !isfinite(p2)) {
+            return 1;
+        }
+        if (p1 < p2 || (p1 == p2 && fma(x1, y2, -p1) < fma(y1, x2, -p2))) {
+            a[0] = x1; a[1] = y2;
+        } else {
+            a[0] = y1; a[1] = x2;
+        }
+        p1 = x1 * x2;
+        p2 = y1 * y2;
+        if (!isfinite(p1) || !isfinite(p2)) {
+            return 1;
+        }
+        if (p1 > p2 || (p1 == p2 && fma(x1, x2, -p1) > fma(y1, y2, -p2))) {
+            a[2] = x1; a[3] = x2;
+        } else {
+            a[2] = y1; a[3] = y2;
+        }
+    }
+    memcpy(operands, a, sizeof(a));
+    return 0;
+}
+
+static PyObject * rounding_dot(PyObject * self, PyObject * args) {
+    PyObject *sequences[4], *fast[4] = {NULL, NULL, NULL, NULL};
+    PyObject *ret = NULL;
+    partials_t lower = {NULL, 0, 32}, upper = {NULL, 0, 32};
+    double operands[4], limits[4], down, up, unused;
+    Py_ssize_t n, i;
+    int k, status = 0, points, mode = fegetround();
+    if (!PyArg_ParseTuple(args, "OOOO:dot", &sequences[0], &sequences[1],
+            &sequences[2], &sequences[3])) {
+        return NULL;
+    }
+    points = sequences[0] == sequences[1] && sequences[2] == sequences[3];
+    for (k = 0; k < 4; k++) {
+        fast[k] = PySequence_Fast(sequences[k], "dot takes sequences");
+        if (fast[k] == NULL) {
+            goto done;
+        }
+    }
+    n = PySequence_Fast_GET_SIZE(fast[0]);
+    for (k = 1; k < 4; k++) {
+        if (PySequence_Fast_GET_SIZE(fast[k]) != n) {
+            PyErr_SetString(PyExc_ValueError,
+                "sequences of different lengths can't be operated");
+            goto done;
+        }
+    }
+    lower.items = PyMem_Malloc(lower.size * sizeof(double));
+    upper.items = PyMem_Malloc(upper.size * sizeof(double));
+    if (lower.items == NULL || upper.items == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    fesetround(FE_TONEAREST);
+    for (i = 0; i < n && status == 0; i++) {
+        for (k = 0; k < 4; k++) {
+            limits[k] = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(fast[k],
+                i));
+        }
+        if (PyErr_Occurred()) {
+            status = -1;
+        } else if (!isfinite(limits[0]) || !isfinite(limits[1]) ||
+                !isfinite(limits[2]) || !isfinite(limits[3])) {
+            status = 1;
+        } else if (points) {
+            status = partials_add_product(&lower, limits[0], limits[2]);
+        } else {
+            status = select_operands(limits[0], limits[1], limits[2],
+                limits[3], operands);
+            if (status == 0) {
+                status = partials_add_product(&lower, operands[0],
+                    operands[1]);
+            }
+            if (status == 0) {
+                status = partials_add_product(&upper, operands[2],
+                    operands[3]);
+            }
+        }
+    }
+    if (status == 0) {
+        status = partials_round(&lower, &down, points ? &up : &unused);
+    }
+    if (status == 0 && !points) {
+        status = partials_round(&upper, &unused, &up);
+    }
+    fesetround(mode);
+    if (status < 0) {
+        goto done;
+    }
+    if (status > 0) {
+        Py_INCREF(Py_None);
+        ret = Py_None;
+    } else {
+        ret = Py_BuildValue("(dd)", down, up);
+    }
+done:
+    for (k = 0; k < 4; k++) {
+        Py_XDECREF(fast[k]);
+    }
+    PyMem_Free(lower.items);
+    PyMem_Free(upper.items);
+    return ret;
 }
 
 
 static PyMethodDef rounding_functions[] = {
-    {"get_mode", rounding_get_mode, METH_VARARGS,
+    {"get_mode", rounding_get_mode, METH_NOARGS,
         "Returns the current rounding mode"
     },
-    {"set_mode", rounding_set_mode, METH_VARARGS,
+    {"set_mode", rounding_set_mode, METH_O,
         "Sets the rounding mode and returns 0 if it's OK or 1 if an error"
         " ocurred"
     },
+    {"dot", rounding_dot, METH_VARARGS,
+        "dot(inf1, sup1, inf2, sup2) rounds the exact lower and upper bounds"
+        " of the\ndot product of two sequences of intervals downwards and"
+        " upwards, None if\nsome product underflows or overflows"
+    },
     {0}
 };
 
 
-PyMODINIT_FUNC initrounding() {
-    char * __doc__ =
-        "Module to control the floating point rounding\n\n"
+static char rounding_doc[] =
+    "Module to control the floating point rounding\n\n"
+
+    "With this module it's possible to control how floating point"
+    " roundings are done\nby the system.\n\n"
+
+    "It was developed in CIn/UFPE (Brazil) by Rafael Menezes Barreto\n"
+    "<rmb3@cin.ufpe.br, rafaelbarreto87@gmail.com> as part of the IntPy"
+    " package and\nit's free software.";
+
 
-        "With this module it's possible to control how floating point"
-        " roundings are done\nby the system.\n\n"
+#if PY_MAJOR_VERSION >= 3
 
-        "It was developed in CIn/UFPE (Brazil) by Rafael Menezes Barreto\n"
-        "<rmb3@cin.ufpe.br, rafaelbarreto87@gmail.com> as part of the IntPy"
-        " package and\nit's free software.";
-    Py_InitModule3("rounding", rounding_functions, __doc__);
+static struct PyModuleDef rounding_module = {
+    PyModuleDef_HEAD_INIT,
+    "rounding",
+    rounding_doc,
+    -1,
+    rounding_functions
+};
+
+PyMODINIT_FUNC PyInit_rounding(void) {
+    return PyModule_Create(&rounding_module);
+}
+
+#else
+
+PyMODINIT_FUNC initrounding(void) {
+    Py_InitModule3("rounding", rounding_functions, rounding_doc);
 }
+
+#endif
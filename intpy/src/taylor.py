@@ -0,0 +1,185 @@
+# taylor.py
+#
+# Copyright 2026 The IntPy contributors
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License version 2
+# as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301, USA.
+
+
+"""Taylor series arithmetic module
+
+Provides truncated Taylor series whose coefficients are intervals. Evaluating a
+function written with the usual operators on them gives enclosures of the
+Taylor coefficients of the function, i.e. of its normalized derivatives, which
+is the base of the validated methods built on IReal.
+
+It was developed by the IntPy contributors as part of the IntPy package and
+it's free software.
+"""
+
+
+from intpy.ireal import IReal
+
+
+__all__ = [
+    "Taylor"
+]
+
+
+class Taylor(object):
+    """A truncated Taylor series with interval coefficients
+
+    The series is kept as the list of its first coefficients and all the
+    operations are truncated at that length. The coefficients are usually
+    IReals, but anything with the interval operators can be used, as long as
+    all the coefficients of the series involved in an operation have the same
+    type. Numbers and IReals are taken as constant series.
+    """
+
+    def __init__(self, coeffs):
+        """Constructor of the Taylor class
+
+        Some examples:
+
+        >>> Taylor([IReal(1), IReal(2)])
+        Taylor([[1.0, 1.0], [2.0, 2.0]])
+        >>> Taylor([]) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        ValueError:...
+        """
+        if not len(coeffs):
+            raise ValueError("a Taylor series needs at least one coefficient")
+        self._coeffs = list(coeffs)
+
+    def variable(x, order):
+        """Builds the series of the independent variable around 'x'
+
+        Some examples:
+
+        >>> Taylor.variable(IReal(2, 3), 3)
+        Taylor([[2.0, 3.0], [1.0, 1.0], [0.0, 0.0], [0.0, 0.0]])
+        """
+        if type(x) != IReal:
+            x = IReal(x)
+        return Taylor([x, IReal(1)] + [IReal(0)] * (order - 1))
+
+    variable = staticmethod(variable)
+
+    coeffs = property(fget=lambda self: self._coeffs)
+
+    def __len__(self):
+        return len(self._coeffs)
+
+    def __getitem__(self, index):
+        return self._coeffs[index]
+
+    def __repr__(self):
+        return "Taylor([%s])" % ", ".join([repr(c) for c in self._coeffs])
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return Taylor([-c for c in self._coeffs])
+
+    def __add__(self, other):
+        """Binary plus operator
+
+        Some examples:
+
+        >>> x = Taylor.variable(1, 2)
+        >>> x + x
+        Taylor([[2.0, 2.0], [2.0, 2.0], [0.0, 0.0]])
+        >>> 1 + x
+        Taylor([[2.0, 2.0], [1.0, 1.0], [0.0, 0.0]])
+        """
+        if isinstance(other, Taylor):
+            return Taylor([a + b for a, b in zip(self._coeffs, other._coeffs)])
+        return Taylor([self._coeffs[0] + other] + self._coeffs[1:])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Binary minus operator
+
+        Some examples:
+
+        >>> x = Taylor.variable(1, 2)
+        >>> (x - Taylor.variable(3, 2))[0]
+        [-2.0, -2.0]
+        >>> (3 - x).coeffs[:2]
+        [[2.0, 2.0], [-1.0, -1.0]]
+        """
+        if isinstance(other, Taylor):
+            return Taylor([a - b for a, b in zip(self._coeffs, other._coeffs)])
+        return Taylor([self._coeffs[0] - other] + self._coeffs[1:])
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        """Multiplication operator
+
+        Some examples:
+
+        >>> x = Taylor.variable(1, 3)
+        >>> x * x
+        Taylor([[1.0, 1.0], [2.0, 2.0], [1.0, 1.0], [0.0, 0.0]])
+        >>> 2 * x
+        Taylor([[2.0, 2.0], [2.0, 2.0], [0.0, 0.0], [0.0, 0.0]])
+        """
+        if isinstance(other, Taylor):
+            a, b = self._coeffs, other._coeffs
+            coeffs = []
+            for k in range(len(a)):
+                c = a[0] * b[k]
+                for j in range(1, k + 1):
+                    c = c + a[j] * b[k-j]
+                coeffs.append(c)
+            return Taylor(coeffs)
+        return Taylor([c * other for c in self._coeffs])
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Division operator
+
+        The series of the divisor must have a first coefficient not containing
+        zero, otherwise the coefficients become undefined intervals. Some
+        examples:
+
+        >>> x = Taylor.variable(0, 3)
+        >>> 1 / (1 - x)
+        Taylor([[1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [1.0, 1.0]])
+        >>> x / 2
+        Taylor([[0.0, 0.0], [0.5, 0.5], [0.0, 0.0], [0.0, 0.0]])
+        """
+        if isinstance(other, Taylor):
+            a, b = self._coeffs, other._coeffs
+            coeffs = []
+            for k in range(len(a)):
+                c = a[k]
+                for j in range(1, k + 1):
+                    c = c - b[j] * coeffs[k-j]
+                coeffs.append(c / b[0])
+            return Taylor(coeffs)
+        return Taylor([c / other for c in self._coeffs])
+
+    def __rdiv__(self, other):
+        constant = self._coeffs[0] * 0
+        return Taylor([constant + other] + [constant] * (len(self) - 1)) / self
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__